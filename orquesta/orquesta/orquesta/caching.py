@@ -0,0 +1,152 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import copy
+import hashlib
+import json
+import logging
+import six
+import threading
+import yaml
+
+from orquesta import graphing
+from orquesta.specs import loader as spec_loader
+from orquesta.utils import plugin as plugin_util
+from orquesta.utils import specs as spec_util
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 128
+
+
+def get_cache_key(*args):
+    value = json.dumps(args, sort_keys=True, separators=(',', ':'), default=str)
+
+    if isinstance(value, six.text_type):
+        value = value.encode('utf-8')
+
+    return hashlib.sha256(value).hexdigest()
+
+
+class CompiledWorkflow(object):
+
+    def __init__(self, spec, graph):
+        self.spec = spec
+        self.graph = graph
+        self.catalog = spec.get_catalog()
+
+        # The graph is not changed once composed so the frozen graph and metadata are computed once.
+        composer = plugin_util.get_module('orquesta.composers', self.catalog)
+        self.frozen_graph = composer.freeze(spec, graph)
+        self.roots = self.frozen_graph.roots
+        self.leaves = self.frozen_graph.leaves
+
+
+class WorkflowCache(object):
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError('The max size of the workflow cache must be a positive integer.')
+
+        self.max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _get(self, key, compile_workflow):
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self.hits += 1
+                self._entries[key] = self._entries.pop(key)
+                return entry
+
+            self.misses += 1
+
+        # Compile the workflow outside the lock so lookups for other workflows are not blocked.
+        return self._put(key, compile_workflow())
+
+    def _put(self, key, entry):
+        with self._lock:
+            # Keep the entry compiled first if the same workflow is compiled concurrently.
+            entry = self._entries.pop(key, entry)
+            self._entries[key] = entry
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return entry
+
+    def instantiate(self, catalog, definition):
+        if isinstance(definition, six.string_types):
+            definition = yaml.safe_load(definition)
+
+        def compile_workflow():
+            spec = spec_util.instantiate(catalog, copy.deepcopy(definition))
+            composer = plugin_util.get_module('orquesta.composers', catalog)
+            entry = CompiledWorkflow(spec, composer.compose(spec))
+
+            # Also index by the serialized spec for the conductors given the instantiated spec.
+            return self._put(get_cache_key('spec', spec.serialize()), entry)
+
+        return self._get(get_cache_key('definition', catalog, definition), compile_workflow)
+
+    def compile(self, spec):
+        def compile_workflow():
+            composer = plugin_util.get_module('orquesta.composers', spec.get_catalog())
+            return CompiledWorkflow(spec, composer.compose(spec))
+
+        return self._get(get_cache_key('spec', spec.serialize()), compile_workflow)
+
+    def load(self, spec_data, graph_data=None):
+        # The key is the same as the key of the compiled spec since the data is the serialized spec.
+        # The spec refers to the data it is deserialized from so the data is copied since the spec
+        # is shared by the conductors that use the cache.
+        def compile_workflow():
+            spec_module = spec_loader.get_spec_module(spec_data['catalog'])
+            spec = spec_module.WorkflowSpec.deserialize(copy.deepcopy(spec_data))
+
+            if graph_data is None:
+                composer = plugin_util.get_module('orquesta.composers', spec.get_catalog())
+                return CompiledWorkflow(spec, composer.compose(spec))
+
+            return CompiledWorkflow(spec, graphing.WorkflowGraph.deserialize(graph_data))
+
+        return self._get(get_cache_key('spec', spec_data), compile_workflow)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_metrics(self):
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
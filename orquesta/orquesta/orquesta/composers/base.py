@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import abc
+import collections
 import logging
 import six
 
+from orquesta import graphing
 from orquesta.utils import plugin as plugin_util
 
 
@@ -26,11 +28,75 @@ def get_composer(catalog):
     return plugin_util.get_module('orquesta.composers', catalog)
 
 
+class WorkflowTaskIndex(object):
+
+    def __init__(self, spec):
+        self.spec = spec
+
+        # Identify the next tasks of each task once and derive the inbound task transitions
+        # from them instead of scanning the task specs on every query while composing.
+        self.next_tasks = collections.OrderedDict(
+            (task_name, spec.tasks.get_next_tasks(task_name))
+            for task_name in spec.tasks.keys()
+        )
+
+        self.prev_tasks_count = collections.Counter(
+            next_task[0]
+            for next_tasks in six.itervalues(self.next_tasks)
+            for next_task in next_tasks
+        )
+
+        self.start_tasks = sorted(
+            task_name for task_name in self.next_tasks if not self.prev_tasks_count[task_name]
+        )
+
+        self._cycle_tasks = None
+
+    def get_next_tasks(self, task_name):
+        # The reserved tasks are not defined in the spec and are not indexed.
+        if task_name not in self.next_tasks:
+            return self.spec.tasks.get_next_tasks(task_name)
+
+        return self.next_tasks[task_name]
+
+    def is_split_task(self, task_name):
+        return not self.spec.tasks.is_join_task(task_name) and self.prev_tasks_count[task_name] > 1
+
+    def in_cycle(self, task_name):
+        if self._cycle_tasks is None:
+            self._cycle_tasks = self.get_cycle_tasks()
+
+        return task_name in self._cycle_tasks
+
+    def get_cycle_tasks(self):
+        successors = collections.OrderedDict(
+            (task_name, [t[0] for t in next_tasks if t[0] in self.next_tasks])
+            for task_name, next_tasks in six.iteritems(self.next_tasks)
+        )
+
+        # The task is in a cycle if it is strongly connected to other tasks or loops to itself.
+        cycle_tasks = set()
+
+        for component in graphing.get_strongly_connected_components(successors):
+            task_name = next(iter(component))
+
+            if len(component) > 1 or task_name in successors[task_name]:
+                cycle_tasks.update(component)
+
+        return cycle_tasks
+
+
 @six.add_metaclass(abc.ABCMeta)
 class WorkflowComposer(object):
     wf_spec_type = None
+    task_index_type = WorkflowTaskIndex
 
     @classmethod
     @abc.abstractmethod
     def compose(cls, spec):
         raise NotImplementedError()
+
+    @classmethod
+    def freeze(cls, spec, graph):
+        # The frozen graph is used at runtime and is not changed after.
+        return graph.freeze(is_split_task=cls.task_index_type(spec).is_split_task)
@@ -36,3 +36,7 @@ class WorkflowComposer(comp_base.WorkflowComposer):
         wf_graph = graphing.WorkflowGraph()
 
         return wf_graph
+
+    @classmethod
+    def freeze(cls, spec, graph):
+        return graph.freeze()
@@ -43,8 +43,9 @@ class WorkflowComposer(comp_base.WorkflowComposer):
 
         q = queue.Queue()
         wf_graph = graphing.WorkflowGraph()
+        wf_index = cls.task_index_type(wf_spec)
 
-        for task_name, condition, task_transition_item_idx in wf_spec.tasks.get_start_tasks():
+        for task_name in wf_index.start_tasks:
             q.put((task_name, []))
 
         while not q.empty():
@@ -59,17 +60,16 @@ class WorkflowComposer(comp_base.WorkflowComposer):
 
             # Determine if the task is a split task and if it is in a cycle. If the task is a
             # split task, keep track of where the split(s) occurs.
-            if wf_spec.tasks.is_split_task(task_name) and not wf_spec.tasks.in_cycle(task_name):
+            if wf_index.is_split_task(task_name) and not wf_index.in_cycle(task_name):
                 splits.append(task_name)
 
             if splits:
                 wf_graph.update_task(task_name, splits=splits)
 
-            next_tasks = wf_spec.tasks.get_next_tasks(task_name)
+            next_tasks = wf_index.get_next_tasks(task_name)
 
             for next_task_name, condition, task_transition_item_idx in next_tasks:
-                if (not wf_graph.has_task(next_task_name) or
-                        not wf_spec.tasks.in_cycle(next_task_name)):
+                if not wf_graph.has_task(next_task_name) or not wf_index.in_cycle(next_task_name):
                     q.put((next_task_name, list(splits)))
 
                 crta = [condition] if condition else []
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
+import hashlib
+import json
 import logging
 import six
 
@@ -24,31 +27,382 @@ from orquesta import exceptions as exc
 from orquesta.expressions import base as expr_base
 from orquesta import graphing
 from orquesta import machines
+from orquesta.results import base as result_base
 from orquesta.specs import base as spec_base
 from orquesta.specs import loader as spec_loader
 from orquesta import statuses
 from orquesta.utils import context as ctx_util
 from orquesta.utils import dictionary as dict_util
 from orquesta.utils import plugin as plugin_util
+from orquesta.utils import snapshot as snapshot_util
+from orquesta.utils import views as view_util
 
 
 LOG = logging.getLogger(__name__)
 
 
+class WorkflowStateView(view_util.DictView):
+    # The view is a read only and live representation of the workflow state that is used for
+    # evaluating expressions. Unlike serialize, the view does not make copies of the state.
+    _keys = ['contexts', 'joins', 'routes', 'sequence', 'staged', 'status', 'tasks']
+
+    def __init__(self, workflow_state):
+        self._workflow_state = workflow_state
+
+        # The number of reads thru the view. The conductor uses the count to identify whether
+        # the rendering of a task depends on the workflow state.
+        self.reads = 0
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+
+        self.reads += 1
+
+        return view_util.freeze(getattr(self._workflow_state, key))
+
+    def __iter__(self):
+        self.reads += 1
+
+        return iter(self._keys)
+
+    def __len__(self):
+        self.reads += 1
+
+        return len(self._keys)
+
+    def __contains__(self, key):
+        self.reads += 1
+
+        return key in self._keys
+
+    @property
+    def _data(self):
+        self.reads += 1
+
+        return {key: getattr(self._workflow_state, key) for key in self._keys}
+
+    def serialize(self):
+        return self._workflow_state.serialize()
+
+
 class WorkflowState(object):
 
+    # The max number of merged contexts to cache.
+    contexts_cache_size = 1000
+
+    # The number of contexts appended since the last compaction before the contexts are
+    # compacted again. The contexts are not compacted automatically if the value is not set.
+    contexts_compaction_threshold = None
+
     def __init__(self, conductor=None):
+        self._changed_joins = set()
+        self._changed_tasks = set()
+        self._changed_staged = set()
+        self._removed_staged = set()
         self.conductor = conductor
         self.contexts = list()
+        self.joins = dict()
         self.routes = list()
+        self.tasks = dict()
         self.sequence = list()
         self.staged = list()
         self.status = statuses.UNSET
-        self.tasks = dict()
+        self.view = WorkflowStateView(self)
+        self.checkpoint()
+
+    @property
+    def contexts(self):
+        return self._contexts
+
+    @contexts.setter
+    def contexts(self, entries):
+        # The contexts are only appended to so a merged context for a list of context indices
+        # does not change once it is merged. The cache is reset when the contexts are replaced.
+        self._contexts = entries if entries is not None else list()
+        self._contexts_cache = collections.OrderedDict()
+        self._contexts_compacted_size = len(self._contexts)
+
+    def _cache_context(self, key, ctx):
+        self._contexts_cache[key] = ctx
+
+        while len(self._contexts_cache) > self.contexts_cache_size:
+            self._contexts_cache.popitem(last=False)
+
+    def get_context(self, ctx_idxs):
+        key = tuple(ctx_idxs)
+
+        # Identify the longest list of leading context indices that is already merged.
+        n = len(key)
+
+        while n > 0 and key[:n] not in self._contexts_cache:
+            n -= 1
+
+        ctx = {}
+
+        if n > 0:
+            ctx = self._contexts_cache.pop(key[:n])
+            self._cache_context(key[:n], ctx)
+
+        # Merge the remaining contexts and cache the intermediate results. The merged contexts
+        # are copied on write so the cached contexts and the contexts in the list are not changed.
+        for i in range(n, len(key)):
+            ctx = self.merge_contexts(ctx, self._get_context_entry(key[i]))
+            self._cache_context(key[:i + 1], ctx)
+
+        return dict(ctx)
+
+    def merge_contexts(self, left, right):
+        if self.conductor and self.conductor.result_store:
+            return result_base.merge_contexts(left, right)
+
+        return dict_util.merge_dicts(left, right, overwrite=True, copy_on_write=True)
+
+    def _get_context_entry(self, idx):
+        result_store = self.conductor.result_store if self.conductor else None
+
+        # The references to the values in the result store are bound to the result store before
+        # the contexts are merged. The values are loaded only when read by an expression or when
+        # the context is returned to the caller. The initial context is not published thru the
+        # result store and is kept as is.
+        if not result_store or idx == 0:
+            return self.contexts[idx]
+
+        return result_store.bind_context(self.contexts[idx])
+
+    def _prune_context_idxs(self, ctx_idxs):
+        overwritten_keys = set()
+        pruned = []
+
+        for idx in reversed(ctx_idxs):
+            ctx = self.contexts[idx]
+
+            # The contexts are merged in order and a key that is set to a value other than a
+            # dict replaces any value merged before it. The context is not needed if all of its
+            # keys are replaced by the contexts after it. The initial context is always kept.
+            if idx == 0 or not all(k in overwritten_keys for k in ctx):
+                pruned.append(idx)
+
+            overwritten_keys.update(k for k, v in six.iteritems(ctx) if not isinstance(v, dict))
+
+        return list(reversed(pruned))
+
+    def compact_contexts(self):
+        # The lists of inbound contexts can be shared between the staged task and the task state
+        # entry so the lists are updated in place and each list is only processed once.
+        ctx_idxs_lists = {}
+
+        for entry in self.sequence + self.staged:
+            ctx_idxs_lists[id(entry['ctxs']['in'])] = entry['ctxs']['in']
+
+        # Remove the contexts from each list that are replaced by the contexts after them.
+        # The merged context for each list is the same after the contexts are removed.
+        pruned_lists = dict(
+            (list_id, self._prune_context_idxs(ctx_idxs))
+            for list_id, ctx_idxs in six.iteritems(ctx_idxs_lists)
+        )
+
+        # Identify the contexts that are still referenced.
+        live_idxs = set([0])
+
+        for ctx_idxs in pruned_lists.values():
+            live_idxs.update(ctx_idxs)
+
+        for task_state_entry in self.sequence:
+            live_idxs.update(task_state_entry['ctxs'].get('out', {}).values())
+
+        live_idxs = sorted(idx for idx in live_idxs if idx < len(self.contexts))
+        idx_map = dict((old_idx, new_idx) for new_idx, old_idx in enumerate(live_idxs))
+
+        # Remap the context indices in the lists of inbound and outbound contexts.
+        changed_list_ids = set()
+
+        for list_id, ctx_idxs in six.iteritems(ctx_idxs_lists):
+            remapped = [idx_map[idx] for idx in pruned_lists[list_id]]
+
+            if remapped != ctx_idxs:
+                ctx_idxs[:] = remapped
+                changed_list_ids.add(list_id)
+
+        for idx, task_state_entry in enumerate(self.sequence):
+            changed = id(task_state_entry['ctxs']['in']) in changed_list_ids
+            ctx_out = task_state_entry['ctxs'].get('out', {})
+
+            for task_transition_id, ctx_idx in list(ctx_out.items()):
+                if idx_map[ctx_idx] != ctx_idx:
+                    ctx_out[task_transition_id] = idx_map[ctx_idx]
+                    changed = True
+
+            if changed:
+                self._changed_tasks.add(idx)
+
+        for staged_task in self.staged:
+            if id(staged_task['ctxs']['in']) in changed_list_ids:
+                self._changed_staged.add((staged_task['id'], staged_task['route']))
+
+        compacted = len(self.contexts) - len(live_idxs)
+
+        # Replacing the contexts resets the cache of merged contexts. The replaced contexts
+        # are included in full in the next delta.
+        self.contexts = [self.contexts[idx] for idx in live_idxs]
+        self._contexts_replaced = True
+
+        return compacted
+
+    def compact_contexts_on_threshold(self):
+        threshold = self.contexts_compaction_threshold
+
+        if not threshold or len(self.contexts) - self._contexts_compacted_size < threshold:
+            return False
+
+        self.compact_contexts()
+
+        return True
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, entries):
+        # The sequence index of the task state entries are tracked by status so queries
+        # on whether there are tasks in certain statuses do not need to scan the sequence.
+        self._sequence = entries if entries is not None else list()
+        self._tasks_by_status = collections.defaultdict(set)
+
+        for idx, entry in enumerate(self._sequence):
+            if entry and entry.get('status') is not None:
+                self._tasks_by_status[entry['status']].add(idx)
+
+            self._changed_tasks.add(idx)
+
+    def _get_task_state_idx(self, task_state):
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (
+            task_state['id'],
+            str(task_state['route'])
+        )
+
+        idx = self.tasks.get(task_state_entry_id)
+
+        if idx is not None and idx < len(self.sequence) and self.sequence[idx] is task_state:
+            return idx
+
+        for idx, entry in enumerate(self.sequence):
+            if entry is task_state:
+                return idx
+
+        return None
+
+    def update_task_status(self, task_state, status):
+        idx = self._get_task_state_idx(task_state)
+
+        if idx is not None and task_state.get('status') is not None:
+            self._tasks_by_status[task_state['status']].discard(idx)
+
+        task_state['status'] = status
+
+        if idx is not None and status is not None:
+            self._tasks_by_status[status].add(idx)
+
+        if idx is not None:
+            self._changed_tasks.add(idx)
+
+    def _set_task_state_entry(self, idx, entry):
+        if idx < len(self.sequence):
+            if self.sequence[idx].get('status') is not None:
+                self._tasks_by_status[self.sequence[idx]['status']].discard(idx)
+
+            self.sequence[idx] = entry
+        else:
+            self.sequence.append(entry)
+
+        if entry.get('status') is not None:
+            self._tasks_by_status[entry['status']].add(idx)
+
+        self._changed_tasks.add(idx)
+
+    def mark_task_state_changed(self, task_state):
+        idx = self._get_task_state_idx(task_state)
+
+        if idx is not None:
+            self._changed_tasks.add(idx)
+
+    @property
+    def staged(self):
+        return list(self._staged.values())
+
+    @staged.setter
+    def staged(self, entries):
+        # The staged tasks are indexed by task id and route. The order of the staged tasks
+        # is tracked separately so the list of staged tasks are returned in the same order.
+        self._removed_staged.update(getattr(self, '_staged', dict()).keys())
+        self._staged = collections.OrderedDict()
+        self._staged_order = dict()
+        self._staged_ready = set()
+        self._staged_count = 0
+        self._staged_items_status = dict()
+
+        for entry in entries or []:
+            self._index_staged_task(entry)
+
+    def _index_staged_task(self, entry):
+        key = (entry['id'], entry['route'])
+
+        if key not in self._staged:
+            self._staged_order[key] = self._staged_count
+            self._staged_count += 1
+
+        self._staged[key] = entry
+        self._changed_staged.add(key)
+
+        if entry.get('ready') is True:
+            self._staged_ready.add(key)
+        else:
+            self._staged_ready.discard(key)
+
+    def _remove_staged_task(self, key):
+        if key in self._staged:
+            self._staged.pop(key)
+            self._staged_order.pop(key)
+            self._staged_ready.discard(key)
+            self._staged_items_status.pop(key, None)
+            self._changed_staged.discard(key)
+            self._removed_staged.add(key)
+
+    def get_join_count(self, task_id, route):
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
+
+        return len(self.joins.get(task_state_entry_id, {}))
+
+    def set_join_transition(self, task_id, route, task_transition_id, satisfied):
+        # The satisfied inbound task transitions of the join tasks are tracked by task id and
+        # route so checking the barrier of a join task does not have to check each inbound.
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
+        transitions = self.joins.get(task_state_entry_id, {})
+
+        if bool(satisfied) == (task_transition_id in transitions):
+            return
+
+        if satisfied:
+            transitions[task_transition_id] = True
+        else:
+            transitions.pop(task_transition_id)
+
+        if transitions:
+            self.joins[task_state_entry_id] = transitions
+        else:
+            self.joins.pop(task_state_entry_id, None)
+
+        self._changed_joins.add(task_state_entry_id)
+
+    def replace_joins(self, joins):
+        self.joins = joins
+        self._joins_replaced = True
 
     def serialize(self):
         return {
             'contexts': copy.deepcopy(self.contexts),
+            'joins': copy.deepcopy(self.joins),
             'routes': copy.deepcopy(self.routes),
             'sequence': copy.deepcopy(self.sequence),
             'staged': copy.deepcopy(self.staged),
@@ -58,23 +412,150 @@ class WorkflowState(object):
 
     @classmethod
     def deserialize(cls, data):
+        return cls._deserialize(copy.deepcopy(data))
+
+    @classmethod
+    def _deserialize(cls, data):
+        # The data is owned by the workflow state and is not copied.
         instance = cls()
-        instance.contexts = copy.deepcopy(data.get('contexts', list()))
-        instance.routes = copy.deepcopy(data.get('routes', list()))
-        instance.sequence = copy.deepcopy(data.get('sequence', list()))
-        instance.staged = copy.deepcopy(data.get('staged', dict()))
+        instance.contexts = data.get('contexts', list())
+        instance.joins = data.get('joins')
+        instance.routes = data.get('routes', list())
+        instance.sequence = data.get('sequence', list())
+        instance.staged = data.get('staged', dict())
         instance.status = data.get('status', statuses.UNSET)
-        instance.tasks = copy.deepcopy(data.get('tasks', dict()))
+        instance.tasks = data.get('tasks', dict())
+        instance.checkpoint()
 
         return instance
 
+    def checkpoint(self):
+        # Record the point from which the changes to the workflow state are tracked. The contexts,
+        # routes, and sequence are only appended to. The task state entries and staged tasks that
+        # are changed in place are tracked as they are changed.
+        self._checkpoint = {
+            'contexts': len(self.contexts),
+            'routes': len(self.routes),
+            'sequence': len(self.sequence)
+        }
+
+        self._changed_joins = set()
+        self._changed_tasks = set()
+        self._changed_staged = set()
+        self._removed_staged = set()
+        self._contexts_replaced = False
+        self._joins_replaced = False
+
+    def serialize_delta(self):
+        ctxs_start = self._checkpoint['contexts']
+        routes_start = self._checkpoint['routes']
+        seq_start = self._checkpoint['sequence']
+
+        changed_task_idxs = sorted(idx for idx in self._changed_tasks if idx < seq_start)
+        changed_staged_keys = sorted(self._changed_staged, key=lambda x: self._staged_order[x])
+
+        task_state_entry_ids = set(
+            constants.TASK_STATE_ROUTE_FORMAT % (entry['id'], str(entry['route']))
+            for entry in self.sequence[seq_start:]
+        )
+
+        # If the contexts are compacted, then all the contexts are included to replace the
+        # contexts that the delta is applied to.
+        if self._contexts_replaced:
+            ctxs_start = 0
+
+        delta = {
+            'contexts': {
+                'start': ctxs_start,
+                'entries': copy.deepcopy(self.contexts[ctxs_start:])
+            },
+            'routes': {
+                'start': routes_start,
+                'entries': copy.deepcopy(self.routes[routes_start:])
+            },
+            'sequence': {
+                'start': seq_start,
+                'entries': copy.deepcopy(self.sequence[seq_start:]),
+                'changed': [[idx, copy.deepcopy(self.sequence[idx])] for idx in changed_task_idxs]
+            },
+            'staged': {
+                'removed': [list(key) for key in sorted(self._removed_staged)],
+                'entries': [copy.deepcopy(self._staged[key]) for key in changed_staged_keys]
+            },
+            'status': self.status,
+            'tasks': {k: self.tasks[k] for k in task_state_entry_ids}
+        }
+
+        if self._contexts_replaced:
+            delta['contexts']['replaced'] = True
+
+        # The join counters are only included if changed. If the join counters are identified
+        # from the task state entries, then all the join counters are included.
+        if self._joins_replaced:
+            delta['joins'] = {'entries': copy.deepcopy(self.joins), 'replaced': True}
+        elif self._changed_joins:
+            delta['joins'] = {
+                'entries': {k: copy.deepcopy(self.joins.get(k, {})) for k in self._changed_joins}
+            }
+
+        self.checkpoint()
+
+        return delta
+
+    def apply_delta(self, delta):
+        for key in ['contexts', 'routes', 'sequence']:
+            if key == 'contexts' and delta[key].get('replaced'):
+                continue
+
+            if delta[key]['start'] != len(getattr(self, key)):
+                raise ValueError('The delta does not start at the current "%s".' % key)
+
+        if delta['contexts'].get('replaced'):
+            self.contexts = copy.deepcopy(delta['contexts']['entries'])
+        else:
+            self.contexts.extend(copy.deepcopy(delta['contexts']['entries']))
+        self.routes.extend(copy.deepcopy(delta['routes']['entries']))
+
+        for idx, entry in delta['sequence']['changed']:
+            self._set_task_state_entry(idx, copy.deepcopy(entry))
+
+        for entry in delta['sequence']['entries']:
+            self._set_task_state_entry(len(self.sequence), copy.deepcopy(entry))
+
+        for task_id, route in delta['staged']['removed']:
+            self._remove_staged_task((task_id, route))
+
+        for entry in delta['staged']['entries']:
+            self._index_staged_task(copy.deepcopy(entry))
+
+        if 'joins' in delta and delta['joins'].get('replaced'):
+            self.joins = copy.deepcopy(delta['joins']['entries'])
+        elif 'joins' in delta and self.joins is not None:
+            for task_state_entry_id, transitions in six.iteritems(delta['joins']['entries']):
+                if transitions:
+                    self.joins[task_state_entry_id] = copy.deepcopy(transitions)
+                else:
+                    self.joins.pop(task_state_entry_id, None)
+
+        self.status = delta['status']
+        self.tasks.update(delta['tasks'])
+        self.checkpoint()
+
     def get_task(self, task_id, task_route):
         return self.sequence[
             self.tasks[constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(task_route))]
         ]
 
     def get_tasks_by_status(self, statuses):
-        return [t for t in self.sequence if t['status'] in statuses]
+        idxs = set()
+
+        for status in statuses:
+            idxs.update(self._tasks_by_status.get(status, set()))
+
+        return [self.sequence[idx] for idx in sorted(idxs)]
+
+    def _has_tasks_by_status(self, statuses):
+        return any(len(self._tasks_by_status.get(status, set())) > 0 for status in statuses)
 
     def get_terminal_tasks(self):
         return [t for t in self.sequence if t.get('term', False)]
@@ -84,30 +565,32 @@ class WorkflowState(object):
 
     @property
     def has_active_tasks(self):
-        return len(self.get_tasks_by_status(statuses.ACTIVE_STATUSES)) > 0
+        return self._has_tasks_by_status(statuses.ACTIVE_STATUSES)
 
     @property
     def has_pausing_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSING])) > 0
+        return self._has_tasks_by_status([statuses.PAUSING])
 
     @property
     def has_paused_tasks(self):
-        return len(self.get_tasks_by_status([statuses.PAUSED, statuses.PENDING])) > 0
+        return self._has_tasks_by_status([statuses.PAUSED, statuses.PENDING])
 
     @property
     def has_canceling_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELING])) > 0
+        return self._has_tasks_by_status([statuses.CANCELING])
 
     @property
     def has_canceled_tasks(self):
-        return len(self.get_tasks_by_status([statuses.CANCELED])) > 0
+        return self._has_tasks_by_status([statuses.CANCELED])
 
     def get_staged_tasks(self):
-        return list(filter(lambda x: x['ready'] is True, self.staged))
+        keys = sorted(self._staged_ready, key=lambda x: self._staged_order[x])
+
+        return [self._staged[key] for key in keys]
 
     @property
     def has_staged_tasks(self):
-        return len(self.get_staged_tasks()) > 0
+        return len(self._staged_ready) > 0
 
     def add_staged_task(self, task_id, route, ctxs=None, prev=None, ready=True):
         if not ctxs:
@@ -123,52 +606,149 @@ class WorkflowState(object):
             'ready': ready
         }
 
-        self.staged.append(entry)
+        self._index_staged_task(entry)
 
         return entry
 
     def get_staged_task(self, task_id, route):
-        def query(x):
-            return x['id'] == task_id and x['route'] == route
+        return self._staged.get((task_id, route))
+
+    def mark_staged_task_changed(self, task_id, route):
+        if (task_id, route) not in self._staged:
+            return
 
-        staged_tasks = list(filter(query, self.staged))
+        self._changed_staged.add((task_id, route))
+
+        # The task state entry may share the list of inbound contexts with the staged task.
+        task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
+
+        if task_state_entry_id in self.tasks:
+            self._changed_tasks.add(self.tasks[task_state_entry_id])
+
+    def set_staged_task_ready(self, task_id, route, ready):
+        staged_task = self.get_staged_task(task_id, route)
+
+        if not staged_task:
+            raise exc.InvalidTaskStateEntry(task_id)
+
+        staged_task['ready'] = ready
+        self._index_staged_task(staged_task)
+
+    def _get_staged_task_items_status(self, staged_task):
+        key = (staged_task['id'], staged_task['route'])
+        items = staged_task.get('items') or []
+        tracked = self._staged_items_status.get(key)
+
+        # The items of the staged task are counted by status so the status of the items can be
+        # assessed without going thru the items. The items are counted again if the list of items
+        # is replaced, i.e. when the staged task is restored from serialized state.
+        if tracked is None or tracked[0] is not items:
+            tracked = (items, collections.Counter(item['status'] for item in items))
+            self._staged_items_status[key] = tracked
+
+        return tracked[1]
+
+    def get_staged_task_items_status(self, task_id, route):
+        staged_task = self.get_staged_task(task_id, route)
+
+        if not staged_task:
+            raise exc.InvalidTaskStateEntry(task_id)
+
+        return collections.Counter(self._get_staged_task_items_status(staged_task))
+
+    def set_staged_task_items(self, task_id, route, items_count):
+        staged_task = self.get_staged_task(task_id, route)
+
+        if not staged_task:
+            raise exc.InvalidTaskStateEntry(task_id)
+
+        staged_task['items'] = [{'status': statuses.UNSET}] * items_count
+        self.mark_staged_task_changed(task_id, route)
+
+    def update_staged_task_item(self, task_id, route, item_id, status, result=None):
+        staged_task = self.get_staged_task(task_id, route)
+
+        if not staged_task:
+            raise exc.InvalidTaskStateEntry(task_id)
 
-        return staged_tasks[0] if staged_tasks else None
+        items_status = self._get_staged_task_items_status(staged_task)
+        items_status[staged_task['items'][item_id]['status']] -= 1
+        staged_task['items'][item_id] = {'status': status, 'result': result}
+        items_status[status] += 1
+        self.mark_staged_task_changed(task_id, route)
 
     def remove_staged_task(self, task_id, route):
         staged_task = self.get_staged_task(task_id, route)
 
         if staged_task:
-            any_items_running = [
-                item for item in staged_task.get('items', [])
-                if item['status'] in statuses.ACTIVE_STATUSES
-            ]
+            items_status = self._get_staged_task_items_status(staged_task)
+            any_items_running = any(items_status[s] > 0 for s in statuses.ACTIVE_STATUSES)
 
             if not any_items_running:
-                self.staged.remove(staged_task)
+                self._remove_staged_task((task_id, route))
+
+
+# The helpers below read from the serialized conductor without deserializing it.
+def peek_status(data):
+    return data.get('state', {}).get('status', statuses.UNSET)
+
+
+def peek_output(data):
+    return copy.deepcopy(data['output']) if data.get('output') else None
+
+
+def peek_errors(data):
+    return copy.deepcopy(data.get('errors', []))
 
 
 class WorkflowConductor(object):
 
-    def __init__(self, spec, context=None, inputs=None):
+    # The max number of entries for each of the log and errors. New entries are dropped and
+    # counted when the limit is reached. There is no limit if the value is not set.
+    log_limit = None
+
+    # The cache of compiled workflows shared by the conductors in the process. If set, the
+    # conductors of the same workflow definition share the same read only spec and graph.
+    workflow_cache = None
+
+    def __init__(self, spec, context=None, inputs=None, result_store=None):
         if not spec or not isinstance(spec, spec_base.Spec):
             raise ValueError('The value of "spec" is not type of Spec.')
 
-        self.spec = spec
-        self.catalog = self.spec.get_catalog()
+        self._setup(spec.get_catalog(), result_store=result_store)
+        self._spec = spec
+        self._parent_ctx = context or {}
+        self._inputs = inputs or {}
+        self.checkpoint()
+
+    def _setup(self, catalog, result_store=None):
+        self.catalog = catalog
         self.spec_module = spec_loader.get_spec_module(self.catalog)
         self.composer = plugin_util.get_module('orquesta.composers', self.catalog)
 
+        # If a result store is provided, large task results and published values are kept
+        # in the store and only references to them are kept in the workflow state.
+        self.result_store = result_store
+
+        # The serialized spec, graph, and workflow state that are not yet deserialized.
+        self._serialized = {}
+
+        self._frozen_graph = None
+        self._compiled = None
         self._errors = []
         self._graph = None
-        self._inputs = inputs or {}
+        self._inputs = {}
         self._log = []
+        self._log_dropped = {'log': 0, 'errors': 0}
+        self._log_index = None
         self._outputs = None
-        self._parent_ctx = context or {}
+        self._parent_ctx = {}
+        self._rendered_tasks = {}
+        self._spec = None
         self._workflow_state = None
 
     def restore(self, graph, log=None, errors=None, state=None,
-                inputs=None, outputs=None, context=None):
+                inputs=None, outputs=None, context=None, log_dropped=None):
         if not graph or not isinstance(graph, graphing.WorkflowGraph):
             raise ValueError('The value of "graph" is not type of WorkflowGraph.')
 
@@ -181,58 +761,219 @@ class WorkflowConductor(object):
         if outputs is not None and not isinstance(outputs, dict):
             raise ValueError('The value of "outputs" is not type of dict.')
 
+        # The restored graph and workflow state replace any that are not yet deserialized.
+        self._serialized.pop('graph', None)
+        self._serialized.pop('workflow_state', None)
+
+        self._frozen_graph = None
         self._errors = errors or []
         self._graph = graph
         self._inputs = inputs or {}
         self._log = log or []
+        self._log_dropped = {'log': 0, 'errors': 0}
+        self._log_dropped.update(log_dropped or {})
         self._outputs = outputs
         self._parent_ctx = context or {}
+        self._rendered_tasks = {}
         self._workflow_state = state
 
+        # The fingerprints of the restored log entries are indexed on the next log entry.
+        self._log_index = None
+
         # Assign a back reference of the conductor to the workflow state.
         # This back reference is needed to help the workflow state machine
         # identify if there are next tasks.
         self._workflow_state.conductor = self
 
+        # Track the changes from the restored state.
+        self.checkpoint()
+
+    def checkpoint(self):
+        # Record the point from which serialize_delta tracks the changes to the conductor.
+        self._checkpoint = {
+            'log': len(self._log),
+            'errors': len(self._errors),
+            'output': self._outputs
+        }
+
+        if self._workflow_state:
+            self._workflow_state.checkpoint()
+
+    def _serialize_section(self, name):
+        # The sections that are not yet deserialized are copied as is instead of being built
+        # only to be serialized again.
+        if name in self._serialized:
+            return copy.deepcopy(self._serialized[name])
+
+        # The workflow state is copied by its serialize. The serialized spec and graph refer to
+        # the data of the spec and graph, which may be shared thru the workflow cache, so they
+        # are copied here.
+        if name == 'workflow_state':
+            return self.workflow_state.serialize()
+
+        return copy.deepcopy(getattr(self, name).serialize())
+
     def serialize(self):
-        return {
-            'spec': self.spec.serialize(),
-            'graph': self.graph.serialize(),
+        data = {
+            'spec': self._serialize_section('spec'),
+            'graph': self._serialize_section('graph'),
             'input': self.get_workflow_input(),
             'context': self.get_workflow_parent_context(),
-            'state': self.workflow_state.serialize(),
+            'state': self._serialize_section('workflow_state'),
             'log': copy.deepcopy(self.log),
             'errors': copy.deepcopy(self.errors),
             'output': self.get_workflow_output()
         }
 
-    @classmethod
-    def deserialize(cls, data):
-        spec_module = spec_loader.get_spec_module(data['spec']['catalog'])
-        spec = spec_module.WorkflowSpec.deserialize(data['spec'])
+        # Only include the count of dropped log entries if any entry has been dropped.
+        if any(self._log_dropped.values()):
+            data['log_dropped'] = copy.deepcopy(self._log_dropped)
+
+        return data
+
+    def serialize_delta(self):
+        # Return only the changes since the last checkpoint, serialize_delta, or restore. The
+        # spec, graph, input, and parent context are not changed after the workflow is started.
+        # The serialize method does not move the checkpoint. Call checkpoint after persisting
+        # the serialized conductor so the next delta starts from it.
+        delta = {
+            'state': self.workflow_state.serialize_delta(),
+            'log': {
+                'start': self._checkpoint['log'],
+                'entries': copy.deepcopy(self.log[self._checkpoint['log']:])
+            },
+            'errors': {
+                'start': self._checkpoint['errors'],
+                'entries': copy.deepcopy(self.errors[self._checkpoint['errors']:])
+            }
+        }
+
+        if self._outputs is not self._checkpoint['output']:
+            delta['output'] = self.get_workflow_output()
+
+        if any(self._log_dropped.values()):
+            delta['log_dropped'] = copy.deepcopy(self._log_dropped)
+
+        self.checkpoint()
+
+        return delta
+
+    def apply_delta(self, delta):
+        for key in ['log', 'errors']:
+            if delta[key]['start'] != len(getattr(self, key)):
+                raise ValueError('The delta does not start at the current "%s".' % key)
+
+        self.workflow_state.apply_delta(delta['state'])
+
+        for log_name in ['log', 'errors']:
+            entries = copy.deepcopy(delta[log_name]['entries'])
+            getattr(self, log_name).extend(entries)
+
+            # Add the new entries to the index of log entries if the index is already built.
+            if self._log_index is not None:
+                fingerprints = [self._get_log_entry_fingerprint(e) for e in entries]
+                self._log_index[log_name].update(f for f in fingerprints if f is not None)
+
+        if 'output' in delta:
+            self._outputs = copy.deepcopy(delta['output'])
+
+        if 'log_dropped' in delta:
+            self._log_dropped.update(delta['log_dropped'])
+
+        self.checkpoint()
 
-        graph = graphing.WorkflowGraph.deserialize(data['graph'])
-        inputs = copy.deepcopy(data['input'])
-        context = copy.deepcopy(data['context'])
-        state = WorkflowState.deserialize(data['state'])
-        log = copy.deepcopy(data.get('log', []))
-        errors = copy.deepcopy(data['errors'])
-        outputs = copy.deepcopy(data['output'])
+    @classmethod
+    def deserialize(cls, data, result_store=None):
+        instance = cls.__new__(cls)
+        instance._setup(data['spec']['catalog'], result_store=result_store)
+
+        # The spec, graph, and workflow state are deserialized on first access so queries
+        # such as the workflow status and output do not pay for building them. The serialized
+        # sections are kept as given and each section is copied when it is deserialized or
+        # serialized. The caller must not change the sections of the data in the meantime.
+        instance._serialized = {
+            'spec': data['spec'],
+            'graph': data['graph'],
+            'workflow_state': data['state']
+        }
 
-        instance = cls(spec)
-        instance.restore(graph, log, errors, state, inputs, outputs, context)
+        instance._errors = copy.deepcopy(data['errors'])
+        instance._inputs = copy.deepcopy(data['input'])
+        instance._log = copy.deepcopy(data.get('log', []))
+        instance._log_dropped.update(copy.deepcopy(data.get('log_dropped')) or {})
+        instance._outputs = copy.deepcopy(data['output'])
+        instance._parent_ctx = copy.deepcopy(data['context'])
+        instance.checkpoint()
 
         return instance
 
+    # The snapshot is smaller than the JSON of the serialized conductor, in particular when the
+    # same strings are repeated. The codec is pure python so it is slower than the json module to
+    # encode and decode unless the data is dominated by repeated large strings.
+    def serialize_snapshot(self, compress=False):
+        return snapshot_util.encode(self.serialize(), compress=compress)
+
+    @classmethod
+    def deserialize_snapshot(cls, data, result_store=None):
+        return cls.deserialize(snapshot_util.decode(data), result_store=result_store)
+
+    def _load_compiled(self):
+        # Share the spec and graph with the other conductors of the same workflow definition.
+        if 'spec' in self._serialized:
+            spec_data = self._serialized.pop('spec')
+            graph_data = self._serialized.pop('graph', None)
+            self._compiled = self.workflow_cache.load(spec_data, graph_data)
+        else:
+            self._serialized.pop('graph', None)
+            self._compiled = self.workflow_cache.compile(self._spec)
+
+        self._spec = self._compiled.spec
+
+        if not self._graph:
+            self._graph = self._compiled.graph
+            self._frozen_graph = self._compiled.frozen_graph
+
+    @property
+    def spec(self):
+        if not self._spec and self.workflow_cache is not None:
+            self._load_compiled()
+
+        if not self._spec:
+            spec_data = copy.deepcopy(self._serialized.pop('spec'))
+            self._spec = self.spec_module.WorkflowSpec.deserialize(spec_data)
+
+        return self._spec
+
     @property
     def graph(self):
+        if not self._graph and self.workflow_cache is not None:
+            self._load_compiled()
+
+        if not self._graph and 'graph' in self._serialized:
+            self._graph = graphing.WorkflowGraph.deserialize(self._serialized.pop('graph'))
+
         if not self._graph:
             self._graph = self.composer.compose(self.spec)
 
         return self._graph
 
+    @property
+    def frozen_graph(self):
+        # The frozen graph is used for the runtime lookups such as the route and join decisions
+        # so the graph does not have to be traversed or copied on each task transition.
+        if not self._frozen_graph:
+            self._frozen_graph = self.composer.freeze(self.spec, self.graph)
+
+        return self._frozen_graph
+
     @property
     def workflow_state(self):
+        if not self._workflow_state and 'workflow_state' in self._serialized:
+            self._workflow_state = WorkflowState.deserialize(
+                self._serialized.pop('workflow_state')
+            )
+            self._workflow_state.conductor = self
+
         if not self._workflow_state:
             self._workflow_state = WorkflowState(conductor=self)
 
@@ -264,7 +1005,7 @@ class WorkflowConductor(object):
                 self._workflow_state.routes.append([])
 
                 # Identify the starting tasks and set the pointer to the initial context entry.
-                for task_node in self.graph.roots:
+                for task_node in self.frozen_graph.roots:
                     ctxs, route = [0], 0
                     self._workflow_state.add_staged_task(
                         task_node['id'],
@@ -283,6 +1024,34 @@ class WorkflowConductor(object):
     def log(self):
         return self._log
 
+    @property
+    def log_dropped(self):
+        return copy.deepcopy(self._log_dropped)
+
+    @staticmethod
+    def _get_log_entry_fingerprint(entry):
+        try:
+            value = json.dumps(entry, sort_keys=True)
+        except (TypeError, ValueError):
+            # The entry cannot be fingerprinted if it contains values that are not serializable.
+            return None
+
+        if isinstance(value, six.text_type):
+            value = value.encode('utf-8')
+
+        return hashlib.sha1(value).hexdigest()
+
+    def _get_log_index(self, log_name):
+        # Index the fingerprints of the existing entries on first use and after restore.
+        if self._log_index is None:
+            self._log_index = {}
+
+            for name, entries in [('log', self._log), ('errors', self._errors)]:
+                fingerprints = [self._get_log_entry_fingerprint(e) for e in entries]
+                self._log_index[name] = set(f for f in fingerprints if f is not None)
+
+        return self._log_index[log_name]
+
     def log_entry(self, entry_type, message, task_id=None, route=None,
                   task_transition_id=None, result=None, data=None):
 
@@ -291,7 +1060,9 @@ class WorkflowConductor(object):
             raise exc.WorkflowLogEntryError('The log entry type "%s" is not valid.' % entry_type)
 
         # Identify the appropriate log and then log the entry.
+        log_name = 'errors' if entry_type == 'error' else 'log'
         log = self.errors if entry_type == 'error' else self.log
+        log_index = self._get_log_index(log_name)
 
         # Create the log entry.
         entry = {'type': entry_type, 'message': message}
@@ -301,13 +1072,24 @@ class WorkflowConductor(object):
         dict_util.set_dict_value(entry, 'result', result, insert_null=False)
         dict_util.set_dict_value(entry, 'data', data, insert_null=False)
 
-        # Ignore if this is a duplicate.
-        if len(list(filter(lambda x: x == entry, log))) > 0:
+        # Ignore if this is a duplicate. Fall back to comparing the entry against
+        # the existing entries if the entry cannot be fingerprinted.
+        fingerprint = self._get_log_entry_fingerprint(entry)
+
+        if fingerprint in log_index or (fingerprint is None and entry in log):
+            return
+
+        # Drop the log entry if the log is at the limit.
+        if self.log_limit is not None and len(log) >= self.log_limit:
+            self._log_dropped[log_name] += 1
             return
 
         # Append the log entry.
         log.append(entry)
 
+        if fingerprint is not None:
+            log_index.add(fingerprint)
+
     def log_error(self, e, task_id=None, route=None, task_transition_id=None):
         self.log_entry(
             'error',
@@ -333,6 +1115,10 @@ class WorkflowConductor(object):
         return copy.deepcopy(self._inputs)
 
     def get_workflow_status(self):
+        # Read the status from the serialized workflow state if it is not yet deserialized.
+        if not self._workflow_state and 'workflow_state' in self._serialized:
+            return self._serialized['workflow_state'].get('status', statuses.UNSET)
+
         return self.workflow_state.status
 
     def _set_workflow_status(self, value):
@@ -366,6 +1152,9 @@ class WorkflowConductor(object):
         return copy.deepcopy(self.workflow_state.contexts[0])
 
     def get_workflow_terminal_context(self):
+        return self._resolve_context(self._get_workflow_terminal_context())
+
+    def _get_workflow_terminal_context(self):
         if self.get_workflow_status() not in statuses.COMPLETED_STATUSES:
             raise exc.WorkflowContextError('Workflow is not in completed status.')
 
@@ -379,7 +1168,7 @@ class WorkflowConductor(object):
         first_term_task = term_tasks[0:1][0]
         other_term_tasks = term_tasks[1:]
 
-        wf_term_ctx = self.get_task_context(first_term_task['ctxs']['in'])
+        wf_term_ctx = self.workflow_state.get_context(first_term_task['ctxs']['in'])
 
         for task in other_term_tasks:
             # Remove the initial context since the first task processed above already
@@ -387,10 +1176,9 @@ class WorkflowConductor(object):
             in_ctx_idxs = copy.deepcopy(task['ctxs']['in'])
             in_ctx_idxs.remove(0)
 
-            wf_term_ctx = dict_util.merge_dicts(
+            wf_term_ctx = self.workflow_state.merge_contexts(
                 wf_term_ctx,
-                self.get_task_context(in_ctx_idxs),
-                overwrite=True
+                self.workflow_state.get_context(in_ctx_idxs)
             )
 
         return wf_term_ctx
@@ -400,8 +1188,8 @@ class WorkflowConductor(object):
 
         # Render workflow outputs if workflow is completed.
         if wf_status in statuses.COMPLETED_STATUSES and not self._outputs:
-            workflow_ctx = self.get_workflow_terminal_context()
-            state_ctx = {'__state': self.workflow_state.serialize()}
+            workflow_ctx = self._get_workflow_terminal_context()
+            state_ctx = {'__state': self.workflow_state.view}
             workflow_ctx = dict_util.merge_dicts(workflow_ctx, state_ctx, True)
             outputs, errors = self.spec.render_output(workflow_ctx)
 
@@ -419,42 +1207,101 @@ class WorkflowConductor(object):
     def get_workflow_output(self):
         return copy.deepcopy(self._outputs) if self._outputs else None
 
-    def _inbound_criteria_satisfied(self, task_id, route):
-        inbounds = self.graph.get_prev_transitions(task_id)
-        inbounds_satisfied = []
-        barrier = 1
+    def _index_joins(self):
+        # The workflow state serialized before the join counters are tracked does not include
+        # the counters so the counters are identified from the latest task state entries.
+        joins = {}
+
+        for task_state_seq_idx in self.workflow_state.tasks.values():
+            task_state_entry = self.workflow_state.sequence[task_state_seq_idx]
+
+            for task_transition in self.frozen_graph.get_next_transitions(task_state_entry['id']):
+                next_task_id, seq_key = task_transition[1], str(task_transition[2])
+                task_transition_id = (
+                    constants.TASK_STATE_TRANSITION_FORMAT %
+                    (next_task_id, seq_key)
+                )
 
-        if self.graph.has_barrier(task_id):
-            barrier = self.graph.get_barrier(task_id)
-            barrier = len(inbounds) if barrier == '*' else barrier
+                if (not self.frozen_graph.has_barrier(next_task_id) or
+                        not task_state_entry['next'].get(task_transition_id)):
+                    continue
 
-        for prev_transition in inbounds:
-            prev_task_state_entry = self.get_task_state_entry(prev_transition[0], route)
+                join_id = constants.TASK_STATE_ROUTE_FORMAT % (
+                    next_task_id,
+                    str(task_state_entry['route'])
+                )
 
-            if prev_task_state_entry:
                 prev_task_transition_id = (
                     constants.TASK_STATE_TRANSITION_FORMAT %
-                    (prev_transition[1], str(prev_transition[2]))
+                    (task_state_entry['id'], seq_key)
                 )
 
-                if (prev_task_transition_id in prev_task_state_entry['next'] and
-                        prev_task_state_entry['next'][prev_task_transition_id]):
-                    inbounds_satisfied.append(prev_task_transition_id)
+                joins.setdefault(join_id, {})[prev_task_transition_id] = True
 
-        return (len(inbounds_satisfied) >= barrier)
+        self.workflow_state.replace_joins(joins)
+
+    def _update_join(self, task_state_entry, task_transition, satisfied):
+        if self.workflow_state.joins is None:
+            self._index_joins()
+
+        prev_task_transition_id = (
+            constants.TASK_STATE_TRANSITION_FORMAT %
+            (task_state_entry['id'], str(task_transition[2]))
+        )
+
+        self.workflow_state.set_join_transition(
+            task_transition[1],
+            task_state_entry['route'],
+            prev_task_transition_id,
+            satisfied
+        )
+
+    def _inbound_criteria_satisfied(self, task_id, route):
+        # The task is checked only after one of its inbound task transitions
+        # is satisfied so the criteria is met if the task is not a join.
+        if not self.frozen_graph.has_barrier(task_id):
+            return True
+
+        if self.workflow_state.joins is None:
+            self._index_joins()
+
+        barrier = self.frozen_graph.get_barrier(task_id)
+
+        if barrier == '*':
+            barrier = len(self.frozen_graph.get_prev_transitions(task_id))
+
+        return self.workflow_state.get_join_count(task_id, route) >= barrier
 
     def get_task(self, task_id, route):
+        task, items = self._get_task(task_id, route)
+
+        # Render the actions for all the items if the task is with items.
+        if items is not None:
+            task['actions'] = list(task['spec'].render_items(task['ctx'], items))
+
+        return self._set_task_state_context(task)
+
+    def _get_task(self, task_id, route):
         try:
-            task_ctx = self.get_task_initial_context(task_id, route)
+            task_ctx = self._get_task_initial_context(task_id, route)
         except ValueError:
             task_ctx = self.get_workflow_initial_context()
 
-        state_ctx = {'__state': self.workflow_state.serialize()}
+        state_ctx = {'__state': self.workflow_state.view}
         current_task = {'id': task_id, 'route': route}
         task_ctx = ctx_util.set_current_task(task_ctx, current_task)
         task_ctx = dict_util.merge_dicts(task_ctx, state_ctx, True)
-        task_spec = self.spec.tasks.get_task(task_id).copy()
-        task_spec, action_specs = task_spec.render(task_ctx)
+        # The task spec is shared by the renders of the task and is not changed by the render.
+        task_spec = self.spec.tasks.get_task(task_id)
+
+        # If the task is with items, only the list of items is evaluated here. The actions
+        # for the items are rendered separately so they can be rendered when scheduled.
+        if task_spec.has_items():
+            items = task_spec.get_items(task_ctx)
+            action_specs = []
+        else:
+            items = None
+            action_specs = task_spec.render(task_ctx).actions
 
         task = {
             'id': task_id,
@@ -480,17 +1327,50 @@ class WorkflowConductor(object):
         if task_spec.has_items():
             items_spec = getattr(task_spec, 'with')
             concurrency = getattr(items_spec, 'concurrency', None)
-            task['items_count'] = len(action_specs)
+            task['items_count'] = len(items)
             task['concurrency'] = expr_base.evaluate(concurrency, task_ctx)
 
+        return task, items
+
+    def _set_task_state_context(self, task):
+        # The workflow state view is only used for evaluating expressions. The task context
+        # returned to the caller includes a copy of the workflow state instead of the view. The
+        # rest of the context is also copied since the rendered task is reused across calls.
+        task_ctx = {k: v for k, v in six.iteritems(task['ctx']) if k != '__state'}
+        task['ctx'] = copy.deepcopy(self._resolve_context(task_ctx))
+        task['ctx']['__state'] = self.workflow_state.serialize()
+
         return task
 
-    def _evaluate_task_actions(self, task):
+    def _render_task_items(self, rendered, item_ids):
+        task = rendered['task']
+        actions = rendered['actions']
+        item_ids_to_render = [i for i in item_ids if i not in actions]
+        state_reads = self.workflow_state.view.reads
+
+        for action_spec in task['spec'].render_items(task['ctx'], rendered['items'],
+                                                     item_ids_to_render):
+            actions[action_spec['item_id']] = action_spec
+
+        # The rendered task is not reused if rendering the items reads the workflow state.
+        if self.workflow_state.view.reads != state_reads:
+            rendered['stateful'] = True
+
+        # Keep only the actions for the items in the current window.
+        rendered['actions'] = {i: actions[i] for i in item_ids}
+
+        return [actions[i] for i in item_ids]
+
+    def _evaluate_task_actions(self, rendered):
+        # Copy the rendered task since the list of actions is
+        # set per the status of the items if the task is with items.
+        task = self._set_task_state_context(dict(rendered['task']))
         task_id = task['id']
         task_route = task['route']
 
         # Return task if it is not with items.
         if not task['spec'].has_items():
+            task['actions'] = copy.deepcopy(task['actions'])
             return task
 
         # Fetch the task entry from staging.
@@ -498,20 +1378,38 @@ class WorkflowConductor(object):
 
         # Prepare the staging task to track items execution status.
         if 'items' not in staged_task or not staged_task['items']:
-            staged_task['items'] = [{'status': statuses.UNSET}] * task['items_count']
+            self.workflow_state.set_staged_task_items(task_id, task_route, task['items_count'])
+
+        items = staged_task['items']
+        items_count = len(items)
+
+        # Move the cursor past the leading items that have already run. The status of an item
+        # is not reset to unset once the item has run so these items are not checked again.
+        cursor = rendered['cursor']
 
-        # Trim the list of actions in the task per concurrency policy.
-        all_items = list(zip(task['actions'], staged_task['items']))
-        notrun_items = list(filter(lambda x: x[1]['status'] == statuses.UNSET, all_items))
-        active_items = list(filter(lambda x: x[1]['status'] in statuses.ACTIVE_STATUSES, all_items))
+        while cursor < items_count and items[cursor]['status'] != statuses.UNSET:
+            cursor += 1
+
+        rendered['cursor'] = cursor
+
+        # Identify the items to run per concurrency policy and render only these items.
+        availability = items_count
 
         if task['concurrency'] is not None:
-            availability = task['concurrency'] - len(active_items)
-            candidates = list(zip(*notrun_items[:availability]))
-            task['actions'] = list(candidates[0]) if candidates and availability > 0 else []
-        else:
-            candidates = list(zip(*notrun_items))
-            task['actions'] = list(candidates[0]) if candidates else []
+            items_status = self.workflow_state.get_staged_task_items_status(task_id, task_route)
+            active_items_count = sum(items_status[s] for s in statuses.ACTIVE_STATUSES)
+            availability = task['concurrency'] - active_items_count
+
+        item_ids = []
+
+        for item_id in range(cursor, items_count):
+            if len(item_ids) >= availability:
+                break
+
+            if items[item_id]['status'] == statuses.UNSET:
+                item_ids.append(item_id)
+
+        task['actions'] = copy.deepcopy(self._render_task_items(rendered, item_ids))
 
         return task
 
@@ -525,7 +1423,7 @@ class WorkflowConductor(object):
                     task_state_entry.get('status') not in statuses.COMPLETED_STATUSES):
                 return []
 
-            outbounds = self.graph.get_next_transitions(task_id)
+            outbounds = self.frozen_graph.get_next_transitions(task_id)
 
             for next_seq in outbounds:
                 next_task_id, seq_key = next_seq[1], next_seq[2]
@@ -550,10 +1448,36 @@ class WorkflowConductor(object):
 
         return False
 
+    def _get_rendered_task(self, staged_task):
+        task_id, route = staged_task['id'], staged_task['route']
+        ctx_idxs = tuple(staged_task['ctxs']['in'])
+        rendered = self._rendered_tasks.get((task_id, route))
+
+        # The rendered task is reused if the task is still staged by the same staging entry and
+        # the list of input contexts has not changed. Otherwise, the task is rendered again. The
+        # task is also rendered again if the expressions in the task read the workflow state.
+        if (rendered is None or rendered['stateful'] or rendered['staged'] is not staged_task or
+                rendered['ctxs'] != ctx_idxs):
+            state_reads = self.workflow_state.view.reads
+            task, items = self._get_task(task_id, route)
+
+            rendered = {
+                'staged': staged_task,
+                'ctxs': ctx_idxs,
+                'task': task,
+                'items': items,
+                'actions': {},
+                'cursor': 0,
+                'stateful': self.workflow_state.view.reads != state_reads
+            }
+
+        return rendered
+
     def get_next_tasks(self):
         fail_on_task_rendering = False
         staged_tasks = self.workflow_state.get_staged_tasks()
         remediation_tasks = []
+        rendered_tasks = {}
         next_tasks = []
 
         # Identify remediation tasks if workflow failed.
@@ -570,8 +1494,9 @@ class WorkflowConductor(object):
         # error one at a time during runtime.
         for staged_task in remediation_tasks or staged_tasks:
             try:
-                next_task = self.get_task(staged_task['id'], staged_task['route'])
-                next_task = self._evaluate_task_actions(next_task)
+                rendered = self._get_rendered_task(staged_task)
+                rendered_tasks[(staged_task['id'], staged_task['route'])] = rendered
+                next_task = self._evaluate_task_actions(rendered)
 
                 if 'actions' in next_task and len(next_task['actions']) > 0:
                     next_tasks.append(next_task)
@@ -582,6 +1507,9 @@ class WorkflowConductor(object):
                 self.log_error(e, task_id=staged_task['id'], route=staged_task['route'])
                 continue
 
+        # Keep only the rendered tasks that are still staged.
+        self._rendered_tasks = rendered_tasks
+
         # Return nothing if there is error(s) on determining next tasks.
         if fail_on_task_rendering:
             self.request_workflow_status(statuses.FAILED)
@@ -603,7 +1531,7 @@ class WorkflowConductor(object):
         return self.workflow_state.sequence[task_state_seq_idx]
 
     def add_task_state(self, task_id, route, in_ctx_idxs=None, prev=None):
-        if not self.graph.has_task(task_id):
+        if not self.frozen_graph.has_task(task_id):
             raise exc.InvalidTask(task_id)
 
         if not in_ctx_idxs:
@@ -620,22 +1548,103 @@ class WorkflowConductor(object):
         }
 
         task_state_entry_id = constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))
+
+        # The task transitions of the task state entry that is replaced are no longer counted.
+        prev_task_state_entry = self.get_task_state_entry(task_id, route)
+
+        if prev_task_state_entry:
+            for task_transition in self.frozen_graph.get_next_transitions(task_id):
+                if self.frozen_graph.has_barrier(task_transition[1]):
+                    self._update_join(prev_task_state_entry, task_transition, False)
+
         self.workflow_state.sequence.append(task_state_entry)
         self.workflow_state.tasks[task_state_entry_id] = len(self.workflow_state.sequence) - 1
 
         return task_state_entry
 
-    def update_task_state(self, task_id, route, event):
-        engine_event_queue = queue.Queue()
-
+    def _check_task_event(self, task_id, event):
         # Throw exception if not expected event type.
         if not issubclass(type(event), events.ExecutionEvent):
             raise TypeError('Event is not type of ExecutionEvent.')
 
         # Throw exception if task does not exist in the workflow graph.
-        if not self.graph.has_task(task_id):
+        if not self.frozen_graph.has_task(task_id):
             raise exc.InvalidTask(task_id)
 
+    def update_task_states(self, task_events):
+        # Check the event types and the tasks of all the events in the batch before any event
+        # is applied so an invalid event does not leave the batch partly applied.
+        for task_id, route, event in task_events:
+            self._check_task_event(task_id, event)
+
+        # An event for a task that is not staged and has no task state entry is only valid if an
+        # earlier event in the batch stages the task. Whether the task is staged is only known
+        # after the earlier events are applied so the conductor is copied to roll back the batch.
+        rollback = None
+
+        for task_id, route, event in task_events:
+            if (not self.workflow_state.get_staged_task(task_id, route) and
+                    not self.get_task_state_entry(task_id, route)):
+                rollback = self._copy_batch_rollback()
+                break
+
+        # The events are applied in order as if they are applied one at a time except
+        # the workflow output is rendered at most once at the end of the batch.
+        try:
+            task_state_entries = [
+                self._update_task_state(task_id, route, event, render_outputs=False)
+                for task_id, route, event in task_events
+            ]
+        except exc.InvalidTaskStateEntry:
+            if rollback:
+                self._apply_batch_rollback(rollback)
+
+            raise
+
+        if self.get_workflow_status() in statuses.COMPLETED_STATUSES:
+            self._render_workflow_outputs()
+
+        self.workflow_state.compact_contexts_on_threshold()
+
+        return task_state_entries
+
+    def _copy_batch_rollback(self):
+        state_attrs = dict(
+            (k, v) for k, v in six.iteritems(self.workflow_state.__dict__)
+            if k not in ['conductor', 'view']
+        )
+
+        return copy.deepcopy({
+            'checkpoint': self._checkpoint,
+            'errors': self._errors,
+            'log': self._log,
+            'log_dropped': self._log_dropped,
+            'outputs': self._outputs,
+            'state': state_attrs
+        })
+
+    def _apply_batch_rollback(self, rollback):
+        self.workflow_state.__dict__.update(rollback['state'])
+        self._checkpoint = rollback['checkpoint']
+        self._errors = rollback['errors']
+        self._log = rollback['log']
+        self._log_dropped = rollback['log_dropped']
+        self._log_index = None
+        self._outputs = rollback['outputs']
+        self._rendered_tasks = {}
+
+    def update_task_state(self, task_id, route, event):
+        self._check_task_event(task_id, event)
+
+        task_state_entry = self._update_task_state(task_id, route, event)
+
+        self.workflow_state.compact_contexts_on_threshold()
+
+        return task_state_entry
+
+    def _update_task_state(self, task_id, route, event, render_outputs=True):
+        engine_event_queue = queue.Queue()
+
         # Try to get the task metadata from staging or task state.
         staged_task = self.workflow_state.get_staged_task(task_id, route)
         task_state_entry = self.get_task_state_entry(task_id, route)
@@ -673,6 +1682,9 @@ class WorkflowConductor(object):
             # Update the index value since a new entry is created.
             task_state_idx = self._get_task_state_idx(task_id, route)
 
+        # Track the task state entry as changed since it is updated in place below.
+        self.workflow_state.mark_task_state_changed(task_state_entry)
+
         # Remove task from staging if task is not with items.
         if event.status and staged_task and 'items' not in staged_task:
             self.workflow_state.remove_staged_task(task_id, route)
@@ -680,8 +1692,13 @@ class WorkflowConductor(object):
         # If action execution is for a task item, then store the execution status for the item.
         if (staged_task and event.status and event.context and
                 'item_id' in event.context and event.context['item_id'] is not None):
-            item_result = {'status': event.status, 'result': event.result}
-            staged_task['items'][event.context['item_id']] = item_result
+            self.workflow_state.update_staged_task_item(
+                task_id,
+                route,
+                event.context['item_id'],
+                event.status,
+                self._store_result(event.result)
+            )
 
         # Log the error if it is a failed execution event.
         if event.status == statuses.FAILED:
@@ -701,7 +1718,7 @@ class WorkflowConductor(object):
 
             # Get task result.
             task_result = (
-                [item.get('result') for item in staged_task.get('items', [])]
+                [self._bind_result(item.get('result')) for item in staged_task.get('items', [])]
                 if staged_task and task_spec.has_items() else event.result
             )
 
@@ -710,12 +1727,12 @@ class WorkflowConductor(object):
 
             # Set current task in the context.
             in_ctx_idxs = task_state_entry['ctxs']['in']
-            in_ctx_val = self.get_task_context(in_ctx_idxs)
+            in_ctx_val = self.workflow_state.get_context(in_ctx_idxs)
             current_task = {'id': task_id, 'route': route, 'result': task_result}
             current_ctx = ctx_util.set_current_task(in_ctx_val, current_task)
 
             # Setup context for evaluating expressions in task transition criteria.
-            state_ctx = {'__state': self.workflow_state.serialize()}
+            state_ctx = {'__state': self.workflow_state.view}
             current_ctx = dict_util.merge_dicts(current_ctx, state_ctx, True)
 
         # Evaluate task transitions if task is completed and status change is not processed.
@@ -724,7 +1741,7 @@ class WorkflowConductor(object):
             staged_next_tasks = []
 
             # Identify task transitions for the current completed task.
-            task_transitions = self.graph.get_next_transitions(task_id)
+            task_transitions = self.frozen_graph.get_next_transitions(task_id)
 
             # Mark task as terminal when there is no transitions.
             if not task_transitions:
@@ -748,17 +1765,25 @@ class WorkflowConductor(object):
                     self.request_workflow_status(statuses.FAILED)
                     continue
 
+                # Count the task transition toward the inbound criteria if the next task is a join.
+                if self.frozen_graph.has_barrier(task_transition[1]):
+                    self._update_join(
+                        task_state_entry,
+                        task_transition,
+                        task_state_entry['next'][task_transition_id]
+                    )
+
                 # If criteria met, then mark the next task staged and calculate outgoing context.
                 if task_state_entry['next'][task_transition_id]:
-                    next_task_node = self.graph.get_task(task_transition[1])
-                    next_task_id = next_task_node['id']
+                    next_task_id = task_transition[1]
                     new_ctx_idx = None
 
-                    # Get and process new context for the task transition.
+                    # Get and process new context for the task transition. The current
+                    # context is not modified when finalizing the context so it is not copied.
                     out_ctx, new_ctx, errors = task_spec.finalize_context(
                         next_task_id,
                         task_transition,
-                        copy.deepcopy(current_ctx)
+                        current_ctx
                     )
 
                     if errors:
@@ -769,6 +1794,10 @@ class WorkflowConductor(object):
                     out_ctx_idxs = copy.deepcopy(task_state_entry['ctxs']['in'])
 
                     if new_ctx:
+                        # Keep the large published values in the result store if provided.
+                        if self.result_store:
+                            new_ctx = dict((k, self._store_result(v)) for k, v in new_ctx.items())
+
                         self.workflow_state.contexts.append(new_ctx)
                         new_ctx_idx = len(self.workflow_state.contexts) - 1
 
@@ -804,6 +1833,7 @@ class WorkflowConductor(object):
 
                         # Add a backref for the current task in the next task.
                         staged_next_task['prev'][backref] = task_state_idx
+                        self.workflow_state.mark_staged_task_changed(next_task_id, next_task_route)
                     else:
                         # Otherwise create a new entry in staging for the next task.
                         staged_next_task = self.workflow_state.add_staged_task(
@@ -816,9 +1846,10 @@ class WorkflowConductor(object):
 
                     # Check if inbound criteria are met. Must use the original route
                     # to identify the inbound task transitions.
-                    staged_next_task['ready'] = self._inbound_criteria_satisfied(
+                    self.workflow_state.set_staged_task_ready(
                         next_task_id,
-                        route
+                        next_task_route,
+                        self._inbound_criteria_satisfied(next_task_id, route)
                     )
 
                     # Put the next task in the engine event queue if it is an engine command.
@@ -847,6 +1878,10 @@ class WorkflowConductor(object):
             if has_manual_fail:
                 for staged_next_task in staged_next_tasks:
                     staged_next_task['run_on_fail'] = True
+                    self.workflow_state.mark_staged_task_changed(
+                        staged_next_task['id'],
+                        staged_next_task['route']
+                    )
 
         # Process the task event using the workflow state machine and update the workflow status.
         task_ex_event = events.TaskExecutionEvent(task_id, route, task_state_entry['status'])
@@ -856,12 +1891,19 @@ class WorkflowConductor(object):
         while not engine_event_queue.empty():
             next_task_id, next_task_route = engine_event_queue.get()
             engine_event = events.ENGINE_EVENT_MAP[next_task_id]
-            self.update_task_state(next_task_id, next_task_route, engine_event())
 
-        # Render workflow output if workflow is completed.
+            if render_outputs:
+                self.update_task_state(next_task_id, next_task_route, engine_event())
+            else:
+                self._update_task_state(next_task_id, next_task_route, engine_event(), False)
+
+        # Render workflow output if workflow is completed. If the task event is applied
+        # as part of a batch, the workflow output is rendered at the end of the batch.
         if self.get_workflow_status() in statuses.COMPLETED_STATUSES:
             task_state_entry['term'] = True
-            self._render_workflow_outputs()
+
+            if render_outputs:
+                self._render_workflow_outputs()
 
         return task_state_entry
 
@@ -873,8 +1915,8 @@ class WorkflowConductor(object):
             (task_transition[0], str(task_transition[2]))
         )
 
-        is_split_task = self.spec.tasks.is_split_task(task_id)
-        is_in_cycle = self.graph.in_cycle(task_id)
+        is_split_task = self.frozen_graph.is_split_task(task_id)
+        is_in_cycle = self.frozen_graph.in_cycle(task_id)
 
         if not is_split_task or is_in_cycle:
             return prev_route
@@ -892,24 +1934,33 @@ class WorkflowConductor(object):
 
         return len(self.workflow_state.routes) - 1
 
-    def get_task_context(self, ctx_idxs):
-        ctx = {}
+    def _store_result(self, value):
+        return self.result_store.store(value) if self.result_store else value
 
-        for ctx_idx in ctx_idxs:
-            ctx = dict_util.merge_dicts(ctx, self.workflow_state.contexts[ctx_idx], overwrite=True)
+    def _bind_result(self, value):
+        return self.result_store.bind(value) if self.result_store else value
 
-        return ctx
+    def _resolve_context(self, ctx):
+        # The merged contexts keep the references to the values in the result store and
+        # the values are loaded when the context is returned to the caller.
+        return result_base.resolve_all(ctx) if self.result_store else ctx
+
+    def get_task_context(self, ctx_idxs):
+        return self._resolve_context(self.workflow_state.get_context(ctx_idxs))
 
     def get_task_initial_context(self, task_id, route):
+        return self._resolve_context(self._get_task_initial_context(task_id, route))
+
+    def _get_task_initial_context(self, task_id, route):
         staged_task = self.workflow_state.get_staged_task(task_id, route)
 
         if staged_task:
-            return self.get_task_context(staged_task['ctxs']['in'])
+            return self.workflow_state.get_context(staged_task['ctxs']['in'])
 
         task_state_entry = self.get_task_state_entry(task_id, route)
 
         if task_state_entry:
-            return self.get_task_context(task_state_entry['ctxs']['in'])
+            return self.workflow_state.get_context(task_state_entry['ctxs']['in'])
 
         raise ValueError('Unable to determine context for task "%s".' % task_id)
 
@@ -921,7 +1972,7 @@ class WorkflowConductor(object):
         if not task_state_entry:
             raise exc.InvalidTaskStateEntry(task_id)
 
-        for t in self.graph.get_next_transitions(task_id):
+        for t in self.frozen_graph.get_next_transitions(task_id):
             task_transition_id = constants.TASK_STATE_TRANSITION_FORMAT % (t[1], str(t[2]))
 
             if (task_transition_id in task_state_entry['next'] and
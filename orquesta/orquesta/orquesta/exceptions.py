@@ -125,3 +125,9 @@ class WorkflowContextError(Exception):
 
 class WorkflowLogEntryError(Exception):
     pass
+
+
+class ResultNotFound(Exception):
+
+    def __init__(self, key):
+        Exception.__init__(self, 'The result "%s" is not found in the result store.' % key)
@@ -16,6 +16,7 @@ import json
 import six
 
 from orquesta import exceptions as exc
+from orquesta.results import base as result_base
 
 
 def json_(s):
@@ -47,6 +48,8 @@ def ctx_(context, key=None):
         if key in context['__vars'] and key.startswith('__'):
             raise exc.VariableInaccessibleError(key)
 
-        return context['__vars'][key]
+        return result_base.resolve(context['__vars'][key])
     else:
-        return {k: v for k, v in six.iteritems(context['__vars']) if not k.startswith('__')}
+        return result_base.resolve_all(
+            {k: v for k, v in six.iteritems(context['__vars']) if not k.startswith('__')}
+        )
@@ -14,6 +14,7 @@
 
 from orquesta import constants
 from orquesta import exceptions as exc
+from orquesta.results import base as result_base
 from orquesta import statuses
 
 
@@ -103,7 +104,7 @@ def completed_(context):
 def result_(context):
     current_task = _get_current_task(context)
 
-    return current_task.get('result')
+    return result_base.resolve_all(current_task.get('result'))
 
 
 def item_(context, key=None):
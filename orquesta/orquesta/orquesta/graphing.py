@@ -13,12 +13,13 @@
 # limitations under the License.
 
 import abc
+import array
+import collections
 import copy
+import importlib
+import itertools
 import logging
 
-import networkx as nx
-from networkx.readwrite import json_graph
-
 import six
 
 from orquesta import exceptions as exc
@@ -27,18 +28,584 @@ from orquesta.utils import dictionary as dict_util
 
 LOG = logging.getLogger(__name__)
 
+_NETWORKX = None
+
+
+def _get_networkx():
+    global _NETWORKX
+
+    # The networkx module is slow to import and is not used by the native
+    # graph backend so the module is imported on first use.
+    if _NETWORKX is None:
+        importlib.import_module('networkx.readwrite.json_graph')
+        _NETWORKX = importlib.import_module('networkx')
+
+    return _NETWORKX
+
+
+def get_strongly_connected_components(successors):
+    # Identify the strongly connected components using the nonrecursive Tarjan algorithm. The
+    # successors is a dict of the list of successors by node which determines the node order.
+    preorder = {}
+    lowlink = {}
+    found = set()
+    scc_queue = []
+    i = 0
+
+    # Keep track of the successors visited so the node is resumed where it left off.
+    visited = {}
+
+    for source in successors:
+        if source in found:
+            continue
+
+        queue = [source]
+
+        while queue:
+            v = queue[-1]
+
+            if v not in preorder:
+                i += 1
+                preorder[v] = i
+                visited[v] = 0
+
+            done = True
+
+            while visited[v] < len(successors[v]):
+                w = successors[v][visited[v]]
+                visited[v] += 1
+
+                if w not in preorder:
+                    queue.append(w)
+                    done = False
+                    break
+
+            if not done:
+                continue
+
+            lowlink[v] = preorder[v]
+
+            for w in successors[v]:
+                if w not in found:
+                    lowlink[v] = min(
+                        lowlink[v],
+                        lowlink[w] if preorder[w] > preorder[v] else preorder[w]
+                    )
+
+            queue.pop()
+
+            if lowlink[v] != preorder[v]:
+                scc_queue.append(v)
+                continue
+
+            scc = {v}
+            found.add(v)
+
+            while scc_queue and preorder[scc_queue[-1]] > preorder[v]:
+                k = scc_queue.pop()
+                found.add(k)
+                scc.add(k)
+
+            yield scc
+
+
+def _get_elementary_circuits(successors, start_node):
+    # Identify the cycles that start at the node using the Johnson algorithm.
+    path = [start_node]
+    blocked = {start_node}
+    closed = set()
+    blocking = collections.defaultdict(set)
+    stack = [(start_node, list(successors[start_node]))]
+
+    while stack:
+        node, nbrs = stack[-1]
+
+        if nbrs:
+            next_node = nbrs.pop()
+
+            if next_node == start_node:
+                yield path[:]
+                closed.update(path)
+            elif next_node not in blocked:
+                path.append(next_node)
+                stack.append((next_node, list(successors[next_node])))
+                closed.discard(next_node)
+                blocked.add(next_node)
+                continue
+
+        if nbrs:
+            continue
+
+        if node in closed:
+            unblocking = {node}
+
+            while unblocking:
+                n = unblocking.pop()
+
+                if n in blocked:
+                    blocked.remove(n)
+                    unblocking.update(blocking[n])
+                    blocking[n].clear()
+        else:
+            for nbr in successors[node]:
+                blocking[nbr].add(node)
+
+        stack.pop()
+        path.pop()
+
+
+@six.add_metaclass(abc.ABCMeta)
+class GraphBackend(object):
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def __len__(self):
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def node(self):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def nodes(self):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def has_node(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_node_data(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def add_node(self, node, **kwargs):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def has_edge(self, source, destination):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_edge_data(self, source, destination, key):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def get_edges(self, source, destination):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def add_edge(self, source, destination, key=None, **kwargs):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def edges(self):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def out_edges(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def in_edges(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def in_degree(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def out_degree(self, node):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def adjacency_data(self):
+        raise NotImplementedError()
+
+    @classmethod
+    @abc.abstractmethod
+    def from_adjacency_data(cls, data):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def successors(self, node):
+        raise NotImplementedError()
+
+    def get_node_attributes(self, attribute):
+        return {n: d[attribute] for n, d in six.iteritems(self.node) if attribute in d}
+
+    def get_edge_attributes(self, attribute):
+        return {(u, v, k): d[attribute] for u, v, k, d in self.edges() if attribute in d}
+
+    def strongly_connected_components(self):
+        return get_strongly_connected_components(
+            dict((n, self.successors(n)) for n in self.nodes())
+        )
+
+    def simple_cycles(self):
+        successors = dict((n, self.successors(n)) for n in self.nodes())
+        components = list(get_strongly_connected_components(successors))
+
+        # Identify the cycles that start at a node of the component then remove the node
+        # and identify the cycles in what remains of the component until there are none.
+        while components:
+            component = components.pop()
+            start_node = component.pop()
+
+            component_successors = dict(
+                (n, [m for m in successors[n] if m in component or m == start_node])
+                for n in component | {start_node}
+            )
+
+            for cycle in _get_elementary_circuits(component_successors, start_node):
+                yield cycle
+
+            component_successors = dict(
+                (n, [m for m in successors[n] if m in component])
+                for n in component
+            )
+
+            components.extend(get_strongly_connected_components(component_successors))
+
+    def _get_edges_by_depth(self, source):
+        # Traverse all the edges reachable from the source node in depth first order.
+        visited_nodes = set()
+        visited_edges = set()
+        edges = {}
+        stack = [source]
+
+        while stack:
+            node = stack[-1]
+
+            if node not in visited_nodes:
+                edges[node] = iter([e[0:3] for e in self.out_edges(node)])
+                visited_nodes.add(node)
+
+            edge = next(edges[node], None)
+
+            if edge is None:
+                stack.pop()
+            elif edge not in visited_edges:
+                visited_edges.add(edge)
+                stack.append(edge[1])
+                yield edge
+
+    def find_cycle(self, source):
+        explored = set()
+
+        for start_node in [n for n in source if self.has_node(n)]:
+            if start_node in explored:
+                continue
+
+            edges = []
+            seen = {start_node}
+            active_nodes = {start_node}
+            previous_node = None
+
+            for edge in self._get_edges_by_depth(start_node):
+                tail, head = edge[0], edge[1]
+
+                # Backtrack the active path to the tail of the edge.
+                if previous_node is not None and tail != previous_node:
+                    while edges:
+                        active_nodes.remove(edges.pop()[1])
+
+                        if edges and edges[-1][1] == tail:
+                            break
+
+                    if not edges:
+                        active_nodes = {tail}
+
+                edges.append(edge)
+
+                if head in active_nodes:
+                    # Remove the edges leading to the cycle from the path.
+                    idx = [e[0] for e in edges].index(head)
+                    return edges[idx:]
+
+                if head in explored:
+                    break
+
+                seen.add(head)
+                active_nodes.add(head)
+                previous_node = head
+
+            explored.update(seen)
+
+        return []
+
+
+class NetworkxGraphBackend(GraphBackend):
+    __slots__ = ('_graph',)
+
+    def __init__(self, graph=None):
+        self._graph = graph if graph is not None else _get_networkx().MultiDiGraph()
+
+    def __len__(self):
+        return len(self._graph)
+
+    @property
+    def node(self):
+        return self._graph.node
+
+    def nodes(self):
+        return self._graph.nodes()
+
+    def has_node(self, node):
+        return self._graph.has_node(node)
+
+    def get_node_data(self, node):
+        return self._graph.node[node]
+
+    def add_node(self, node, **kwargs):
+        self._graph.add_node(node, **kwargs)
+
+    def has_edge(self, source, destination):
+        return self._graph.has_edge(source, destination)
+
+    def get_edge_data(self, source, destination, key):
+        return self._graph[source][destination][key]
+
+    def get_edges(self, source, destination):
+        if not self._graph.has_edge(source, destination):
+            return []
+
+        return [
+            (source, destination, key, data)
+            for key, data in six.iteritems(self._graph[source][destination])
+        ]
+
+    def add_edge(self, source, destination, key=None, **kwargs):
+        self._graph.add_edge(source, destination, key=key, **kwargs)
+
+    def edges(self):
+        return self._graph.edges(data=True, keys=True)
+
+    def out_edges(self, node):
+        return self._graph.out_edges([node], data=True, keys=True)
+
+    def in_edges(self, node):
+        return self._graph.in_edges([node], data=True, keys=True)
+
+    def in_degree(self, node):
+        return self._graph.in_degree(node)
+
+    def out_degree(self, node):
+        return self._graph.out_degree(node)
+
+    def successors(self, node):
+        return self._graph.successors(node)
+
+    def adjacency_data(self):
+        return _get_networkx().readwrite.json_graph.adjacency_data(self._graph)
+
+    @classmethod
+    def from_adjacency_data(cls, data):
+        nx = _get_networkx()
+        g = nx.readwrite.json_graph.adjacency_graph(data, directed=True, multigraph=True)
+
+        return cls(graph=g)
+
+    def get_node_attributes(self, attribute):
+        return _get_networkx().get_node_attributes(self._graph, attribute)
+
+    def get_edge_attributes(self, attribute):
+        return _get_networkx().get_edge_attributes(self._graph, attribute)
+
+    def strongly_connected_components(self):
+        return _get_networkx().strongly_connected_components(self._graph)
+
+    def simple_cycles(self):
+        return _get_networkx().simple_cycles(self._graph)
+
+    def find_cycle(self, source):
+        return _get_networkx().find_cycle(self._graph, source)
+
+
+class NativeGraphNode(object):
+    __slots__ = ('data', 'succ', 'pred')
+
+    def __init__(self, data):
+        # The edges are tuples of source, destination, key, and data. The outbound edges are
+        # kept in lists by destination and only the list of sources are kept for the inbound
+        # edges. The nodes are in the same order as the adjacency of the networkx graph.
+        self.data = data
+        self.succ = {}
+        self.pred = []
+
+
+class NativeGraphBackend(GraphBackend):
+    __slots__ = ('graph', '_nodes')
+
+    def __init__(self):
+        self.graph = {}
+        self._nodes = {}
+
+    def __len__(self):
+        return len(self._nodes)
+
+    @property
+    def node(self):
+        return {n: v.data for n, v in six.iteritems(self._nodes)}
+
+    def nodes(self):
+        return list(self._nodes.keys())
+
+    def has_node(self, node):
+        return node in self._nodes
+
+    def get_node_data(self, node):
+        return self._nodes[node].data
+
+    def add_node(self, node, **kwargs):
+        self._add_node(node, kwargs)
+
+    def _add_node(self, node, data):
+        if node not in self._nodes:
+            self._nodes[node] = NativeGraphNode(data)
+        else:
+            self._nodes[node].data.update(data)
+
+    def has_edge(self, source, destination):
+        return source in self._nodes and destination in self._nodes[source].succ
+
+    def get_edge_data(self, source, destination, key):
+        for edge in self._nodes[source].succ[destination]:
+            if edge[2] == key:
+                return edge[3]
+
+        raise KeyError(key)
+
+    def get_edges(self, source, destination):
+        if not self.has_edge(source, destination):
+            return []
+
+        return list(self._nodes[source].succ[destination])
+
+    def add_edge(self, source, destination, key=None, **kwargs):
+        self._add_edge(source, destination, key, kwargs)
+
+    def _add_edge(self, source, destination, key, data):
+        for node in [source, destination]:
+            if node not in self._nodes:
+                self._nodes[node] = NativeGraphNode({})
+
+        edges = self._nodes[source].succ.get(destination)
+
+        if edges is None:
+            edges = []
+            self._nodes[source].succ[destination] = edges
+            self._nodes[destination].pred.append(source)
+
+        if key is None:
+            keys = set(e[2] for e in edges)
+            key = len(edges)
+
+            while key in keys:
+                key += 1
+
+        for edge in edges:
+            if edge[2] == key:
+                edge[3].update(data)
+                return
+
+        edges.append((source, destination, key, dict(data)))
+
+    def edges(self):
+        return [e for v in six.itervalues(self._nodes) for es in six.itervalues(v.succ) for e in es]
+
+    def out_edges(self, node):
+        if node not in self._nodes:
+            return []
+
+        return [e for es in six.itervalues(self._nodes[node].succ) for e in es]
+
+    def in_edges(self, node):
+        if node not in self._nodes:
+            return []
+
+        return [e for n in self._nodes[node].pred for e in self._nodes[n].succ[node]]
+
+    def in_degree(self, node):
+        return sum(len(self._nodes[n].succ[node]) for n in self._nodes[node].pred)
+
+    def out_degree(self, node):
+        return sum(len(es) for es in six.itervalues(self._nodes[node].succ))
+
+    def successors(self, node):
+        return list(self._nodes[node].succ.keys())
+
+    def adjacency_data(self):
+        # The data is the same as the adjacency data of the networkx graph.
+        data = {
+            'directed': True,
+            'multigraph': True,
+            'graph': list(self.graph.items()),
+            'nodes': [],
+            'adjacency': []
+        }
+
+        for n, v in six.iteritems(self._nodes):
+            data['nodes'].append(dict(itertools.chain(v.data.items(), [('id', n)])))
+
+            data['adjacency'].append([
+                dict(itertools.chain(d.items(), [('id', dst), ('key', k)]))
+                for es in six.itervalues(v.succ) for _, dst, k, d in es
+            ])
+
+        return data
+
+    @classmethod
+    def from_adjacency_data(cls, data):
+        graph = cls()
+        graph.graph = dict(data.get('graph', []))
+        nodes = []
+
+        for node_data in data['nodes']:
+            node_data = node_data.copy()
+            nodes.append(node_data.pop('id'))
+            graph._add_node(nodes[-1], node_data)
+
+        # The edge data includes the id and key like the edge data of the networkx graph.
+        for source, adjacency in zip(nodes, data['adjacency']):
+            for edge_data in adjacency:
+                graph._add_edge(source, edge_data['id'], edge_data.get('key'), edge_data)
+
+        return graph
+
+
+GRAPH_BACKENDS = {
+    'native': NativeGraphBackend,
+    'networkx': NetworkxGraphBackend
+}
+
+
+def get_graph_backend(name):
+    if name not in GRAPH_BACKENDS:
+        raise ValueError('The graph backend "%s" is not supported.' % name)
+
+    return GRAPH_BACKENDS[name]
+
 
 @six.add_metaclass(abc.ABCMeta)
 class WorkflowGraph(object):
 
+    # The name of the graph backend for the new and the deserialized workflow graphs.
+    backend = 'networkx'
+
     def __init__(self, graph=None):
         # self._graph is the graph model for the workflow. The tracking of workflow and task
         # progress and state is separate from the graph model. There are use cases where tasks
         # may be cycled and states overwritten.
-        self._graph = graph if graph else nx.MultiDiGraph()
+        self._graph = graph if graph is not None else get_graph_backend(self.backend)()
+
+        # A networkx graph given as is from before the graph backends is wrapped in the backend.
+        if not isinstance(self._graph, GraphBackend):
+            self._graph = NetworkxGraphBackend(self._graph)
 
     def serialize(self):
-        data = json_graph.adjacency_data(self._graph)
+        data = self._graph.adjacency_data()
 
         data['adjacency'] = [
             sorted(outbounds, key=lambda x: x['id'])
@@ -49,14 +616,14 @@ class WorkflowGraph(object):
 
     @classmethod
     def deserialize(cls, data):
-        g = json_graph.adjacency_graph(copy.deepcopy(data), directed=True, multigraph=True)
+        g = get_graph_backend(cls.backend).from_adjacency_data(copy.deepcopy(data))
         return cls(graph=g)
 
     @staticmethod
     def get_root_nodes(graph):
         nodes = [
-            {'id': n, 'name': graph.node[n].get('name', n)}
-            for n, d in graph.in_degree().items() if d == 0
+            {'id': n, 'name': graph.get_node_data(n).get('name', n)}
+            for n in graph.nodes() if graph.in_degree(n) == 0
         ]
 
         return sorted(nodes, key=lambda x: x['id'])
@@ -65,10 +632,18 @@ class WorkflowGraph(object):
     def roots(self):
         return self.get_root_nodes(self._graph)
 
+    @staticmethod
+    def get_leaf_nodes(graph):
+        nodes = [
+            {'id': n, 'name': graph.get_node_data(n).get('name', n)}
+            for n in graph.nodes() if graph.out_degree(n) == 0
+        ]
+
+        return sorted(nodes, key=lambda x: x['id'])
+
     @property
     def leaves(self):
-        # Reverse the graph using a copy to identify the root nodes.
-        return self.get_root_nodes(self._graph.reverse(copy=True))
+        return self.get_leaf_nodes(self._graph)
 
     def has_tasks(self):
         return len(self._graph) > 0
@@ -81,14 +656,14 @@ class WorkflowGraph(object):
             raise exc.InvalidTask(task_id)
 
         task = {'id': task_id}
-        task.update(copy.deepcopy(self._graph.node[task_id]))
+        task.update(copy.deepcopy(self._graph.get_node_data(task_id)))
 
         return task
 
     def get_task_attributes(self, attribute):
         return dict_util.merge_dicts(
             {n: None for n in self._graph.nodes()},
-            nx.get_node_attributes(self._graph, attribute),
+            self._graph.get_node_attributes(attribute),
             overwrite=True
         )
 
@@ -103,13 +678,10 @@ class WorkflowGraph(object):
             raise exc.InvalidTask(task_id)
 
         for key, value in six.iteritems(kwargs):
-            self._graph.node[task_id][key] = value
+            self._graph.get_node_data(task_id)[key] = value
 
     def has_transition(self, source, destination, **kwargs):
-        edges = filter(
-            lambda e: e[0] == source and e[1] == destination,
-            self._graph.edges(data=True, keys=True)
-        )
+        edges = self._graph.get_edges(source, destination)
 
         for attr, value in six.iteritems(kwargs):
             edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
@@ -118,15 +690,9 @@ class WorkflowGraph(object):
 
     def get_transition(self, source, destination, key=None, **kwargs):
         if key is not None:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination and e[2] == key,
-                self._graph.edges(data=True, keys=True)
-            )
+            edges = filter(lambda e: e[2] == key, self._graph.get_edges(source, destination))
         else:
-            edges = filter(
-                lambda e: e[0] == source and e[1] == destination,
-                self._graph.edges(data=True, keys=True)
-            )
+            edges = self._graph.get_edges(source, destination)
 
             for attr, value in six.iteritems(kwargs):
                 edges = filter(lambda e: e[3].get(attr, None) == value, list(edges))
@@ -142,7 +708,7 @@ class WorkflowGraph(object):
         return edges[0]
 
     def get_transition_attributes(self, attribute):
-        return nx.get_edge_attributes(self._graph, attribute)
+        return self._graph.get_edge_attributes(attribute)
 
     def add_transition(self, source, destination, **kwargs):
         if not self.has_task(source):
@@ -164,17 +730,17 @@ class WorkflowGraph(object):
         seq = self.get_transition(source, destination, key=key)
 
         for attr, value in six.iteritems(kwargs):
-            self._graph[source][destination][seq[2]][attr] = value
+            self._graph.get_edge_data(source, destination, seq[2])[attr] = value
 
     def get_next_transitions(self, task_id):
         return sorted(
-            [e for e in self._graph.out_edges([task_id], data=True, keys=True)],
+            self._graph.out_edges(task_id),
             key=lambda x: x[1]
         )
 
     def get_prev_transitions(self, task_id):
         return sorted(
-            [e for e in self._graph.in_edges([task_id], data=True, keys=True)],
+            self._graph.in_edges(task_id),
             key=lambda x: x[1]
         )
 
@@ -182,7 +748,10 @@ class WorkflowGraph(object):
         self.update_task(task_id, barrier=value)
 
     def get_barrier(self, task_id):
-        return self.get_task(task_id).get('barrier')
+        if not self.has_task(task_id):
+            raise exc.InvalidTask(task_id)
+
+        return self._graph.get_node_data(task_id).get('barrier')
 
     def has_barrier(self, task_id):
         b = self.get_barrier(task_id)
@@ -191,12 +760,15 @@ class WorkflowGraph(object):
 
     def get_cycles(self):
         return [
-            {'tasks': sorted(c), 'route': nx.find_cycle(self._graph, c)}
-            for c in nx.simple_cycles(self._graph)
+            {'tasks': sorted(c), 'route': self._graph.find_cycle(c)}
+            for c in self._graph.simple_cycles()
         ]
 
     def in_cycle(self, task_id):
-        return [c for c in nx.simple_cycles(self._graph) if task_id in c]
+        return [c for c in self._graph.simple_cycles() if task_id in c]
+
+    def freeze(self, is_split_task=None):
+        return FrozenWorkflowGraph(self, is_split_task=is_split_task)
 
     def is_cycle_closed(self, cycle):
         # A cycle is closed, for a lack of better term, if there is no task
@@ -207,3 +779,111 @@ class WorkflowGraph(object):
                     return False
 
         return True
+
+
+class FrozenWorkflowGraph(object):
+
+    def __init__(self, wf_graph, is_split_task=None):
+        graph = wf_graph._graph
+
+        # The tasks are indexed and the attributes of the tasks are kept in vectors by index.
+        self._task_ids = tuple(sorted(graph.nodes()))
+        self._task_idxs = {task_id: idx for idx, task_id in enumerate(self._task_ids)}
+        self._names = tuple(graph.get_node_data(t).get('name', t) for t in self._task_ids)
+        self._barriers = tuple(graph.get_node_data(t).get('barrier') for t in self._task_ids)
+        self._splits = tuple(bool(is_split_task and is_split_task(t)) for t in self._task_ids)
+
+        # The transitions are kept in compressed sparse row format where the transitions of
+        # the task at index i are at offsets[i] to offsets[i + 1] in the list of transitions.
+        self._next_offsets, self._next_transitions = self._compress(
+            [wf_graph.get_next_transitions(t) for t in self._task_ids]
+        )
+
+        self._prev_offsets, self._prev_transitions = self._compress(
+            [wf_graph.get_prev_transitions(t) for t in self._task_ids]
+        )
+
+        # Identify the strongly connected components using the Tarjan algorithm. A task is in a
+        # cycle if the component has more than one task or if the task transitions to itself.
+        components = [0] * len(self._task_ids)
+        cycles = [False] * len(self._task_ids)
+
+        for component_idx, component in enumerate(graph.strongly_connected_components()):
+            for task_id in component:
+                idx = self._task_idxs[task_id]
+                components[idx] = component_idx
+                cycles[idx] = len(component) > 1 or graph.has_edge(task_id, task_id)
+
+        self._components = array.array('l', components)
+        self._cycles = tuple(cycles)
+
+    @staticmethod
+    def _compress(transitions_by_task):
+        offsets = array.array('l', [0])
+        transitions = []
+
+        for task_transitions in transitions_by_task:
+            transitions.extend(task_transitions)
+            offsets.append(len(transitions))
+
+        return offsets, tuple(transitions)
+
+    def _get_task_idx(self, task_id):
+        if task_id not in self._task_idxs:
+            raise exc.InvalidTask(task_id)
+
+        return self._task_idxs[task_id]
+
+    def _get_root_nodes(self, offsets):
+        return [
+            {'id': task_id, 'name': self._names[idx]}
+            for idx, task_id in enumerate(self._task_ids)
+            if offsets[idx] == offsets[idx + 1]
+        ]
+
+    @property
+    def roots(self):
+        return self._get_root_nodes(self._prev_offsets)
+
+    @property
+    def leaves(self):
+        return self._get_root_nodes(self._next_offsets)
+
+    def has_tasks(self):
+        return len(self._task_ids) > 0
+
+    def has_task(self, task_id):
+        return task_id in self._task_idxs
+
+    def get_component(self, task_id):
+        return self._components[self._get_task_idx(task_id)]
+
+    def in_cycle(self, task_id):
+        return task_id in self._task_idxs and self._cycles[self._task_idxs[task_id]]
+
+    def is_split_task(self, task_id):
+        return task_id in self._task_idxs and self._splits[self._task_idxs[task_id]]
+
+    def get_barrier(self, task_id):
+        return self._barriers[self._get_task_idx(task_id)]
+
+    def has_barrier(self, task_id):
+        b = self.get_barrier(task_id)
+
+        return (b is not None and b != '')
+
+    def get_next_transitions(self, task_id):
+        if task_id not in self._task_idxs:
+            return ()
+
+        idx = self._task_idxs[task_id]
+
+        return self._next_transitions[self._next_offsets[idx]:self._next_offsets[idx + 1]]
+
+    def get_prev_transitions(self, task_id):
+        if task_id not in self._task_idxs:
+            return ()
+
+        idx = self._task_idxs[task_id]
+
+        return self._prev_transitions[self._prev_offsets[idx]:self._prev_offsets[idx + 1]]
@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
+import six
 
 from orquesta import events
 from orquesta import exceptions as exc
@@ -443,6 +443,183 @@ TASK_STATE_MACHINE_DATA = {
 }
 
 
+# Bit flags for the context of the task or workflow execution that is attached to an event.
+TASK_ACTIVE = 1 << 0
+ITEMS_INCOMPLETE = 1 << 1
+ITEMS_PAUSED = 1 << 2
+ITEMS_CANCELED = 1 << 3
+ITEMS_FAILED = 1 << 4
+WORKFLOW_ACTIVE = 1 << 5
+WORKFLOW_INCOMPLETE = 1 << 6
+WORKFLOW_PAUSED = 1 << 7
+WORKFLOW_CANCELED = 1 << 8
+
+# Statuses of the action execution on an item that require the context of the other items.
+ACTION_ITEMS_EVENT_STATUSES = frozenset([
+    statuses.RESUMING,
+    statuses.PENDING,
+    statuses.PAUSED,
+    statuses.SUCCEEDED,
+    statuses.FAILED,
+    statuses.EXPIRED,
+    statuses.ABANDONED,
+    statuses.CANCELED
+])
+
+ACTION_EVENTS = frozenset(events.ACTION_EXECUTION_EVENTS + events.ENGINE_OPERATION_EVENTS)
+TASK_EVENTS = frozenset(events.TASK_EXECUTION_EVENTS)
+TASK_CONDITIONAL_EVENTS = frozenset(events.TASK_CONDITIONAL_EVENTS)
+WORKFLOW_EVENTS = frozenset(events.WORKFLOW_EXECUTION_EVENTS)
+
+
+def get_item_status_flags(status):
+    flags = 0
+
+    if status in statuses.ACTIVE_STATUSES:
+        flags |= TASK_ACTIVE
+
+    if status not in statuses.COMPLETED_STATUSES:
+        flags |= ITEMS_INCOMPLETE
+
+    if status in [statuses.PENDING, statuses.PAUSED]:
+        flags |= ITEMS_PAUSED
+
+    if status == statuses.CANCELED:
+        flags |= ITEMS_CANCELED
+
+    if status in statuses.ABENDED_STATUSES:
+        flags |= ITEMS_FAILED
+
+    return flags
+
+
+# Context flags contributed by each status of the items of a task.
+ITEM_STATUS_FLAGS = dict(
+    (status, get_item_status_flags(status))
+    for status in statuses.ALL_STATUSES
+)
+
+
+def get_flag_combinations(*flags):
+    combinations = [0]
+
+    for flag in flags:
+        combinations += [combination | flag for combination in combinations]
+
+    return combinations
+
+
+def get_action_event_context(flags):
+    # Attach info on whether task is still active or dormant.
+    if flags & TASK_ACTIVE:
+        context = '_task_active'
+    else:
+        context = '_task_dormant'
+
+        # Attach info on whether there are paused, canceled, or failed execution on the items.
+        if flags & ITEMS_PAUSED:
+            return context + '_items_paused'
+
+        if flags & ITEMS_CANCELED:
+            return context + '_items_canceled'
+
+        if flags & ITEMS_FAILED:
+            return context + '_items_failed'
+
+    # If items are not paused, canceled, or failed, then attach info on whether
+    # there are items that are not in one of the completed statuses.
+    return context + ('_items_incomplete' if flags & ITEMS_INCOMPLETE else '_items_completed')
+
+
+def get_task_workflow_event_context(flags):
+    context = '_task_active' if flags & TASK_ACTIVE else '_task_dormant'
+    return context + ('_items_incomplete' if flags & ITEMS_INCOMPLETE else '_items_completed')
+
+
+def get_task_event_context(event_name, flags):
+    context = '_workflow_active' if flags & WORKFLOW_ACTIVE else '_workflow_dormant'
+
+    if event_name not in [events.TASK_SUCCEEDED, events.TASK_REMEDIATED]:
+        return context
+
+    # Cancelation has precedence over other status, follow by pause, running, then completion.
+    if flags & WORKFLOW_CANCELED:
+        return context + '_canceled'
+
+    if flags & WORKFLOW_PAUSED:
+        return context + '_paused'
+
+    if flags & WORKFLOW_INCOMPLETE:
+        return context + '_incomplete'
+
+    return context + '_completed'
+
+
+def compile_event_names(event_names, flag_combinations, get_context):
+    return dict(
+        ((event_name, flags), event_name + get_context(flags))
+        for event_name in event_names
+        for flags in flag_combinations
+    )
+
+
+def compile_transitions(state_machine_data):
+    # Flatten the state machine data into a lookup table keyed by status and event.
+    return dict(
+        ((status, event_name), new_status)
+        for status, transitions in six.iteritems(state_machine_data)
+        for event_name, new_status in six.iteritems(transitions)
+    )
+
+
+def compile_valid_transitions(state_machine_data):
+    # Include the transitions from a status to the same status which are always valid.
+    valid_transitions = set((status, status) for status in state_machine_data)
+
+    valid_transitions.update(
+        (status, new_status)
+        for status, transitions in six.iteritems(state_machine_data)
+        for new_status in transitions.values()
+    )
+
+    return frozenset(valid_transitions)
+
+
+ACTION_EVENT_NAMES = compile_event_names(
+    ['action_%s' % status for status in ACTION_ITEMS_EVENT_STATUSES],
+    get_flag_combinations(
+        TASK_ACTIVE,
+        ITEMS_INCOMPLETE,
+        ITEMS_PAUSED,
+        ITEMS_CANCELED,
+        ITEMS_FAILED
+    ),
+    get_action_event_context
+)
+
+TASK_WORKFLOW_EVENT_NAMES = compile_event_names(
+    ['workflow_%s' % status for status in statuses.PAUSE_STATUSES + statuses.CANCEL_STATUSES],
+    get_flag_combinations(TASK_ACTIVE, ITEMS_INCOMPLETE),
+    get_task_workflow_event_context
+)
+
+TASK_EVENT_NAMES = dict(
+    ((event_name, flags), event_name + get_task_event_context(event_name, flags))
+    for event_name in TASK_CONDITIONAL_EVENTS
+    for flags in get_flag_combinations(
+        WORKFLOW_ACTIVE,
+        WORKFLOW_INCOMPLETE,
+        WORKFLOW_PAUSED,
+        WORKFLOW_CANCELED
+    )
+)
+
+TASK_STATE_MACHINE_TRANSITIONS = compile_transitions(TASK_STATE_MACHINE_DATA)
+TASK_STATE_MACHINE_VALID_TRANSITIONS = compile_valid_transitions(TASK_STATE_MACHINE_DATA)
+WORKFLOW_STATE_MACHINE_TRANSITIONS = compile_transitions(WORKFLOW_STATE_MACHINE_DATA)
+WORKFLOW_STATE_MACHINE_VALID_TRANSITIONS = compile_valid_transitions(WORKFLOW_STATE_MACHINE_DATA)
+
+
 class TaskStateMachine(object):
 
     @classmethod
@@ -459,69 +636,45 @@ class TaskStateMachine(object):
         if not statuses.is_valid(new_status):
             raise exc.InvalidStatus(new_status)
 
-        if old_status not in TASK_STATE_MACHINE_DATA.keys():
-            return False
+        return (old_status, new_status) in TASK_STATE_MACHINE_VALID_TRANSITIONS
 
-        if old_status == new_status or new_status in TASK_STATE_MACHINE_DATA[old_status].values():
-            return True
+    @staticmethod
+    def _get_items_flags(items_status):
+        flags = 0
 
-        return False
+        for status, count in six.iteritems(items_status):
+            if count > 0:
+                flags |= ITEM_STATUS_FLAGS.get(status, 0)
+
+        return flags
 
     @classmethod
     def add_context_to_action_event(cls, workflow_state, task_id, task_route, ac_ex_event):
         action_event = ac_ex_event.name
 
-        requirements = [
-            statuses.RESUMING,
-            statuses.PENDING,
-            statuses.PAUSED,
-            statuses.SUCCEEDED,
-            statuses.FAILED,
-            statuses.EXPIRED,
-            statuses.ABANDONED,
-            statuses.CANCELED
-        ]
-
-        if (ac_ex_event.status in requirements and
+        if (ac_ex_event.status in ACTION_ITEMS_EVENT_STATUSES and
                 ac_ex_event.context and 'item_id' in ac_ex_event.context):
-            # Make a copy of the items and remove current item under evaluation.
+            # Get the count of items by status and remove current item under evaluation.
             staged_task = workflow_state.get_staged_task(task_id, task_route)
-            items = copy.deepcopy(staged_task['items'])
-            del items[ac_ex_event.context['item_id']]
-            items_status = [item['status'] for item in items]
-
-            # Assess various situations.
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
-            paused = list(filter(lambda x: x in [statuses.PENDING, statuses.PAUSED], items_status))
-            canceled = list(filter(lambda x: x == statuses.CANCELED, items_status))
-            failed = list(filter(lambda x: x in statuses.ABENDED_STATUSES, items_status))
-
-            # Attach info on whether task is still active or dormant.
-            action_event += '_task_active' if active else '_task_dormant'
+            item = staged_task['items'][ac_ex_event.context['item_id']]
+            items_status = workflow_state.get_staged_task_items_status(task_id, task_route)
+            items_status[item['status']] -= 1
 
-            # Attach info on whether there are paused execution on the items and return.
-            if not active and paused:
-                return action_event + '_items_paused'
+            # Assess whether items are active, incomplete, paused, canceled, or failed.
+            flags = cls._get_items_flags(items_status)
 
-            # Attach info on whether there are canceled execution on the items and return.
-            if not active and canceled:
-                return action_event + '_items_canceled'
+            # Look up the event name with the context attached.
+            if (action_event, flags) in ACTION_EVENT_NAMES:
+                return ACTION_EVENT_NAMES[(action_event, flags)]
 
-            # Attach info on whether there are failed execution on the items and return.
-            if not active and failed:
-                return action_event + '_items_failed'
-
-            # If items are not paused, canceled, or failed, then attach info on whether
-            # there are items that are not in one of the completed statuses.
-            return action_event + ('_items_incomplete' if incomplete else '_items_completed')
+            return action_event + get_action_event_context(flags)
 
         return action_event
 
     @classmethod
     def process_action_event(cls, workflow_state, task_state, ac_ex_event):
         # Check if event is valid.
-        if ac_ex_event.name not in events.ACTION_EXECUTION_EVENTS + events.ENGINE_OPERATION_EVENTS:
+        if ac_ex_event.name not in ACTION_EVENTS:
             raise exc.InvalidEvent(ac_ex_event.name)
 
         # Append additional task context to the event.
@@ -532,26 +685,7 @@ class TaskStateMachine(object):
             ac_ex_event
         )
 
-        # Identify current task status.
-        current_task_status = task_state.get('status', statuses.UNSET)
-
-        if current_task_status is None:
-            current_task_status = statuses.UNSET
-
-        if current_task_status not in statuses.ALL_STATUSES:
-            raise exc.InvalidStatus(current_task_status)
-
-        if current_task_status not in TASK_STATE_MACHINE_DATA:
-            raise exc.InvalidTaskStatusTransition(current_task_status, event_name)
-
-        # If no transition is identified, then there is no status change.
-        if event_name not in TASK_STATE_MACHINE_DATA[current_task_status]:
-            return
-
-        new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
-
-        # Assign new status to the task flow entry.
-        task_state['status'] = new_task_status
+        cls.process_transition(workflow_state, task_state, event_name)
 
     @classmethod
     def add_context_to_workflow_event(cls, workflow_state, task_id, task_route, wf_ex_event):
@@ -560,18 +694,20 @@ class TaskStateMachine(object):
         staged_task = workflow_state.get_staged_task(task_id, task_route)
 
         if wf_ex_event.status in requirements and staged_task and 'items' in staged_task:
-            items_status = [item['status'] for item in staged_task['items']]
-            active = list(filter(lambda x: x in statuses.ACTIVE_STATUSES, items_status))
-            incomplete = list(filter(lambda x: x not in statuses.COMPLETED_STATUSES, items_status))
-            workflow_event += '_task_active' if active else '_task_dormant'
-            workflow_event += '_items_incomplete' if incomplete else '_items_completed'
+            items_status = workflow_state.get_staged_task_items_status(task_id, task_route)
+            flags = cls._get_items_flags(items_status) & (TASK_ACTIVE | ITEMS_INCOMPLETE)
+
+            if (workflow_event, flags) in TASK_WORKFLOW_EVENT_NAMES:
+                return TASK_WORKFLOW_EVENT_NAMES[(workflow_event, flags)]
+
+            return workflow_event + get_task_workflow_event_context(flags)
 
         return workflow_event
 
     @classmethod
     def process_workflow_event(cls, workflow_state, task_state, wf_ex_event):
         # Check if event is valid.
-        if wf_ex_event.name not in events.WORKFLOW_EXECUTION_EVENTS:
+        if wf_ex_event.name not in WORKFLOW_EVENTS:
             raise exc.InvalidEvent(wf_ex_event.name)
 
         # Append additional task context to the event.
@@ -582,26 +718,39 @@ class TaskStateMachine(object):
             wf_ex_event
         )
 
+        cls.process_transition(workflow_state, task_state, event_name)
+
+    @classmethod
+    def process_transition(cls, workflow_state, task_state, event_name):
         # Identify current task status.
         current_task_status = task_state.get('status', statuses.UNSET)
 
         if current_task_status is None:
             current_task_status = statuses.UNSET
 
-        if current_task_status not in statuses.ALL_STATUSES:
-            raise exc.InvalidStatus(current_task_status)
-
+        # The list of statuses is only checked if the status is not in the state machine.
         if current_task_status not in TASK_STATE_MACHINE_DATA:
+            if current_task_status not in statuses.ALL_STATUSES:
+                raise exc.InvalidStatus(current_task_status)
+
             raise exc.InvalidTaskStatusTransition(current_task_status, event_name)
 
         # If no transition is identified, then there is no status change.
-        if event_name not in TASK_STATE_MACHINE_DATA[current_task_status]:
-            return
+        new_task_status = TASK_STATE_MACHINE_TRANSITIONS.get((current_task_status, event_name))
 
-        new_task_status = TASK_STATE_MACHINE_DATA[current_task_status][event_name]
+        if new_task_status is None:
+            return
 
         # Assign new status to the task flow entry.
-        task_state['status'] = new_task_status
+        cls.set_task_status(workflow_state, task_state, new_task_status)
+
+    @classmethod
+    def set_task_status(cls, workflow_state, task_state, status):
+        # Update the status thru the workflow state so it can keep track of task statuses.
+        if workflow_state is None:
+            task_state['status'] = status
+        else:
+            workflow_state.update_task_status(task_state, status)
 
     @classmethod
     def process_event(cls, workflow_state, task_state, event):
@@ -636,14 +785,7 @@ class WorkflowStateMachine(object):
         if not statuses.is_valid(new_status):
             raise exc.InvalidStatus(new_status)
 
-        if old_status not in WORKFLOW_STATE_MACHINE_DATA.keys():
-            return False
-
-        if (old_status == new_status or
-                new_status in WORKFLOW_STATE_MACHINE_DATA[old_status].values()):
-            return True
-
-        return False
+        return (old_status, new_status) in WORKFLOW_STATE_MACHINE_VALID_TRANSITIONS
 
     @classmethod
     def add_context_to_task_event(cls, workflow_state, tk_ex_event):
@@ -662,28 +804,24 @@ class WorkflowStateMachine(object):
         # status determine whether the workflow reached final status or still in progress.
         # For example, if the workflow is being canceled and there are other active
         # tasks, the workflow should be set to canceling.
-        if task_event in events.TASK_CONDITIONAL_EVENTS:
-            task_event += '_workflow_active' if has_active_tasks else '_workflow_dormant'
+        if task_event not in TASK_CONDITIONAL_EVENTS:
+            return task_event
+
+        flags = WORKFLOW_ACTIVE if has_active_tasks else 0
 
         # When a task succeeded, additional information need to be included in the
         # event to determine whether the workflow is still running, completed, or
         # it needs to be paused or canceled. Cancelation has precedence over other
         # status, follow by pause, running, then completion.
+        if task_event in [events.TASK_SUCCEEDED, events.TASK_REMEDIATED]:
+            if workflow_state.has_canceling_tasks or workflow_state.has_canceled_tasks:
+                flags |= WORKFLOW_CANCELED
+            elif workflow_state.has_pausing_tasks or workflow_state.has_paused_tasks:
+                flags |= WORKFLOW_PAUSED
+            elif workflow_state.has_staged_tasks or has_next_tasks:
+                flags |= WORKFLOW_INCOMPLETE
 
-        if (not task_event.startswith(events.TASK_SUCCEEDED) and
-                not task_event.startswith(events.TASK_REMEDIATED)):
-            return task_event
-
-        if workflow_state.has_canceling_tasks or workflow_state.has_canceled_tasks:
-            return task_event + '_canceled'
-
-        if workflow_state.has_pausing_tasks or workflow_state.has_paused_tasks:
-            return task_event + '_paused'
-
-        if workflow_state.has_staged_tasks or has_next_tasks:
-            return task_event + '_incomplete'
-
-        return task_event + '_completed'
+        return TASK_EVENT_NAMES[(task_event, flags)]
 
     @classmethod
     def process_task_event(cls, workflow_state, tk_ex_event):
@@ -691,27 +829,10 @@ class WorkflowStateMachine(object):
         event_name = cls.add_context_to_task_event(workflow_state, tk_ex_event)
 
         # Check if event is valid.
-        if event_name not in events.TASK_EXECUTION_EVENTS:
+        if event_name not in TASK_EVENTS:
             raise exc.InvalidEvent(event_name)
 
-        # Capture current workflow status.
-        current_workflow_status = workflow_state.status
-        new_workflow_status = current_workflow_status
-
-        # Check if the current workflow status can be transitioned.
-        if current_workflow_status not in WORKFLOW_STATE_MACHINE_DATA:
-            raise exc.InvalidWorkflowStatusTransition(current_workflow_status, event_name)
-
-        # If the current workflow status can be transitioned and there is no match on the
-        # event, then there is not status transition.
-        if event_name not in WORKFLOW_STATE_MACHINE_DATA[current_workflow_status]:
-            return
-
-        new_workflow_status = WORKFLOW_STATE_MACHINE_DATA[current_workflow_status][event_name]
-
-        # Assign new workflow status if there is change.
-        if current_workflow_status != new_workflow_status:
-            workflow_state.status = new_workflow_status
+        cls.process_transition(workflow_state, event_name)
 
     @classmethod
     def add_context_to_workflow_event(cls, workflow_state, wf_ex_event):
@@ -742,12 +863,15 @@ class WorkflowStateMachine(object):
         event_name = cls.add_context_to_workflow_event(workflow_state, wf_ex_event)
 
         # Check if event is valid.
-        if event_name not in events.WORKFLOW_EXECUTION_EVENTS:
+        if event_name not in WORKFLOW_EVENTS:
             raise exc.InvalidEvent(event_name)
 
+        cls.process_transition(workflow_state, event_name)
+
+    @classmethod
+    def process_transition(cls, workflow_state, event_name):
         # Capture current workflow status.
         current_workflow_status = workflow_state.status
-        new_workflow_status = current_workflow_status
 
         # Check if the current workflow status can be transitioned.
         if current_workflow_status not in WORKFLOW_STATE_MACHINE_DATA:
@@ -755,13 +879,12 @@ class WorkflowStateMachine(object):
 
         # If the current workflow status can be transitioned and there is no match on the
         # event, then there is not status transition.
-        if event_name not in WORKFLOW_STATE_MACHINE_DATA[current_workflow_status]:
-            return
-
-        new_workflow_status = WORKFLOW_STATE_MACHINE_DATA[current_workflow_status][event_name]
+        new_workflow_status = WORKFLOW_STATE_MACHINE_TRANSITIONS.get(
+            (current_workflow_status, event_name)
+        )
 
         # Assign new workflow status if there is change.
-        if current_workflow_status != new_workflow_status:
+        if new_workflow_status is not None and current_workflow_status != new_workflow_status:
             workflow_state.status = new_workflow_status
 
     @classmethod
@@ -0,0 +1,195 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import abc
+import json
+import logging
+import six
+import uuid
+
+from orquesta.utils import dictionary as dict_util
+from orquesta.utils import plugin as plugin_util
+
+
+LOG = logging.getLogger(__name__)
+
+RESULT_REF_KEY = '__result_ref'
+
+
+def get_result_store(name, *args, **kwargs):
+    return plugin_util.get_instance('orquesta.results', name, *args, **kwargs)
+
+
+def is_result_ref(value):
+    return isinstance(value, dict) and len(value) == 1 and RESULT_REF_KEY in value
+
+
+def is_bound_ref(value):
+    return isinstance(value, (ResultRef, MergedResultRef))
+
+
+def resolve(value):
+    return value.load() if is_bound_ref(value) else value
+
+
+def resolve_all(value):
+    # Load the values of the references in the dict or list. The dict or list is copied
+    # if there is any reference so the merged contexts that keep the references are not changed.
+    if isinstance(value, dict):
+        if not any(is_bound_ref(v) for v in six.itervalues(value)):
+            return value
+
+        return dict((k, resolve(v)) for k, v in six.iteritems(value))
+
+    if isinstance(value, list):
+        if not any(is_bound_ref(v) for v in value):
+            return value
+
+        return [resolve(v) for v in value]
+
+    return resolve(value)
+
+
+def merge_contexts(left, right):
+    # Merge the contexts like merge_dicts. Whether a stored value is a dict is not known until
+    # the value is loaded so a reference and a dict or another reference under the same key are
+    # merged when the merged value is read. The other values are merged as usual.
+    merge_types = (dict, ResultRef, MergedResultRef)
+
+    refs = [
+        k for k, v in six.iteritems(right)
+        if k in left and (is_bound_ref(v) or is_bound_ref(left[k])) and
+        isinstance(v, merge_types) and isinstance(left[k], merge_types)
+    ]
+
+    if not refs:
+        return dict_util.merge_dicts(left, right, overwrite=True, copy_on_write=True)
+
+    ctx = dict_util.merge_dicts(
+        left,
+        dict((k, v) for k, v in six.iteritems(right) if k not in refs),
+        overwrite=True,
+        copy_on_write=True
+    )
+
+    for key in refs:
+        ctx[key] = MergedResultRef(left[key], right[key])
+
+    return ctx
+
+
+class ResultRef(object):
+    # The reference is bound to the result store and loads the value when it is read. Unlike the
+    # reference kept in the workflow state, it is not a dict so it is not mistaken for a dict
+    # when the contexts are merged. The value is not kept after it is loaded so the merged
+    # contexts stay small.
+
+    def __init__(self, store, key):
+        self.store = store
+        self.key = key
+
+    def load(self):
+        return json.loads(self.store.get(self.key))
+
+    def __repr__(self):
+        return '<ResultRef %s>' % self.key
+
+
+class MergedResultRef(object):
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def load(self):
+        left = resolve(self.left)
+        right = resolve(self.right)
+
+        if not isinstance(left, dict) or not isinstance(right, dict):
+            return right
+
+        return dict_util.merge_dicts(left, right, overwrite=True, copy_on_write=True)
+
+    def __repr__(self):
+        return '<MergedResultRef %r %r>' % (self.left, self.right)
+
+
+@six.add_metaclass(abc.ABCMeta)
+class ResultStore(object):
+
+    # Results that are serialized to JSON text larger than the threshold are
+    # kept in the store and replaced with a reference in the workflow state.
+    size_threshold = 65536
+
+    def __init__(self, size_threshold=None):
+        if size_threshold is not None:
+            self.size_threshold = size_threshold
+
+    @abc.abstractmethod
+    def get(self, key):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def put(self, key, data):
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def delete(self, key):
+        raise NotImplementedError()
+
+    def store(self, value):
+        if value is None:
+            return value
+
+        data = json.dumps(value)
+
+        # A value that has the same layout as a reference is always kept in the store so any
+        # reference in the workflow state is known to be a reference to a stored value.
+        if len(data) <= self.size_threshold and not is_result_ref(value):
+            return value
+
+        key = uuid.uuid4().hex
+        self.put(key, data)
+
+        return {RESULT_REF_KEY: key}
+
+    def load(self, value):
+        if not is_result_ref(value):
+            return value
+
+        return json.loads(self.get(value[RESULT_REF_KEY]))
+
+    def bind(self, value):
+        if not is_result_ref(value):
+            return value
+
+        return ResultRef(self, value[RESULT_REF_KEY])
+
+    def bind_context(self, ctx):
+        refs = [k for k, v in six.iteritems(ctx) if is_result_ref(v)]
+
+        if not refs:
+            return ctx
+
+        # The context is copied since the contexts in the workflow state keep the references.
+        ctx = dict(ctx)
+
+        for key in refs:
+            ctx[key] = self.bind(ctx[key])
+
+        return ctx
+
+    def remove(self, value):
+        if is_result_ref(value):
+            self.delete(value[RESULT_REF_KEY])
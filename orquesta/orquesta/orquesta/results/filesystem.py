@@ -0,0 +1,62 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import logging
+import os
+import six
+
+from orquesta import exceptions as exc
+from orquesta.results import base as result_base
+
+
+LOG = logging.getLogger(__name__)
+
+
+class ResultStore(result_base.ResultStore):
+
+    def __init__(self, path, size_threshold=None):
+        super(ResultStore, self).__init__(size_threshold=size_threshold)
+        self.path = path
+
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def _get_file_path(self, key):
+        return os.path.join(self.path, key + '.json')
+
+    def get(self, key):
+        file_path = self._get_file_path(key)
+
+        if not os.path.isfile(file_path):
+            raise exc.ResultNotFound(key)
+
+        with io.open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def put(self, key, data):
+        file_path = self._get_file_path(key)
+        temp_file_path = file_path + '.tmp'
+
+        # Write to a temp file and rename so a partially written result is never read.
+        with io.open(temp_file_path, 'w', encoding='utf-8') as f:
+            f.write(data if isinstance(data, six.text_type) else data.decode('utf-8'))
+
+        os.rename(temp_file_path, file_path)
+
+    def delete(self, key):
+        file_path = self._get_file_path(key)
+
+        if os.path.isfile(file_path):
+            os.remove(file_path)
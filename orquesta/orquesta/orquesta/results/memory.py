@@ -0,0 +1,40 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from orquesta import exceptions as exc
+from orquesta.results import base as result_base
+
+
+LOG = logging.getLogger(__name__)
+
+
+class ResultStore(result_base.ResultStore):
+
+    def __init__(self, size_threshold=None):
+        super(ResultStore, self).__init__(size_threshold=size_threshold)
+        self._results = {}
+
+    def get(self, key):
+        if key not in self._results:
+            raise exc.ResultNotFound(key)
+
+        return self._results[key]
+
+    def put(self, key, data):
+        self._results[key] = data
+
+    def delete(self, key):
+        self._results.pop(key, None)
@@ -0,0 +1,61 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import sqlite3
+import threading
+
+from orquesta import exceptions as exc
+from orquesta.results import base as result_base
+
+
+LOG = logging.getLogger(__name__)
+
+
+class ResultStore(result_base.ResultStore):
+
+    def __init__(self, database=':memory:', size_threshold=None):
+        super(ResultStore, self).__init__(size_threshold=size_threshold)
+        self.database = database
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.database, check_same_thread=False)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, data TEXT NOT NULL)'
+            )
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM results WHERE key = ?', (key,)).fetchone()
+
+        if row is None:
+            raise exc.ResultNotFound(key)
+
+        return row[0]
+
+    def put(self, key, data):
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (key, data) VALUES (?, ?)',
+                (key, data)
+            )
+
+    def delete(self, key):
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM results WHERE key = ?', (key,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -32,6 +32,10 @@ from orquesta.utils import strings as str_util
 
 LOG = logging.getLogger(__name__)
 
+# The task spec is shared and not changed on rendering. The rendered actions are returned
+# along with the task spec so the task spec does not need to be copied for each render.
+RenderedTask = collections.namedtuple('RenderedTask', ['spec', 'actions'])
+
 
 def isspec(value):
     return inspect.isclass(value) and issubclass(value, Spec)
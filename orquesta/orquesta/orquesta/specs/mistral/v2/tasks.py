@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
 import logging
 import re
@@ -19,7 +20,9 @@ import six
 from six.moves import queue
 
 from orquesta import exceptions as exc
+from orquesta import graphing
 from orquesta.expressions import base as expr_base
+from orquesta.specs import base as spec_base
 from orquesta.specs.mistral.v2 import base as mistral_spec_base
 from orquesta.specs.mistral.v2 import policies as policy_models
 from orquesta.specs import types as spec_types
@@ -142,6 +145,12 @@ class TaskSpec(mistral_spec_base.Spec):
     def has_join(self):
         return hasattr(self, 'join') and self.join
 
+    def get_items(self, in_ctx):
+        raise NotImplementedError('Task with items is not implemented.')
+
+    def render_items(self, in_ctx, items, item_ids=None):
+        raise NotImplementedError('Task with items is not implemented.')
+
     def render(self, in_ctx):
         action_specs = []
 
@@ -155,7 +164,7 @@ class TaskSpec(mistral_spec_base.Spec):
 
         action_specs.append(action_spec)
 
-        return self, action_specs
+        return spec_base.RenderedTask(self, action_specs)
 
     def finalize_context(self, next_task_name, task_transition_meta, in_ctx):
         criteria = task_transition_meta[3].get('criteria') or []
@@ -176,7 +185,7 @@ class TaskSpec(mistral_spec_base.Spec):
         except exc.ExpressionEvaluationException as e:
             errors.append(str(e))
 
-        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True)
+        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True, copy_on_write=True)
 
         for key in list(out_ctx.keys()):
             if key.startswith('__'):
@@ -194,12 +203,53 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
         }
     }
 
+    def __init__(self, *args, **kwargs):
+        super(TaskMappingSpec, self).__init__(*args, **kwargs)
+
+        # The task transitions and cycles are identified on first use since the spec is not
+        # changed after.
+        self._task_transitions = None
+        self._task_cycles = None
+        self._in_cycle = {}
+
     def get_task(self, task_name):
         return self[task_name]
 
+    def _get_task_transitions(self):
+        if self._task_transitions is not None:
+            return self._task_transitions
+
+        # Index the next and previous tasks of each task in one pass over the task specs.
+        next_tasks = {}
+        prev_tasks = collections.defaultdict(list)
+
+        for task_name in self.keys():
+            next_tasks[task_name] = self._get_next_tasks(task_name)
+
+            for next_task in next_tasks[task_name]:
+                prev_tasks[next_task[0]].append((task_name, next_task[1], next_task[2]))
+
+        for task_name in prev_tasks:
+            prev_tasks[task_name].sort(key=lambda x: x[0])
+
+        start_tasks = sorted(
+            [(task_name, None, None) for task_name in self.keys() if task_name not in prev_tasks],
+            key=lambda x: x[0]
+        )
+
+        self._task_transitions = (next_tasks, dict(prev_tasks), start_tasks)
+
+        return self._task_transitions
+
     def get_next_tasks(self, task_name, *args, **kwargs):
+        # Only the transitions for all the conditions are indexed.
+        if kwargs.get('conditions') or task_name not in self:
+            return self._get_next_tasks(task_name, conditions=kwargs.get('conditions'))
+
+        return list(self._get_task_transitions()[0][task_name])
+
+    def _get_next_tasks(self, task_name, conditions=None):
         task_spec = self.get_task(task_name)
-        conditions = kwargs.get('conditions')
 
         if not conditions:
             conditions = [
@@ -223,9 +273,13 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
         return sorted(next_tasks, key=lambda x: x[0])
 
     def get_prev_tasks(self, task_name, *args, **kwargs):
-        prev_tasks = []
         conditions = kwargs.get('conditions')
 
+        if not conditions:
+            return list(self._get_task_transitions()[1].get(task_name, []))
+
+        prev_tasks = []
+
         for name, task_spec in six.iteritems(self):
             for next_task in self.get_next_tasks(name, conditions=conditions):
                 if task_name == next_task[0]:
@@ -236,13 +290,7 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
         return sorted(prev_tasks, key=lambda x: x[0])
 
     def get_start_tasks(self):
-        start_tasks = [
-            (task_name, None, None)
-            for task_name in self.keys()
-            if not self.get_prev_tasks(task_name)
-        ]
-
-        return sorted(start_tasks, key=lambda x: x[0])
+        return list(self._get_task_transitions()[2])
 
     def is_join_task(self, task_name):
         task_spec = self.get_task(task_name)
@@ -255,15 +303,49 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
             len(self.get_prev_tasks(task_name)) > 1
         )
 
+    def _get_task_cycles(self):
+        if self._task_cycles is not None:
+            return self._task_cycles
+
+        # Identify the cycles once from the strongly connected components of the task transitions.
+        successors = collections.OrderedDict(
+            (task_name, [t[0] for t in next_tasks if t[0] in self])
+            for task_name, next_tasks in six.iteritems(self._get_task_transitions()[0])
+        )
+
+        cycles = []
+
+        for component in graphing.get_strongly_connected_components(successors):
+            task_name = next(iter(component))
+
+            # The task in a component by itself is in a cycle only if it transitions to itself.
+            if len(component) > 1 or task_name in successors[task_name]:
+                cycles.append(sorted(component))
+
+        cycle_tasks = set(task_name for cycle in cycles for task_name in cycle)
+        self._task_cycles = (sorted(cycles), cycle_tasks)
+
+        return self._task_cycles
+
+    def get_cycles(self):
+        return [list(cycle) for cycle in self._get_task_cycles()[0]]
+
     def in_cycle(self, task_name):
-        traversed = []
-        q = queue.Queue()
+        # The task that is not in any of the cycles cannot be traversed back to.
+        if task_name not in self._get_task_cycles()[1]:
+            return False
 
-        for task in self.get_next_tasks(task_name):
-            q.put(task[0])
+        if task_name not in self._in_cycle:
+            self._in_cycle[task_name] = self._traverse_cycle(task_name)
 
-        while not q.empty():
-            next_task_name = q.get()
+        return self._in_cycle[task_name]
+
+    def _traverse_cycle(self, task_name):
+        traversed = set()
+        q = collections.deque(task[0] for task in self.get_next_tasks(task_name))
+
+        while q:
+            next_task_name = q.popleft()
 
             # If the next task matches the original task, then it's in a loop.
             if next_task_name == task_name:
@@ -275,19 +357,13 @@ class TaskMappingSpec(mistral_spec_base.MappingSpec):
             if next_task_name in traversed:
                 return False
 
-            for task in self.get_next_tasks(next_task_name):
-                q.put(task[0])
-
-            traversed.append(next_task_name)
+            q.extend(task[0] for task in self.get_next_tasks(next_task_name))
+            traversed.add(next_task_name)
 
         return False
 
     def has_cycles(self):
-        for task_name, task_spec in six.iteritems(self):
-            if self.in_cycle(task_name):
-                return True
-
-        return False
+        return any(self.in_cycle(task_name) for task_name in self._get_task_cycles()[1])
 
     def inspect_context(self, parent=None):
         ctxs = {}
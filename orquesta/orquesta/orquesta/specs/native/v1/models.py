@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
 import copy
 import logging
 import six
@@ -20,7 +21,9 @@ import yaml
 
 from orquesta import events
 from orquesta import exceptions as exc
+from orquesta import graphing
 from orquesta.expressions import base as expr_base
+from orquesta.specs import base as spec_base
 from orquesta.specs.native.v1 import base as native_v1_specs
 from orquesta.specs import types as spec_types
 from orquesta.utils import context as ctx_util
@@ -32,6 +35,9 @@ LOG = logging.getLogger(__name__)
 
 RESERVED_TASK_NAMES = list(events.ENGINE_EVENT_MAP.keys())
 
+# The task specs for the reserved task names are created on first use and shared.
+RESERVED_TASK_SPECS = {}
+
 
 def instantiate(definition):
     return WorkflowSpec(definition)
@@ -171,6 +177,51 @@ class TaskSpec(native_v1_specs.Spec):
     def has_join(self):
         return hasattr(self, 'join') and self.join
 
+    def get_items(self, in_ctx):
+        items_spec = self.get_items_spec()
+
+        items_expr = (
+            items_spec.items.strip() if ' in ' not in items_spec.items
+            else items_spec.items[items_spec.items.index(' in ') + 4:].strip()
+        )
+
+        items = expr_base.evaluate(items_expr, in_ctx)
+
+        if not isinstance(items, list):
+            raise TypeError('The value of "%s" is not type of list.' % items_expr)
+
+        item_keys = (
+            None if ' in ' not in items_spec.items
+            else items_spec.items[:items_spec.items.index(' in ')].replace(' ', '').split(',')
+        )
+
+        if not item_keys:
+            return items
+
+        if len(item_keys) == 1:
+            return [
+                dict(zip(item_keys, list(item))) if isinstance(item, (tuple, list))
+                else {item_keys[0]: item}
+                for item in items
+            ]
+
+        return [
+            dict(zip(item_keys, list(item))) if isinstance(item, (tuple, list)) else item
+            for item in items
+        ]
+
+    def render_items(self, in_ctx, items, item_ids=None):
+        # Render the action spec for the given items only and one item at a time. This allows
+        # the caller to render just the items that are going to be scheduled to run.
+        for item_id in (item_ids if item_ids is not None else range(0, len(items))):
+            item_ctx_value = ctx_util.set_current_item(in_ctx, items[item_id])
+
+            yield {
+                'action': expr_base.evaluate(self.action, item_ctx_value),
+                'input': expr_base.evaluate(getattr(self, 'input', {}), item_ctx_value),
+                'item_id': item_id
+            }
+
     def render(self, in_ctx):
         action_specs = []
 
@@ -182,43 +233,13 @@ class TaskSpec(native_v1_specs.Spec):
 
             action_specs.append(action_spec)
         else:
-            items_spec = self.get_items_spec()
-
-            items_expr = (
-                items_spec.items.strip() if ' in ' not in items_spec.items
-                else items_spec.items[items_spec.items.index(' in ') + 4:].strip()
-            )
-
-            items = expr_base.evaluate(items_expr, in_ctx)
-
-            if not isinstance(items, list):
-                raise TypeError('The value of "%s" is not type of list.' % items_expr)
-
-            item_keys = (
-                None if ' in ' not in items_spec.items
-                else items_spec.items[:items_spec.items.index(' in ')].replace(' ', '').split(',')
-            )
-
-            for idict_util, item in enumerate(items):
-                if item_keys and (isinstance(item, tuple) or isinstance(item, list)):
-                    item = dict(zip(item_keys, list(item)))
-                elif item_keys and len(item_keys) == 1:
-                    item = {item_keys[0]: item}
-
-                item_ctx_value = ctx_util.set_current_item(in_ctx, item)
+            action_specs.extend(self.render_items(in_ctx, self.get_items(in_ctx)))
 
-                action_spec = {
-                    'action': expr_base.evaluate(self.action, item_ctx_value),
-                    'input': expr_base.evaluate(getattr(self, 'input', {}), item_ctx_value),
-                    'item_id': idict_util
-                }
-
-                action_specs.append(action_spec)
-
-        return self, action_specs
+        return spec_base.RenderedTask(self, action_specs)
 
     def finalize_context(self, next_task_name, task_transition_meta, in_ctx):
-        rolling_ctx = copy.deepcopy(in_ctx)
+        # Only the top level of the context is changed so a shallow copy is sufficient.
+        rolling_ctx = dict(in_ctx)
         new_ctx = {}
         errors = []
 
@@ -238,7 +259,7 @@ class TaskSpec(native_v1_specs.Spec):
                 except exc.ExpressionEvaluationException as e:
                     errors.append(e)
 
-        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True)
+        out_ctx = dict_util.merge_dicts(in_ctx, new_ctx, overwrite=True, copy_on_write=True)
 
         for key in list(out_ctx.keys()):
             if key.startswith('__'):
@@ -256,6 +277,14 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
         }
     }
 
+    def __init__(self, *args, **kwargs):
+        super(TaskMappingSpec, self).__init__(*args, **kwargs)
+
+        # The task transitions and cycles are identified on first use since the spec is not
+        # changed after.
+        self._task_transitions = None
+        self._task_cycles = None
+
     def has_task(self, task_name):
         if task_name in RESERVED_TASK_NAMES:
             return True
@@ -264,11 +293,49 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
 
     def get_task(self, task_name):
         if task_name in RESERVED_TASK_NAMES:
-            return TaskSpec({'name': task_name})
+            if task_name not in RESERVED_TASK_SPECS:
+                RESERVED_TASK_SPECS[task_name] = TaskSpec({'name': task_name})
+
+            return RESERVED_TASK_SPECS[task_name]
 
         return self[task_name]
 
+    def _get_task_transitions(self):
+        if self._task_transitions is not None:
+            return self._task_transitions
+
+        # Index the next and previous tasks of each task in one pass over the task specs.
+        next_tasks = {}
+        prev_tasks = collections.defaultdict(list)
+
+        for task_name in self.keys():
+            next_tasks[task_name] = self._get_next_tasks(task_name)
+
+            for next_task in next_tasks[task_name]:
+                prev_tasks[next_task[0]].append((task_name, next_task[1], next_task[2]))
+
+        for task_name in prev_tasks:
+            prev_tasks[task_name].sort(key=lambda x: x[0])
+
+        start_tasks = sorted(
+            [(task_name, None, None) for task_name in self.keys() if task_name not in prev_tasks],
+            key=lambda x: x[0]
+        )
+
+        self._task_transitions = (next_tasks, dict(prev_tasks), start_tasks)
+
+        return self._task_transitions
+
     def get_next_tasks(self, task_name, *args, **kwargs):
+        next_tasks = self._get_task_transitions()[0]
+
+        # The reserved tasks are not defined in the spec and are not indexed.
+        if task_name not in next_tasks:
+            return self._get_next_tasks(task_name)
+
+        return list(next_tasks[task_name])
+
+    def _get_next_tasks(self, task_name):
         task_spec = self.get_task(task_name)
 
         next_tasks = []
@@ -288,23 +355,10 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
         return sorted(next_tasks, key=lambda x: x[0])
 
     def get_prev_tasks(self, task_name, *args, **kwargs):
-        prev_tasks = []
-
-        for name, task_spec in six.iteritems(self):
-            for next_task in self.get_next_tasks(name):
-                if task_name == next_task[0]:
-                    prev_tasks.append((name, next_task[1], next_task[2]))
-
-        return sorted(prev_tasks, key=lambda x: x[0])
+        return list(self._get_task_transitions()[1].get(task_name, []))
 
     def get_start_tasks(self):
-        start_tasks = [
-            (task_name, None, None)
-            for task_name in self.keys()
-            if not self.get_prev_tasks(task_name)
-        ]
-
-        return sorted(start_tasks, key=lambda x: x[0])
+        return list(self._get_task_transitions()[2])
 
     def is_join_task(self, task_name):
         task_spec = self.get_task(task_name)
@@ -317,39 +371,38 @@ class TaskMappingSpec(native_v1_specs.MappingSpec):
             len(self.get_prev_tasks(task_name)) > 1
         )
 
-    def in_cycle(self, task_name):
-        traversed = []
-        q = queue.Queue()
+    def _get_task_cycles(self):
+        if self._task_cycles is not None:
+            return self._task_cycles
 
-        for task in self.get_next_tasks(task_name):
-            q.put(task[0])
+        # Identify the cycles once from the strongly connected components of the task transitions.
+        successors = collections.OrderedDict(
+            (task_name, [t[0] for t in next_tasks if t[0] in self])
+            for task_name, next_tasks in six.iteritems(self._get_task_transitions()[0])
+        )
 
-        while not q.empty():
-            next_task_name = q.get()
+        cycles = []
 
-            # If the next task matches the original task, then it's in a loop.
-            if next_task_name == task_name:
-                return True
+        for component in graphing.get_strongly_connected_components(successors):
+            task_name = next(iter(component))
 
-            # If the next task has already been traversed but didn't match the
-            # original task, then there's a loop but the original task is not
-            # in the loop.
-            if next_task_name in traversed:
-                continue
+            # The task in a component by itself is in a cycle only if it transitions to itself.
+            if len(component) > 1 or task_name in successors[task_name]:
+                cycles.append(sorted(component))
 
-            for task in self.get_next_tasks(next_task_name):
-                q.put(task[0])
+        cycle_tasks = set(task_name for cycle in cycles for task_name in cycle)
+        self._task_cycles = (sorted(cycles), cycle_tasks)
 
-            traversed.append(next_task_name)
+        return self._task_cycles
 
-        return False
+    def get_cycles(self):
+        return [list(cycle) for cycle in self._get_task_cycles()[0]]
 
-    def has_cycles(self):
-        for task_name, task_spec in six.iteritems(self):
-            if self.in_cycle(task_name):
-                return True
+    def in_cycle(self, task_name):
+        return task_name in self._get_task_cycles()[1]
 
-        return False
+    def has_cycles(self):
+        return len(self._get_task_cycles()[0]) > 0
 
     def detect_reserved_names(self, parent=None):
         result = []
@@ -621,7 +674,7 @@ class WorkflowSpec(native_v1_specs.Spec):
         super(WorkflowSpec, self).__init__(spec, name=name, member=member)
 
     def render_input(self, runtime_inputs, in_ctx=None):
-        rolling_ctx = copy.deepcopy(in_ctx) if in_ctx else {}
+        rolling_ctx = dict(in_ctx) if in_ctx else {}
         errors = []
 
         for input_spec in (getattr(self, 'input') or []):
@@ -643,7 +696,7 @@ class WorkflowSpec(native_v1_specs.Spec):
         return rolling_ctx, errors
 
     def render_vars(self, in_ctx):
-        rolling_ctx = copy.deepcopy(in_ctx)
+        rolling_ctx = dict(in_ctx)
         rendered_vars = {}
         errors = []
 
@@ -662,7 +715,7 @@ class WorkflowSpec(native_v1_specs.Spec):
 
     def render_output(self, in_ctx):
         output_specs = getattr(self, 'output') or []
-        rolling_ctx = copy.deepcopy(in_ctx)
+        rolling_ctx = dict(in_ctx)
         rendered_outputs = {}
         errors = []
 
@@ -18,6 +18,7 @@ from hacking import core
 CODE = 'O102'
 
 REQS = {
+    'orquesta.caching': None,
     'orquesta.composers.base': 'comp_base',
     'orquesta.conducting': None,
     'orquesta.constants': None,
@@ -29,6 +30,10 @@ REQS = {
     'orquesta.expressions.jinja': 'jinja_expr',
     'orquesta.expressions.yql': 'yaql_expr',
     'orquesta.machines': None,
+    'orquesta.results.base': 'result_base',
+    'orquesta.results.filesystem': 'fs_results',
+    'orquesta.results.memory': 'mem_results',
+    'orquesta.results.sqlite': 'sqlite_results',
     'orquesta.specs.base': 'spec_base',
     'orquesta.specs.loader': 'spec_loader',
     'orquesta.specs.mistral': 'mistral_specs',
@@ -51,8 +56,10 @@ REQS = {
     'orquesta.utils.parameters': 'args_util',
     'orquesta.utils.plugin': 'plugin_util',
     'orquesta.utils.schema': 'schema_util',
+    'orquesta.utils.snapshot': 'snapshot_util',
     'orquesta.utils.specs': 'spec_util',
-    'orquesta.utils.strings': 'str_util'
+    'orquesta.utils.strings': 'str_util',
+    'orquesta.utils.views': 'view_util'
 }
 
 
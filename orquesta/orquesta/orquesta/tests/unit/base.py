@@ -179,8 +179,8 @@ class WorkflowConductorTest(WorkflowComposerTest):
 
             conductor.update_task_state(task_id, route, ac_ex_event)
 
-    # The conductor.get_next_tasks make copies of the task specs and render expressions
-    # in the task action and task input. So comparing the task specs will not match. In
+    # The conductor.get_next_tasks render expressions in the task action and task input and
+    # the task specs do not implement equality. So comparing the task specs will not match. In
     # order to match in unit tests. This method is used to serialize the task specs and
     # compare the lists.
     def assert_task_list(self, conductor, actual, expected):
@@ -24,3 +24,26 @@ class WorkflowComposerTest(mistral_comp_test_base.MistralWorkflowComposerTest):
             plugin_util.get_module('orquesta.composers', self.spec_module_name),
             mistral_comp.WorkflowComposer
         )
+
+    def test_task_index(self):
+        wf_names = ['sequential', 'cycle', 'cycles', 'splits', 'splits-nested', 'join-count']
+
+        for wf_name in wf_names:
+            wf_spec = self.spec_module.instantiate(self.get_wf_def(wf_name))
+            wf_index = self.composer.task_index_type(wf_spec)
+
+            start_tasks = [t[0] for t in wf_spec.tasks.get_start_tasks()]
+            self.assertListEqual(wf_index.start_tasks, start_tasks)
+
+            for task_name in wf_spec.tasks.keys():
+                self.assertListEqual(
+                    list(wf_index.get_next_tasks(task_name)),
+                    list(wf_spec.tasks.get_next_tasks(task_name))
+                )
+
+                self.assertEqual(
+                    wf_index.is_split_task(task_name),
+                    wf_spec.tasks.is_split_task(task_name)
+                )
+
+                self.assertEqual(wf_index.in_cycle(task_name), wf_spec.tasks.in_cycle(task_name))
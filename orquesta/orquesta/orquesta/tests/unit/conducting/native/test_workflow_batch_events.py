@@ -0,0 +1,129 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from orquesta import conducting
+from orquesta import events
+from orquesta import exceptions as exc
+from orquesta import statuses
+from orquesta.tests.unit.conducting.native import base
+
+
+class WorkflowConductorBatchEventsTest(base.OrchestraWorkflowConductorTest):
+
+    def prep_conductor(self, wf_name):
+        wf_def = self.get_wf_def(wf_name)
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        return conductor
+
+    def get_task_events(self, wf_name, mock_statuses=None):
+        # Conduct the workflow one event at a time and record the task events.
+        conductor = self.prep_conductor(wf_name)
+        mock_statuses = mock_statuses or {}
+        task_events = []
+        next_tasks = conductor.get_next_tasks()
+
+        while next_tasks:
+            for task in next_tasks:
+                status = mock_statuses.get(task['id'], statuses.SUCCEEDED)
+
+                for event_status in [statuses.RUNNING, status]:
+                    ac_ex_event = events.ActionExecutionEvent(event_status)
+                    conductor.update_task_state(task['id'], task['route'], ac_ex_event)
+                    task_events.append((task['id'], task['route'], ac_ex_event))
+
+            next_tasks = conductor.get_next_tasks()
+
+        return task_events
+
+    def assert_batch_replication(self, wf_name, batch_start=0, mock_statuses=None,
+                                 expected_wf_status=statuses.SUCCEEDED):
+        task_events = self.get_task_events(wf_name, mock_statuses=mock_statuses)
+
+        # Apply the events one at a time to the first conductor and apply the
+        # events after the start of the batch in a batch to the other conductor.
+        conductors = [self.prep_conductor(wf_name), self.prep_conductor(wf_name)]
+
+        for task_id, route, ac_ex_event in task_events:
+            conductors[0].update_task_state(task_id, route, ac_ex_event)
+
+        for task_id, route, ac_ex_event in task_events[:batch_start]:
+            conductors[1].update_task_state(task_id, route, ac_ex_event)
+
+        task_state_entries = conductors[1].update_task_states(task_events[batch_start:])
+
+        self.assertEqual(len(task_state_entries), len(task_events) - batch_start)
+        self.assertEqual(conductors[1].get_workflow_status(), expected_wf_status)
+        self.assertDictEqual(conductors[1].serialize(), conductors[0].serialize())
+
+    def test_batch_with_failed_task(self):
+        # The batch is applied after task1, task2, task4, and task5 are completed.
+        self.assert_batch_replication(
+            'parallel',
+            batch_start=8,
+            mock_statuses={'task6': statuses.FAILED},
+            expected_wf_status=statuses.FAILED
+        )
+
+    def test_batch_of_split_workflow(self):
+        self.assert_batch_replication('split')
+
+    def test_batch_of_split_workflow_with_failed_task(self):
+        self.assert_batch_replication(
+            'split',
+            mock_statuses={'task5': statuses.FAILED},
+            expected_wf_status=statuses.FAILED
+        )
+
+    def test_batch_with_task_staged_in_batch(self):
+        conductor = self.prep_conductor('sequential')
+        conductor.get_next_tasks()
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING)),
+            ('task1', 0, events.ActionExecutionEvent(statuses.SUCCEEDED)),
+            ('task2', 0, events.ActionExecutionEvent(statuses.RUNNING))
+        ]
+
+        task_state_entries = conductor.update_task_states(task_events)
+
+        self.assertEqual(task_state_entries[-1]['id'], 'task2')
+        self.assertEqual(task_state_entries[-1]['status'], statuses.RUNNING)
+        self.assertEqual(conductor.get_workflow_status(), statuses.RUNNING)
+
+    def test_batch_with_task_not_staged_is_rolled_back(self):
+        conductor = self.prep_conductor('sequential')
+        conductor.get_next_tasks()
+        conductor.checkpoint()
+        expected_data = conductor.serialize()
+
+        # The task3 is not staged after the events before it are applied.
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING)),
+            ('task1', 0, events.ActionExecutionEvent(statuses.SUCCEEDED)),
+            ('task3', 0, events.ActionExecutionEvent(statuses.RUNNING))
+        ]
+
+        self.assertRaises(exc.InvalidTaskStateEntry, conductor.update_task_states, task_events)
+
+        # Assert the events applied before the invalid event are rolled back.
+        self.assertDictEqual(conductor.serialize(), expected_data)
+        self.assertListEqual(conductor.serialize_delta()['state']['sequence']['entries'], [])
+        self.assertListEqual([t['id'] for t in conductor.get_next_tasks()], ['task1'])
+
+        # Assert the batch can be applied once the invalid event is removed.
+        conductor.update_task_states(task_events[:-1])
+        self.assertListEqual([t['id'] for t in conductor.get_next_tasks()], ['task2'])
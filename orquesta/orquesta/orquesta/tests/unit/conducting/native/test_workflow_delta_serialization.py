@@ -0,0 +1,189 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import mock
+
+from orquesta import conducting
+from orquesta import events
+from orquesta import statuses
+from orquesta.tests.unit.conducting.native import base
+
+
+class WorkflowConductorDeltaSerializationTest(base.OrchestraWorkflowConductorTest):
+
+    def assert_delta_replication(self, wf_name, inputs=None, mock_statuses=None):
+        wf_def = self.get_wf_def(wf_name)
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # The replica is restored from the full serialization and then kept
+        # up to date by applying the delta after each task is completed.
+        replica = conducting.WorkflowConductor.deserialize(conductor.serialize())
+        conductor.checkpoint()
+        mock_statuses = list(mock_statuses or [])
+        next_tasks = conductor.get_next_tasks()
+
+        while next_tasks:
+            for task in next_tasks:
+                for action in task['actions']:
+                    ctx = {'item_id': action['item_id']} if 'item_id' in action else None
+                    status = mock_statuses.pop(0) if mock_statuses else statuses.SUCCEEDED
+
+                    for event_status in [statuses.RUNNING, status]:
+                        ac_ex_event = events.ActionExecutionEvent(event_status, context=ctx)
+                        conductor.update_task_state(task['id'], task['route'], ac_ex_event)
+
+                    # The delta is persisted and loaded as JSON.
+                    delta = json.loads(json.dumps(conductor.serialize_delta()))
+                    replica.apply_delta(delta)
+
+                    self.assertDictEqual(replica.serialize(), conductor.serialize())
+
+            next_tasks = conductor.get_next_tasks()
+
+        # The replica can continue to conduct the workflow.
+        self.assertEqual(replica.get_workflow_status(), conductor.get_workflow_status())
+        self.assertEqual(replica.get_workflow_output(), conductor.get_workflow_output())
+        self.assertListEqual(replica.get_next_tasks(), [])
+
+        return conductor
+
+    def test_sequential(self):
+        conductor = self.assert_delta_replication('sequential', inputs={'name': 'Stanley'})
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_join(self):
+        conductor = self.assert_delta_replication('join')
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_cycle(self):
+        conductor = self.assert_delta_replication('cycle')
+        self.assertEqual(len(conductor.workflow_state.sequence), 10)
+
+    @mock.patch.object(conducting.WorkflowState, 'contexts_compaction_threshold', 1)
+    def test_cycle_with_contexts_compaction(self):
+        conductor = self.assert_delta_replication('cycle')
+        self.assertEqual(len(conductor.workflow_state.sequence), 10)
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+        # The inbound contexts replaced by the contexts published later are removed.
+        ctx_idxs_lists = [t['ctxs']['in'] for t in conductor.workflow_state.sequence]
+        self.assertListEqual(ctx_idxs_lists[-1], [0, 2])
+        self.assertTrue(all(len(ctx_idxs) <= 2 for ctx_idxs in ctx_idxs_lists))
+
+    def test_splits(self):
+        conductor = self.assert_delta_replication('splits')
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_error_handling(self):
+        mock_statuses = [statuses.FAILED]
+        conductor = self.assert_delta_replication('error-log-fail', mock_statuses=mock_statuses)
+        self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
+        self.assertGreater(len(conductor.errors), 0)
+
+    def test_with_items_concurrency(self):
+        inputs = {'members': ['Lakshmi', 'Lindsay', 'Tomaz', 'Matt', 'Sean']}
+        conductor = self.assert_delta_replication('with-items-concurrency', inputs=inputs)
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_delta_size(self):
+        wf_def = self.get_wf_def('sequential')
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec, inputs={'name': 'Stanley'})
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.checkpoint()
+
+        ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING)
+        conductor.update_task_state('task1', 0, ac_ex_event)
+        delta = conductor.serialize_delta()
+
+        expected_state_delta = {
+            'contexts': {'start': 1, 'entries': []},
+            'routes': {'start': 1, 'entries': []},
+            'sequence': {
+                'start': 0,
+                'entries': [
+                    {
+                        'id': 'task1',
+                        'route': 0,
+                        'ctxs': {'in': [0]},
+                        'prev': {},
+                        'next': {},
+                        'status': statuses.RUNNING
+                    }
+                ],
+                'changed': []
+            },
+            'staged': {'removed': [['task1', 0]], 'entries': []},
+            'status': statuses.RUNNING,
+            'tasks': {'task1__r0': 0}
+        }
+
+        self.assertDictEqual(delta['state'], expected_state_delta)
+        self.assertDictEqual(delta['log'], {'start': 0, 'entries': []})
+        self.assertDictEqual(delta['errors'], {'start': 0, 'entries': []})
+        self.assertNotIn('output', delta)
+
+        # Only the task state entry that is changed is included in the next delta.
+        ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED)
+        conductor.update_task_state('task1', 0, ac_ex_event)
+        delta = conductor.serialize_delta()
+
+        self.assertListEqual([idx for idx, _ in delta['state']['sequence']['changed']], [0])
+        self.assertListEqual(delta['state']['sequence']['entries'], [])
+        self.assertListEqual([t['id'] for t in delta['state']['staged']['entries']], ['task2'])
+
+    def test_serialize_does_not_move_checkpoint(self):
+        wf_def = self.get_wf_def('sequential')
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec, inputs={'name': 'Stanley'})
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.checkpoint()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+        conductor.serialize()
+        delta = conductor.serialize_delta()
+
+        # The changes made before the serialize are still included in the delta.
+        self.assertEqual(delta['state']['sequence']['start'], 0)
+        self.assertListEqual([t['id'] for t in delta['state']['sequence']['entries']], ['task1'])
+
+        # The delta starts from the checkpoint set after the conductor is serialized.
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING])
+        data = conductor.serialize()
+        conductor.checkpoint()
+        self.forward_task_statuses(conductor, 'task2', [statuses.SUCCEEDED])
+        delta = conductor.serialize_delta()
+
+        replica = conducting.WorkflowConductor.deserialize(data)
+        replica.apply_delta(delta)
+        self.assertDictEqual(replica.serialize(), conductor.serialize())
+
+    def test_apply_delta_out_of_order(self):
+        wf_def = self.get_wf_def('sequential')
+        wf_spec = self.spec_module.instantiate(wf_def)
+        conductor = conducting.WorkflowConductor(wf_spec, inputs={'name': 'Stanley'})
+        conductor.request_workflow_status(statuses.RUNNING)
+        replica = conducting.WorkflowConductor.deserialize(conductor.serialize())
+        conductor.checkpoint()
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+        conductor.serialize_delta()
+
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+        delta = conductor.serialize_delta()
+
+        self.assertRaises(ValueError, replica.apply_delta, delta)
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
 from orquesta import conducting
+from orquesta.specs import base as spec_base
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
@@ -141,6 +144,108 @@ class WorkflowConductorTaskRenderingTest(test_base.WorkflowConductorTest):
 
         self.assert_task_list(conductor, conductor.get_next_tasks(), expected_tasks)
 
+    def test_rendering_shares_task_spec(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - message
+          - xs
+
+        tasks:
+          task1:
+            action: core.echo message=<% ctx().message %>
+            next:
+              - do: task2, noop
+          task2:
+            with: x in <% ctx().xs %>
+            action: core.echo message=<% item(x) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        inputs = {'message': 'foobar', 'xs': ['fee', 'fi']}
+        action_input = {'message': 'foobar'}
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # Test that the render does not copy or instantiate any spec.
+        spec_init = spec_base.Spec.__init__
+
+        with mock.patch.object(spec_base.Spec, '__init__', autospec=True) as mocked:
+            mocked.side_effect = spec_init
+            tasks = conductor.get_next_tasks()
+            self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+            tasks.extend(conductor.get_next_tasks())
+            mocked.assert_not_called()
+
+        self.assertEqual(len(tasks), 2)
+        self.assertIs(tasks[0]['spec'], conductor.spec.tasks.get_task('task1'))
+        self.assertIs(tasks[1]['spec'], conductor.spec.tasks.get_task('task2'))
+        self.assertListEqual(tasks[0]['actions'], [{'action': 'core.echo', 'input': action_input}])
+        self.assertListEqual([a['input']['message'] for a in tasks[1]['actions']], ['fee', 'fi'])
+
+        # Test that the render returns the task spec and the rendered actions.
+        rendered = conductor.spec.tasks.get_task('task1').render({'message': 'foobar'})
+        self.assertIsInstance(rendered, spec_base.RenderedTask)
+        self.assertIs(rendered.spec, conductor.spec.tasks.get_task('task1'))
+        self.assertListEqual(rendered.actions, tasks[0]['actions'])
+
+    def test_rendered_task_is_copied(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data
+
+        tasks:
+          task1:
+            action: core.echo message=<% ctx().data %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        inputs = {'data': {'x': ['fee', 'fi']}}
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # Test that changes to the returned task do not change the rendered task that is reused.
+        tasks = conductor.get_next_tasks()
+        tasks[0]['ctx']['data']['x'].append('fo')
+        tasks[0]['actions'][0]['input']['message']['x'].append('fum')
+
+        tasks = conductor.get_next_tasks()
+        self.assertDictEqual(tasks[0]['ctx']['data'], inputs['data'])
+        self.assertDictEqual(tasks[0]['actions'][0]['input'], {'message': inputs['data']})
+
+    def test_rendering_reads_workflow_state(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+          task2:
+            action: core.echo message=<% task_status(task1) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        tasks = conductor.get_next_tasks()
+        self.assertEqual(tasks[1]['actions'][0]['input']['message'], statuses.UNSET)
+
+        # Test that the task is rendered again since the rendering depends on the workflow state.
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING])
+        tasks = conductor.get_next_tasks()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0]['actions'][0]['input']['message'], statuses.RUNNING)
+
     def test_with_items_rendering(self):
         wf_def = """
         version: 1.0
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 import copy
+import json
+import mock
+import six
 
 from orquesta import conducting
 from orquesta import exceptions as exc
@@ -21,6 +24,7 @@ from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
 from orquesta.utils import dictionary as dict_util
+from orquesta.utils import snapshot as snapshot_util
 
 
 class WorkflowConductorTest(test_base.WorkflowConductorTest):
@@ -132,7 +136,8 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
                 ],
                 'tasks': {},
                 'sequence': [],
-                'contexts': [{'a': None, 'b': False}]
+                'contexts': [{'a': None, 'b': False}],
+                'joins': {}
             }
         }
 
@@ -173,7 +178,8 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
                 ],
                 'tasks': {},
                 'sequence': [],
-                'contexts': [inputs]
+                'contexts': [inputs],
+                'joins': {}
             }
         }
 
@@ -216,7 +222,8 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
                 ],
                 'tasks': {},
                 'sequence': [],
-                'contexts': [expected_initial_ctx]
+                'contexts': [expected_initial_ctx],
+                'joins': {}
             }
         }
 
@@ -260,7 +267,8 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
                 ],
                 'tasks': {},
                 'sequence': [],
-                'contexts': [init_ctx]
+                'contexts': [init_ctx],
+                'joins': {}
             }
         }
 
@@ -312,6 +320,140 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         self.assertEqual(len(conductor.workflow_state.tasks), 5)
         self.assertEqual(len(conductor.workflow_state.sequence), 5)
 
+    def test_deserialization_is_lazy(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task' + str(i), status_changes)
+
+        data = conductor.serialize()
+
+        # The status, output, and errors do not require the spec, graph, and state.
+        conductor = conducting.WorkflowConductor.deserialize(data)
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertEqual(conductor.get_workflow_output(), data['output'])
+        self.assertListEqual(conductor.errors, data['errors'])
+        self.assertIsNone(conductor._spec)
+        self.assertIsNone(conductor._graph)
+        self.assertIsNone(conductor._workflow_state)
+
+        # The serialization does not require the spec, graph, and state.
+        self.assertDictEqual(conductor.serialize(), data)
+        self.assertIsNone(conductor._spec)
+        self.assertIsNone(conductor._graph)
+        self.assertIsNone(conductor._workflow_state)
+
+        # The spec, graph, and state are deserialized on first access.
+        self.assertIsInstance(conductor.graph, graphing.WorkflowGraph)
+        self.assertIsNone(conductor._spec)
+        self.assertIsNone(conductor._workflow_state)
+        self.assertIsInstance(conductor.workflow_state, conducting.WorkflowState)
+        self.assertIs(conductor.workflow_state.conductor, conductor)
+        self.assertIsNone(conductor._spec)
+        self.assertIsInstance(conductor.spec, native_specs.WorkflowSpec)
+        self.assertDictEqual(conductor._serialized, {})
+        self.assertDictEqual(conductor.serialize(), data)
+
+    def test_deserialization_does_not_copy_data(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task' + str(i), status_changes)
+
+        data = conductor.serialize()
+        sections = [data['spec'], data['graph'], data['state']]
+        deepcopy = copy.deepcopy
+
+        # The sections are checked whether copied as is or as the values of a dict.
+        def mock_deepcopy(value, *args, **kwargs):
+            values = list(value.values()) if isinstance(value, dict) else []
+            self.assertFalse(any(v is s for v in [value] + values for s in sections))
+            return deepcopy(value, *args, **kwargs)
+
+        # The status and output queries do not copy or build the spec, graph, and state.
+        with mock.patch.object(copy, 'deepcopy', mock.MagicMock(side_effect=mock_deepcopy)), \
+                mock.patch.object(native_specs.WorkflowSpec, 'deserialize') as mock_spec, \
+                mock.patch.object(graphing.WorkflowGraph, 'deserialize') as mock_graph, \
+                mock.patch.object(conducting.WorkflowState, 'deserialize') as mock_state:
+            conductor = conducting.WorkflowConductor.deserialize(data)
+            self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+            self.assertEqual(conductor.get_workflow_output(), data['output'])
+
+        mock_spec.assert_not_called()
+        mock_graph.assert_not_called()
+        mock_state.assert_not_called()
+
+    def test_deserialization_copies_data_on_first_access(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        data = conductor.serialize()
+        expected_data = copy.deepcopy(data)
+        conductor = conducting.WorkflowConductor.deserialize(data)
+
+        # The sections of the data are copied when deserialized on first access.
+        self.assertIn('task2', conductor.spec.tasks)
+        self.assertEqual(len(conductor.graph.serialize()['nodes']), 5)
+        self.assertDictEqual(conductor.workflow_state.contexts[0], inputs)
+
+        # The changes to the conductor do not change the data.
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertDictEqual(data, expected_data)
+
+        # The changes to the data do not change the conductor.
+        data['spec']['spec']['tasks'].pop('task2')
+        data['graph']['nodes'].pop()
+        data['state']['status'] = statuses.FAILED
+        data['state']['contexts'][0]['a'] = 456
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.RUNNING)
+        self.assertIn('task2', conductor.spec.tasks)
+        self.assertEqual(len(conductor.graph.serialize()['nodes']), 5)
+        self.assertDictEqual(conductor.workflow_state.contexts[0], inputs)
+
+    def test_peek_serialized_conductor(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        data = conductor.serialize()
+        self.assertEqual(conducting.peek_status(data), statuses.RUNNING)
+        self.assertIsNone(conducting.peek_output(data))
+        self.assertListEqual(conducting.peek_errors(data), [])
+
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task' + str(i), status_changes)
+
+        data = conductor.serialize()
+        self.assertEqual(conducting.peek_status(data), statuses.SUCCEEDED)
+        self.assertEqual(conducting.peek_output(data), conductor.get_workflow_output())
+        self.assertListEqual(conducting.peek_errors(data), conductor.errors)
+
+    def test_serialization_to_snapshot(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        for i in range(1, 6):
+            status_changes = [statuses.RUNNING, statuses.SUCCEEDED]
+            self.forward_task_statuses(conductor, 'task' + str(i), status_changes)
+
+        data = conductor.serialize()
+
+        for compress in [False, True]:
+            snapshot = conductor.serialize_snapshot(compress=compress)
+            self.assertIsInstance(snapshot, six.binary_type)
+            self.assertLess(len(snapshot), len(json.dumps(data)))
+            self.assertDictEqual(snapshot_util.decode(snapshot), data)
+
+            restored = conducting.WorkflowConductor.deserialize_snapshot(snapshot)
+            self.assertDictEqual(restored.serialize(), data)
+            self.assertEqual(restored.get_workflow_status(), statuses.SUCCEEDED)
+
     def test_get_workflow_initial_context(self):
         conductor = self._prep_conductor()
         expected_init_ctx = {'a': None, 'b': False}
@@ -551,6 +693,18 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
         expected_context_list = [expected_init_ctx, expected_task_out_ctx]
         self.assertListEqual(conductor.workflow_state.contexts, expected_context_list)
 
+    def test_get_task_context_does_not_modify_contexts(self):
+        inputs = {'a': 123}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+        conductor.workflow_state.contexts.append({'x': {'y': 1}})
+        conductor.workflow_state.contexts.append({'x': {'z': 2}})
+
+        expected_ctx = {'a': 123, 'b': False, 'x': {'y': 1, 'z': 2}}
+        self.assertDictEqual(conductor.get_task_context([0, 1, 2]), expected_ctx)
+
+        expected_context_list = [{'a': 123, 'b': False}, {'x': {'y': 1}}, {'x': {'z': 2}}]
+        self.assertListEqual(conductor.workflow_state.contexts, expected_context_list)
+
     def test_get_task_transition_contexts(self):
         inputs = {'a': 123, 'b': True}
         expected_init_ctx = copy.deepcopy(inputs)
@@ -856,7 +1010,8 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
                 ],
                 'tasks': {},
                 'sequence': [],
-                'contexts': [inputs]
+                'contexts': [inputs],
+                'joins': {}
             }
         }
 
@@ -933,3 +1088,84 @@ class WorkflowConductorTest(test_base.WorkflowConductorTest):
 
         self.assertListEqual(conductor.log, expected_log_entries)
         self.assertListEqual(conductor.errors, expected_errors)
+
+    def test_append_duplicate_log_entries_after_deserialize(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        task = {'task_id': 'task1', 'route': 0}
+        conductor.log_entry('info', 'The workflow is running as expected.', data={'x': 1234})
+        conductor.log_entry('error', 'This is baloney.', **task)
+
+        conductor = conducting.WorkflowConductor.deserialize(conductor.serialize())
+        conductor.log_entry('info', 'The workflow is running as expected.', data={'x': 1234})
+        conductor.log_entry('error', 'This is baloney.', **task)
+        conductor.log_entry('warn', 'The task may be running a little bit slow.', **task)
+
+        expected_log_entries = [
+            {
+                'type': 'info',
+                'message': 'The workflow is running as expected.',
+                'data': {'x': 1234}
+            },
+            {
+                'type': 'warn',
+                'message': 'The task may be running a little bit slow.',
+                'task_id': 'task1',
+                'route': 0
+            }
+        ]
+
+        expected_errors = [
+            {
+                'type': 'error',
+                'message': 'This is baloney.',
+                'task_id': 'task1',
+                'route': 0
+            }
+        ]
+
+        self.assertListEqual(conductor.log, expected_log_entries)
+        self.assertListEqual(conductor.errors, expected_errors)
+
+    def test_append_duplicate_log_entries_not_serializable(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+
+        extra = {'x': set([1, 2])}
+        conductor.log_entry('info', 'The workflow is running as expected.', data=extra)
+        conductor.log_entry('info', 'The workflow is running as expected.', data=extra)
+
+        expected_log_entries = [
+            {
+                'type': 'info',
+                'message': 'The workflow is running as expected.',
+                'data': extra
+            }
+        ]
+
+        self.assertListEqual(conductor.log, expected_log_entries)
+
+    def test_append_log_entries_over_limit(self):
+        inputs = {'a': 123, 'b': True}
+        conductor = self._prep_conductor(inputs=inputs, status=statuses.RUNNING)
+        conductor.log_limit = 2
+
+        for i in range(0, 5):
+            conductor.log_entry('info', 'The workflow is running as expected.', data={'i': i})
+
+        conductor.log_error(TypeError('Something is not right.'))
+
+        self.assertListEqual([e['data']['i'] for e in conductor.log], [0, 1])
+        self.assertEqual(len(conductor.errors), 1)
+        self.assertDictEqual(conductor.log_dropped, {'log': 3, 'errors': 0})
+
+        # Check the count of dropped log entries is restored on deserialize.
+        data = conductor.serialize()
+        self.assertDictEqual(data['log_dropped'], {'log': 3, 'errors': 0})
+
+        conductor = conducting.WorkflowConductor.deserialize(data)
+        conductor.log_limit = 2
+        conductor.log_entry('info', 'The workflow is running as expected.', data={'i': 5})
+        conductor.log_entry('info', 'The workflow is running as expected.', data={'i': 0})
+        self.assertDictEqual(conductor.log_dropped, {'log': 4, 'errors': 0})
@@ -103,6 +103,79 @@ class WorkflowConductorExtendedTest(test_base.WorkflowConductorTest):
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
         self.assertDictEqual(conductor.get_workflow_terminal_context(), expected_term_ctx)
 
+    def test_join_counters(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                do: task2, task3, task4
+          task2:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                do: task5
+          task3:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                do: task5
+          task4:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                do: task5
+          task5:
+            join: 2
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        # The task transition to the join is counted when the inbound task succeeded.
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertDictEqual(conductor.workflow_state.joins, {'task5__r0': {'task2__t0': True}})
+        self.assertEqual(conductor.workflow_state.get_join_count('task5', 0), 1)
+        self.assertFalse(conductor.workflow_state.get_staged_task('task5', 0)['ready'])
+
+        # The join counters are included in the state delta and survive serialization.
+        checkpoint = conductor.serialize()
+        conductor.checkpoint()
+        delta = conductor.serialize_delta()
+        self.assertNotIn('joins', delta['state'])
+        self.forward_task_statuses(conductor, 'task3', [statuses.RUNNING, statuses.SUCCEEDED])
+        delta = conductor.serialize_delta()
+
+        self.assertDictEqual(
+            delta['state']['joins'],
+            {'entries': {'task5__r0': {'task2__t0': True, 'task3__t0': True}}}
+        )
+
+        restored = conducting.WorkflowConductor.deserialize(checkpoint)
+        restored.apply_delta(delta)
+        self.assertDictEqual(restored.workflow_state.joins, conductor.workflow_state.joins)
+        self.assertEqual(restored.workflow_state.get_join_count('task5', 0), 2)
+        self.assertTrue(restored.workflow_state.get_staged_task('task5', 0)['ready'])
+
+        # The join counters are indexed from the task state entries if they are not serialized.
+        data = conductor.serialize()
+        data['state'].pop('joins')
+        restored = conducting.WorkflowConductor.deserialize(data)
+        self.assertIsNone(restored.workflow_state.joins)
+        self.assertTrue(restored.has_next_tasks('task3', 0))
+        self.assertDictEqual(restored.workflow_state.joins, conductor.workflow_state.joins)
+
+        self.forward_task_statuses(restored, 'task4', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertEqual(restored.workflow_state.get_join_count('task5', 0), 3)
+        self.forward_task_statuses(restored, 'task5', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertEqual(restored.get_workflow_status(), statuses.SUCCEEDED)
+
     def test_join_with_no_input_and_no_context_changes(self):
         wf_def = """
         version: 1.0
@@ -0,0 +1,127 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mock
+
+from orquesta import caching
+from orquesta import conducting
+from orquesta import graphing
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+WF_DEF = """
+version: 1.0
+
+input:
+  - name
+
+tasks:
+  task1:
+    action: core.echo message=<% ctx(name) %>
+    next:
+      - when: <% succeeded() %>
+        do: task2
+  task2:
+    action: core.noop
+
+output:
+  - greeting: <% ctx(name) %>
+"""
+
+
+class WorkflowConductorCacheTest(test_base.WorkflowConductorTest):
+
+    def test_instantiate(self):
+        cache = caching.WorkflowCache()
+
+        compiled = cache.instantiate('native', WF_DEF)
+        self.assertIsInstance(compiled.spec, native_specs.WorkflowSpec)
+        self.assertIsInstance(compiled.graph, graphing.WorkflowGraph)
+        self.assertListEqual(compiled.roots, [{'id': 'task1', 'name': 'task1'}])
+        self.assertListEqual(compiled.leaves, [{'id': 'task2', 'name': 'task2'}])
+
+        # The same definition or instantiated spec returns the same compiled workflow.
+        self.assertIs(cache.instantiate('native', WF_DEF), compiled)
+        self.assertIs(cache.compile(compiled.spec), compiled)
+
+        # The specs with the same serialized form share the same compiled workflow.
+        specs = [native_specs.WorkflowSpec(WF_DEF) for i in range(0, 2)]
+        self.assertIs(cache.compile(specs[0]), cache.compile(specs[1]))
+
+        expected_metrics = {'size': 3, 'max_size': 128, 'hits': 3, 'misses': 2, 'evictions': 0}
+        self.assertDictEqual(cache.get_metrics(), expected_metrics)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_eviction(self):
+        cache = caching.WorkflowCache(max_size=2)
+        wf_defs = [WF_DEF.replace('core.noop', 'core.noop%d' % i) for i in range(0, 3)]
+        specs = [native_specs.WorkflowSpec(wf_def) for wf_def in wf_defs]
+
+        compiled = [cache.compile(spec) for spec in specs[0:2]]
+
+        # Look up the first workflow so the second workflow is the least recently used.
+        self.assertIs(cache.compile(specs[0]), compiled[0])
+        cache.compile(specs[2])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.compile(specs[0]), compiled[0])
+        self.assertIsNot(cache.compile(specs[1]), compiled[1])
+
+        expected_metrics = {'size': 2, 'max_size': 2, 'hits': 2, 'misses': 4, 'evictions': 2}
+        self.assertDictEqual(cache.get_metrics(), expected_metrics)
+
+    def test_bad_max_size(self):
+        self.assertRaises(ValueError, caching.WorkflowCache, max_size=0)
+        self.assertRaises(ValueError, caching.WorkflowCache, max_size=None)
+
+    def test_conductors_share_compiled_workflow(self):
+        cache = caching.WorkflowCache()
+
+        with mock.patch.object(conducting.WorkflowConductor, 'workflow_cache', cache):
+            conductors = [
+                conducting.WorkflowConductor(native_specs.WorkflowSpec(WF_DEF), inputs={'name': n})
+                for n in ['foo', 'bar']
+            ]
+
+            for conductor in conductors:
+                conductor.request_workflow_status(statuses.RUNNING)
+
+            self.assertIs(conductors[0].spec, conductors[1].spec)
+            self.assertIs(conductors[0].graph, conductors[1].graph)
+
+            # The deserialized conductors share the same compiled workflow.
+            data = [conductor.serialize() for conductor in conductors]
+            conductors = [conducting.WorkflowConductor.deserialize(d) for d in data]
+
+            for conductor in conductors:
+                self.assertIs(conductor.spec, conductors[0].spec)
+                self.assertIs(conductor.graph, conductors[0].graph)
+
+            for conductor, name in zip(conductors, ['foo', 'bar']):
+                for task_id in ['task1', 'task2']:
+                    self.forward_task_statuses(
+                        conductor,
+                        task_id,
+                        [statuses.RUNNING, statuses.SUCCEEDED]
+                    )
+
+                self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+                self.assertDictEqual(conductor.get_workflow_output(), {'greeting': name})
+
+        expected_metrics = {'size': 1, 'max_size': 128, 'hits': 3, 'misses': 1, 'evictions': 0}
+        self.assertDictEqual(cache.get_metrics(), expected_metrics)
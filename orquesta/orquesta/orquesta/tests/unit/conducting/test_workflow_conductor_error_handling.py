@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from orquesta import conducting
+from orquesta import events
 from orquesta import exceptions as exc
 from orquesta.specs import native as native_specs
 from orquesta import statuses
@@ -990,3 +991,48 @@ class WorkflowConductorErrorHandlingTest(test_base.WorkflowConductorTest):
         self.assertEqual(conductor.get_workflow_status(), statuses.FAILED)
         self.assertListEqual(conductor.errors, expected_errors)
         self.assertDictEqual(conductor.get_workflow_output(), expected_output)
+
+    def test_batch_of_task_events_with_fail_command(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% failed() %>
+                do:
+                  - task2
+                  - fail
+          task2:
+            action: core.noop
+
+        output:
+          - x: 123
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductors = []
+
+        for i in range(0, 2):
+            conductor = conducting.WorkflowConductor(spec)
+            conductor.request_workflow_status(statuses.RUNNING)
+            conductors.append(conductor)
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING)),
+            ('task1', 0, events.ActionExecutionEvent(statuses.FAILED))
+        ]
+
+        # Apply the events one at a time to the first conductor and in a batch to the other.
+        for task_id, route, ac_ex_event in task_events:
+            conductors[0].update_task_state(task_id, route, ac_ex_event)
+
+        conductors[1].update_task_states(task_events)
+
+        self.assertEqual(conductors[1].get_workflow_status(), statuses.FAILED)
+        self.assertDictEqual(conductors[1].get_workflow_output(), {'x': 123})
+        self.assertTrue(conductors[1].get_task_state_entry('task1', 0)['term'])
+        self.assertDictEqual(conductors[1].serialize(), conductors[0].serialize())
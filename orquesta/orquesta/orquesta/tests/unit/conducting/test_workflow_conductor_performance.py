@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
 import random
 import string
 
@@ -66,6 +67,31 @@ class WorkflowConductorStressTest(test_base.WorkflowConductorTest):
 
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
 
+    def test_runtime_function_of_state_size(self):
+        num_tasks = 100
+        data = ''.join(random.choice(string.ascii_lowercase) for _ in range(10000))
+        conductor = self._prep_conductor(num_tasks, status=statuses.RUNNING)
+
+        # The workflow state should not be copied to evaluate expressions on task transition.
+        # The state is only copied once for the context of each task returned to the caller.
+        with mock.patch.object(conducting.WorkflowState, 'serialize') as mock_serialize:
+            for i in range(1, num_tasks + 1):
+                task_name = 't' + str(i)
+                next_tasks = conductor.get_next_tasks()
+                self.assertEqual(len(next_tasks), 1)
+                self.assertEqual(mock_serialize.call_count, i)
+
+                self.forward_task_statuses(
+                    conductor,
+                    task_name,
+                    [statuses.RUNNING, statuses.SUCCEEDED],
+                    results=[None, {'data': data}]
+                )
+
+            self.assertEqual(mock_serialize.call_count, num_tasks)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
     def test_serialization_function_of_graph_size(self):
         num_tasks = 100
         conductor = self._prep_conductor(num_tasks, status=statuses.RUNNING)
@@ -0,0 +1,294 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import mock
+
+from orquesta import conducting
+from orquesta import events
+from orquesta.results import base as result_base
+from orquesta.results import memory as mem_results
+from orquesta.specs import native as native_specs
+from orquesta import statuses
+from orquesta.tests.unit import base as test_base
+
+
+class WorkflowConductorResultStoreTest(test_base.WorkflowConductorTest):
+
+    def test_large_published_value(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                publish:
+                  - payload: <% result() %>
+                  - size: <% len(result()) %>
+                do: task2
+          task2:
+            action: core.echo message=<% ctx(size) %>
+
+        output:
+          - payload: <% ctx(payload) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        store = mem_results.ResultStore(size_threshold=1024)
+        conductor = conducting.WorkflowConductor(spec, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        payload = ['foobar'] * 1000
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED],
+                                   results=[None, payload])
+
+        # Only the reference to the large published value is kept in the workflow state.
+        data = conductor.serialize()
+        ctx = data['state']['contexts'][1]
+        self.assertTrue(result_base.is_result_ref(ctx['payload']))
+        self.assertEqual(ctx['size'], 1000)
+        self.assertLess(len(json.dumps(data['state'])), len(json.dumps(payload)))
+
+        # The value is loaded from the result store when the context is evaluated.
+        conductor = conducting.WorkflowConductor.deserialize(data, result_store=store)
+        next_tasks = conductor.get_next_tasks()
+        self.assertEqual(len(next_tasks), 1)
+        self.assertEqual(next_tasks[0]['actions'][0]['input'], {'message': 1000})
+        self.assertListEqual(next_tasks[0]['ctx']['payload'], payload)
+
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'payload': payload})
+
+    def test_large_item_results(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+
+        output:
+          - items: <% ctx(items) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        store = mem_results.ResultStore(size_threshold=1024)
+        conductor = conducting.WorkflowConductor(spec, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.get_next_tasks()
+
+        results = [x * 1000 for x in ['fee', 'fi', 'fo']]
+
+        for item_id in range(0, len(results)):
+            ctx = {'item_id': item_id}
+            ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING, context=ctx)
+            conductor.update_task_state('task1', 0, ac_ex_event)
+
+        for item_id, result in enumerate(results[:2]):
+            ctx = {'item_id': item_id}
+            ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED, result, ctx)
+            conductor.update_task_state('task1', 0, ac_ex_event)
+
+        # Only the references to the large results of the items are kept in the staged task.
+        data = conductor.serialize()
+        items = data['state']['staged'][0]['items']
+        self.assertTrue(all(result_base.is_result_ref(item['result']) for item in items[:2]))
+
+        conductor = conducting.WorkflowConductor.deserialize(data, result_store=store)
+        ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED, results[2], {'item_id': 2})
+        conductor.update_task_state('task1', 0, ac_ex_event)
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'items': results})
+
+    def test_large_value_republished(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - publish:
+                  - payload: <% dict(a => 1) %>
+                do: task2
+          task2:
+            action: core.noop
+            next:
+              - publish:
+                  - payload: <% result() %>
+                do: task3
+          task3:
+            action: core.noop
+            next:
+              - publish:
+                  - payload: <% dict(c => 3) %>
+
+        output:
+          - payload: <% ctx(payload) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        store = mem_results.ResultStore(size_threshold=1024)
+        conductor = conducting.WorkflowConductor(spec, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        payload = {'b': ['foobar'] * 1000}
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED],
+                                   results=[None, payload])
+
+        # The large value is merged with the dict published earlier under the same key.
+        self.assertTrue(result_base.is_result_ref(conductor.workflow_state.contexts[2]['payload']))
+        expected_payload = {'a': 1, 'b': payload['b']}
+        self.assertDictEqual(conductor.get_next_tasks()[0]['ctx']['payload'], expected_payload)
+
+        self.forward_task_statuses(conductor, 'task3', [statuses.RUNNING, statuses.SUCCEEDED])
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        expected_payload = {'a': 1, 'b': payload['b'], 'c': 3}
+        self.assertDictEqual(conductor.get_workflow_output(), {'payload': expected_payload})
+
+    def test_large_value_loaded_when_read(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                publish:
+                  - payload: <% result() %>
+                do: task2
+          task2:
+            action: core.noop
+            next:
+              - when: <% succeeded() %>
+                publish:
+                  - size: 1
+                do: task3
+          task3:
+            action: core.noop
+            next:
+              - when: <% succeeded() and len(ctx(payload)) = 1000 %>
+                do: task4
+          task4:
+            action: core.noop
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        store = mem_results.ResultStore(size_threshold=1024)
+        conductor = conducting.WorkflowConductor(spec, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        payload = ['foobar'] * 1000
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED],
+                                   results=[None, payload])
+
+        # The large value is not loaded by the task transitions that do not read it.
+        with mock.patch.object(store, 'get', mock.MagicMock(side_effect=store.get)) as mock_get:
+            self.forward_task_statuses(conductor, 'task2', [statuses.RUNNING, statuses.SUCCEEDED])
+            mock_get.assert_not_called()
+
+            # The merged contexts keep the reference instead of the value.
+            ctx = conductor.workflow_state.get_context([0, 1, 2])
+            self.assertIsInstance(ctx['payload'], result_base.ResultRef)
+
+            # The large value is loaded when the task transition reads it.
+            self.forward_task_statuses(conductor, 'task3', [statuses.RUNNING, statuses.SUCCEEDED])
+            self.assertEqual(mock_get.call_count, 1)
+
+        self.forward_task_statuses(conductor, 'task4', [statuses.RUNNING, statuses.SUCCEEDED])
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertListEqual(conductor.get_workflow_terminal_context()['payload'], payload)
+
+    def test_value_with_reference_layout(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - data
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - publish:
+                  - payload: <% result() %>
+
+        output:
+          - data: <% ctx(data) %>
+          - payload: <% ctx(payload) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        # The values that look like a reference are not mistaken for a stored value.
+        value = {result_base.RESULT_REF_KEY: 'foobar'}
+        store = mem_results.ResultStore()
+        conductor = conducting.WorkflowConductor(spec, inputs={'data': value}, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED],
+                                   results=[None, value])
+
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+        self.assertDictEqual(conductor.get_workflow_output(), {'data': value, 'payload': value})
+
+    def test_small_value_kept_inline(self):
+        wf_def = """
+        version: 1.0
+
+        tasks:
+          task1:
+            action: core.noop
+            next:
+              - publish:
+                  - payload: <% result() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        store = mem_results.ResultStore()
+        conductor = conducting.WorkflowConductor(spec, result_store=store)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        self.forward_task_statuses(conductor, 'task1', [statuses.RUNNING, statuses.SUCCEEDED],
+                                   results=[None, 'foobar'])
+
+        self.assertEqual(conductor.workflow_state.contexts[1], {'payload': 'foobar'})
+        self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
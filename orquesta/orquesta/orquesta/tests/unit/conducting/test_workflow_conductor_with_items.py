@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mock
+
 from orquesta import conducting
+from orquesta import events
+from orquesta import exceptions as exc
 from orquesta.specs import native as native_specs
 from orquesta import statuses
 from orquesta.tests.unit import base as test_base
@@ -1013,3 +1017,237 @@ class WorkflowConductorWithItemsTest(test_base.WorkflowConductorWithItemsTest):
 
         # Assert the workflow succeeded.
         self.assertEqual(conductor.get_workflow_status(), statuses.SUCCEEDED)
+
+    def test_batch_of_item_events(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+            next:
+              - publish:
+                  - items: <% result() %>
+                do: task2
+          task2:
+            action: core.noop
+
+        output:
+          - items: <% ctx(items) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductors = []
+
+        for i in range(0, 2):
+            conductor = conducting.WorkflowConductor(spec)
+            conductor.request_workflow_status(statuses.RUNNING)
+            self.assertEqual(len(conductor.get_next_tasks()[0]['actions']), 4)
+            conductors.append(conductor)
+
+        task_events = []
+
+        for status in [statuses.RUNNING, statuses.SUCCEEDED]:
+            for i, item in enumerate(['fee', 'fi', 'fo', 'fum']):
+                result = item if status == statuses.SUCCEEDED else None
+                ac_ex_event = events.ActionExecutionEvent(status, result, {'item_id': i})
+                task_events.append(('task1', 0, ac_ex_event))
+
+        # The events of the next task are in the same batch as the events that stage the task.
+        task_events.append(('task2', 0, events.ActionExecutionEvent(statuses.RUNNING)))
+        task_events.append(('task2', 0, events.ActionExecutionEvent(statuses.SUCCEEDED)))
+
+        # Apply the events one at a time to the first conductor and in a batch to the other.
+        for task_id, route, ac_ex_event in task_events:
+            conductors[0].update_task_state(task_id, route, ac_ex_event)
+
+        # The workflow output is rendered once at the end of the batch.
+        render_workflow_outputs = conductors[1]._render_workflow_outputs
+
+        with mock.patch.object(
+                conducting.WorkflowConductor,
+                '_render_workflow_outputs',
+                mock.MagicMock(side_effect=render_workflow_outputs)) as mock_render:
+            task_state_entries = conductors[1].update_task_states(task_events)
+
+        self.assertEqual(mock_render.call_count, 1)
+        self.assertEqual(len(task_state_entries), len(task_events))
+        self.assertEqual(task_state_entries[-1]['id'], 'task2')
+        self.assertEqual(task_state_entries[-1]['status'], statuses.SUCCEEDED)
+        self.assertDictEqual(conductors[1].serialize(), conductors[0].serialize())
+        self.assertEqual(conductors[1].get_workflow_status(), statuses.SUCCEEDED)
+
+        expected_output = {'items': ['fee', 'fi', 'fo', 'fum']}
+        self.assertDictEqual(conductors[1].get_workflow_output(), expected_output)
+
+    def test_batch_of_item_events_with_invalid_event(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+
+        tasks:
+          task1:
+            with: <% ctx(xs) %>
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+        conductor.get_next_tasks()
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING, context={'item_id': 0})),
+            ('task2', 0, events.ActionExecutionEvent(statuses.RUNNING))
+        ]
+
+        self.assertRaises(exc.InvalidTask, conductor.update_task_states, task_events)
+
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING, context={'item_id': 0})),
+            ('task1', 0, events.WorkflowExecutionEvent(statuses.RUNNING)),
+            ('task1', 0, {'status': statuses.RUNNING})
+        ]
+
+        self.assertRaises(TypeError, conductor.update_task_states, task_events)
+
+        # The event for a task that is not staged and has no task state entry is rejected.
+        task_events = [
+            ('task1', 0, events.ActionExecutionEvent(statuses.RUNNING, context={'item_id': 0})),
+            ('task1', 1, events.ActionExecutionEvent(statuses.RUNNING, context={'item_id': 0}))
+        ]
+
+        self.assertRaises(exc.InvalidTaskStateEntry, conductor.update_task_states, task_events)
+
+        # Assert none of the events in the batch is applied.
+        self.assertListEqual(conductor.workflow_state.sequence, [])
+
+    def test_get_next_tasks_reuses_rendered_task(self):
+        wf_def = """
+        version: 1.0
+
+        vars:
+          - xs:
+              - fee
+              - fi
+              - fo
+              - fum
+
+        tasks:
+          task1:
+            with:
+              items: <% ctx(xs) %>
+              concurrency: 2
+            action: core.echo message=<% item() %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        conductor = conducting.WorkflowConductor(spec)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        next_tasks = conductor.get_next_tasks()
+        self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [0, 1])
+
+        with mock.patch.object(conductor, '_get_task', wraps=conductor._get_task) as get_task:
+            # Assert the actions are trimmed per the item status without rendering the task.
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [0, 1])
+
+            for i in range(0, 2):
+                context = {'item_id': i}
+                ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING, context=context)
+                conductor.update_task_state('task1', 0, ac_ex_event)
+
+            self.assertListEqual(conductor.get_next_tasks(), [])
+
+            context = {'item_id': 0}
+            ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED, context=context)
+            conductor.update_task_state('task1', 0, ac_ex_event)
+
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [2])
+            self.assertEqual(next_tasks[0]['items_count'], 4)
+
+            get_task.assert_not_called()
+
+        # Assert the task is rendered again if the task is staged again.
+        conductor.workflow_state.remove_staged_task('task1', 0)
+        conductor.workflow_state.add_staged_task('task1', 0)
+
+        with mock.patch.object(conductor, '_get_task', wraps=conductor._get_task) as get_task:
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual([a['item_id'] for a in next_tasks[0]['actions']], [0, 1])
+            get_task.assert_called_once_with('task1', 0)
+
+    def test_render_only_items_to_run(self):
+        wf_def = """
+        version: 1.0
+
+        input:
+          - xs
+
+        tasks:
+          task1:
+            with:
+              items: x in <% ctx(xs) %>
+              concurrency: 2
+            action: core.echo message=<% item(x) %>
+        """
+
+        spec = native_specs.WorkflowSpec(wf_def)
+        self.assertDictEqual(spec.inspect(), {})
+
+        inputs = {'xs': ['x%s' % i for i in range(0, 10)]}
+        conductor = conducting.WorkflowConductor(spec, inputs=inputs)
+        conductor.request_workflow_status(statuses.RUNNING)
+
+        # Assert the actions match the actions for all items rendered by get_task.
+        expected_actions = conductor.get_task('task1', 0)['actions']
+        self.assertEqual(len(expected_actions), 10)
+
+        task_spec_cls = type(conductor.spec.tasks.get_task('task1'))
+        render_items = task_spec_cls.render_items
+        rendered_item_ids = []
+
+        def mock_render_items(task_spec, in_ctx, items, item_ids=None):
+            rendered_item_ids.append(list(item_ids))
+            return render_items(task_spec, in_ctx, items, item_ids)
+
+        with mock.patch.object(task_spec_cls, 'render_items', mock_render_items):
+            next_tasks = conductor.get_next_tasks()
+            self.assertEqual(next_tasks[0]['items_count'], 10)
+            self.assertListEqual(next_tasks[0]['actions'], expected_actions[0:2])
+
+            for i in range(0, 2):
+                context = {'item_id': i}
+                ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING, context=context)
+                conductor.update_task_state('task1', 0, ac_ex_event)
+
+            context = {'item_id': 1}
+            ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED, context=context)
+            conductor.update_task_state('task1', 0, ac_ex_event)
+
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual(next_tasks[0]['actions'], expected_actions[2:3])
+
+            next_tasks = conductor.get_next_tasks()
+            self.assertListEqual(next_tasks[0]['actions'], expected_actions[2:3])
+
+        # Assert only the items in the window are rendered and each item is rendered once.
+        self.assertListEqual(rendered_item_ids, [[0, 1], [2], []])
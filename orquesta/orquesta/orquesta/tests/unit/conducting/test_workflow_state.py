@@ -0,0 +1,374 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from orquesta import conducting
+from orquesta import constants
+from orquesta import events
+from orquesta import exceptions as exc
+from orquesta import machines
+from orquesta import statuses
+
+
+class WorkflowStateTest(unittest.TestCase):
+
+    def test_staged_tasks(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('task1', 0)
+        state.add_staged_task('task2', 0, ctxs=[0, 1], prev={'task1__t0': 0}, ready=False)
+        state.add_staged_task('task2', 1, ctxs=[0, 2], ready=False)
+        state.add_staged_task('task3', 0)
+
+        expected_staged = [
+            {'id': 'task1', 'route': 0, 'ctxs': {'in': [0]}, 'prev': {}, 'ready': True},
+            {
+                'id': 'task2',
+                'route': 0,
+                'ctxs': {'in': [0, 1]},
+                'prev': {'task1__t0': 0},
+                'ready': False
+            },
+            {'id': 'task2', 'route': 1, 'ctxs': {'in': [0, 2]}, 'prev': {}, 'ready': False},
+            {'id': 'task3', 'route': 0, 'ctxs': {'in': [0]}, 'prev': {}, 'ready': True}
+        ]
+
+        self.assertListEqual(state.staged, expected_staged)
+        self.assertListEqual(state.serialize()['staged'], expected_staged)
+        self.assertTrue(state.has_staged_tasks)
+
+        self.assertDictEqual(state.get_staged_task('task2', 1), expected_staged[2])
+        self.assertIsNone(state.get_staged_task('task2', 2))
+        self.assertIsNone(state.get_staged_task('task4', 0))
+
+        # Ready tasks are returned in the order they are staged.
+        state.set_staged_task_ready('task2', 1, True)
+        actual_ready = [(t['id'], t['route']) for t in state.get_staged_tasks()]
+        self.assertListEqual(actual_ready, [('task1', 0), ('task2', 1), ('task3', 0)])
+        self.assertTrue(state.get_staged_task('task2', 1)['ready'])
+
+        state.set_staged_task_ready('task1', 0, False)
+        actual_ready = [(t['id'], t['route']) for t in state.get_staged_tasks()]
+        self.assertListEqual(actual_ready, [('task2', 1), ('task3', 0)])
+
+        self.assertRaises(
+            exc.InvalidTaskStateEntry,
+            state.set_staged_task_ready,
+            'task4',
+            0,
+            True
+        )
+
+    def test_remove_staged_tasks(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('task1', 0)
+        state.add_staged_task('task2', 0, ready=False)
+
+        state.remove_staged_task('task1', 0)
+        self.assertIsNone(state.get_staged_task('task1', 0))
+        self.assertListEqual(state.get_staged_tasks(), [])
+        self.assertFalse(state.has_staged_tasks)
+        self.assertListEqual([t['id'] for t in state.staged], ['task2'])
+
+        # Task with items that are still running is not removed from staging.
+        state.set_staged_task_items('task2', 0, 2)
+        state.update_staged_task_item('task2', 0, 0, statuses.RUNNING)
+        state.update_staged_task_item('task2', 0, 1, statuses.SUCCEEDED, result='foobar')
+        state.remove_staged_task('task2', 0)
+        self.assertIsNotNone(state.get_staged_task('task2', 0))
+
+        state.update_staged_task_item('task2', 0, 0, statuses.SUCCEEDED)
+        state.remove_staged_task('task2', 0)
+        self.assertIsNone(state.get_staged_task('task2', 0))
+        self.assertListEqual(state.staged, [])
+
+        # Removing a task that is not staged is ignored.
+        state.remove_staged_task('task3', 0)
+
+    def test_staged_task_items(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('task1', 0)
+        state.set_staged_task_items('task1', 0, 4)
+
+        expected_items = [{'status': statuses.UNSET}] * 4
+        self.assertListEqual(state.get_staged_task('task1', 0)['items'], expected_items)
+        self.assertDictEqual(
+            dict(state.get_staged_task_items_status('task1', 0)),
+            {statuses.UNSET: 4}
+        )
+
+        state.update_staged_task_item('task1', 0, 0, statuses.RUNNING)
+        state.update_staged_task_item('task1', 0, 1, statuses.RUNNING)
+        state.update_staged_task_item('task1', 0, 0, statuses.SUCCEEDED, result='fee')
+
+        expected_items = [
+            {'status': statuses.SUCCEEDED, 'result': 'fee'},
+            {'status': statuses.RUNNING, 'result': None},
+            {'status': statuses.UNSET},
+            {'status': statuses.UNSET}
+        ]
+
+        self.assertListEqual(state.get_staged_task('task1', 0)['items'], expected_items)
+
+        items_status = state.get_staged_task_items_status('task1', 0)
+        self.assertEqual(items_status[statuses.SUCCEEDED], 1)
+        self.assertEqual(items_status[statuses.RUNNING], 1)
+        self.assertEqual(items_status[statuses.UNSET], 2)
+        self.assertEqual(items_status[statuses.FAILED], 0)
+
+        # Check the items are counted by status after the state is restored.
+        restored = conducting.WorkflowState.deserialize(state.serialize())
+        self.assertListEqual(restored.get_staged_task('task1', 0)['items'], expected_items)
+        self.assertEqual(restored.get_staged_task_items_status('task1', 0), items_status)
+
+        self.assertRaises(
+            exc.InvalidTaskStateEntry,
+            state.update_staged_task_item,
+            'task2',
+            0,
+            0,
+            statuses.RUNNING
+        )
+
+    def test_staged_tasks_serialization(self):
+        state = conducting.WorkflowState()
+        state.add_staged_task('task1', 0, ready=False)
+        state.add_staged_task('task2', 0)
+        state.add_staged_task('task3', 0, ready=False)
+
+        data = state.serialize()
+        restored = conducting.WorkflowState.deserialize(data)
+
+        self.assertListEqual(restored.staged, data['staged'])
+        self.assertListEqual([t['id'] for t in restored.get_staged_tasks()], ['task2'])
+        self.assertDictEqual(restored.get_staged_task('task3', 0), data['staged'][2])
+        self.assertDictEqual(restored.serialize(), data)
+
+    def _add_task_state(self, state, task_id, route, status=None):
+        entry = {'id': task_id, 'route': route, 'ctxs': {'in': [0]}, 'prev': {}, 'next': {}}
+        state.sequence.append(entry)
+        state.tasks[constants.TASK_STATE_ROUTE_FORMAT % (task_id, str(route))] = (
+            len(state.sequence) - 1
+        )
+
+        if status:
+            state.update_task_status(entry, status)
+
+        return entry
+
+    def test_task_statuses(self):
+        state = conducting.WorkflowState()
+        self.assertFalse(state.has_active_tasks)
+
+        task1 = self._add_task_state(state, 'task1', 0, statuses.RUNNING)
+        task2 = self._add_task_state(state, 'task2', 0, statuses.RUNNING)
+        self.assertTrue(state.has_active_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [task1, task2])
+
+        state.update_task_status(task1, statuses.PAUSING)
+        self.assertTrue(state.has_pausing_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [task2])
+
+        state.update_task_status(task1, statuses.PAUSED)
+        self.assertFalse(state.has_pausing_tasks)
+        self.assertTrue(state.has_paused_tasks)
+
+        state.update_task_status(task2, statuses.CANCELING)
+        self.assertTrue(state.has_canceling_tasks)
+        self.assertFalse(state.has_canceled_tasks)
+        self.assertListEqual(state.get_tasks_by_status(statuses.ACTIVE_STATUSES), [task2])
+
+        state.update_task_status(task2, statuses.CANCELED)
+        self.assertTrue(state.has_canceled_tasks)
+        self.assertFalse(state.has_canceling_tasks)
+        self.assertFalse(state.has_active_tasks)
+        self.assertEqual(task2['status'], statuses.CANCELED)
+
+    def test_task_statuses_from_state_machine(self):
+        state = conducting.WorkflowState()
+        task1 = self._add_task_state(state, 'task1', 0)
+
+        ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING)
+        machines.TaskStateMachine.process_event(state, task1, ac_ex_event)
+        self.assertTrue(state.has_active_tasks)
+
+        ac_ex_event = events.ActionExecutionEvent(statuses.SUCCEEDED)
+        machines.TaskStateMachine.process_event(state, task1, ac_ex_event)
+        self.assertFalse(state.has_active_tasks)
+        self.assertListEqual(state.get_tasks_by_status([statuses.SUCCEEDED]), [task1])
+
+        # Cycle back to the same task which creates a new task state entry.
+        task1_cycle = self._add_task_state(state, 'task1', 0)
+        ac_ex_event = events.ActionExecutionEvent(statuses.RUNNING)
+        machines.TaskStateMachine.process_event(state, task1_cycle, ac_ex_event)
+        self.assertListEqual(state.get_tasks_by_status([statuses.RUNNING]), [task1_cycle])
+        self.assertListEqual(state.get_tasks_by_status([statuses.SUCCEEDED]), [task1])
+
+    def test_task_statuses_serialization(self):
+        state = conducting.WorkflowState()
+        self._add_task_state(state, 'task1', 0, statuses.SUCCEEDED)
+        self._add_task_state(state, 'task2', 0, statuses.PAUSED)
+        self._add_task_state(state, 'task3', 0, statuses.RUNNING)
+
+        restored = conducting.WorkflowState.deserialize(state.serialize())
+        self.assertTrue(restored.has_active_tasks)
+        self.assertTrue(restored.has_paused_tasks)
+        self.assertFalse(restored.has_canceled_tasks)
+
+        task3 = restored.get_task('task3', 0)
+        self.assertListEqual(restored.get_tasks_by_status([statuses.RUNNING]), [task3])
+        restored.update_task_status(task3, statuses.SUCCEEDED)
+        self.assertFalse(restored.has_active_tasks)
+
+    def test_get_context(self):
+        state = conducting.WorkflowState()
+        state.contexts.append({'a': 1, 'x': {'y': 1}})
+        state.contexts.append({'b': 2, 'x': {'z': 2}})
+        state.contexts.append({'a': 3})
+
+        expected_ctx = {'a': 3, 'b': 2, 'x': {'y': 1, 'z': 2}}
+        self.assertDictEqual(state.get_context([0, 1, 2]), expected_ctx)
+        self.assertDictEqual(state.get_context([0, 2]), {'a': 3, 'x': {'y': 1}})
+        self.assertDictEqual(state.get_context([]), {})
+
+        # Check the merged contexts are cached for the leading context indices.
+        cached_keys = [(0,), (0, 1), (0, 1, 2), (0, 2)]
+        self.assertListEqual(sorted(state._contexts_cache.keys()), cached_keys)
+
+        # Check the contexts in the list are not modified by the merge.
+        self.assertDictEqual(state.contexts[0], {'a': 1, 'x': {'y': 1}})
+
+        # Check changes to the returned context do not change the cached context.
+        ctx = state.get_context([0, 1, 2])
+        ctx['c'] = 4
+        self.assertDictEqual(state.get_context([0, 1, 2]), expected_ctx)
+
+        # Check the context appended later is merged.
+        state.contexts.append({'c': 4})
+        expected_ctx = {'a': 3, 'b': 2, 'c': 4, 'x': {'y': 1, 'z': 2}}
+        self.assertDictEqual(state.get_context([0, 1, 2, 3]), expected_ctx)
+
+        # Check the cache is reset when the contexts are replaced.
+        state.contexts = [{'a': 5}]
+        self.assertDictEqual(state.get_context([0]), {'a': 5})
+        self.assertListEqual(list(state._contexts_cache.keys()), [(0,)])
+
+    def test_get_context_cache_size(self):
+        state = conducting.WorkflowState()
+        state.contexts_cache_size = 3
+
+        for i in range(0, 5):
+            state.contexts.append({'k%s' % i: i})
+
+        expected_ctx = {'k0': 0, 'k1': 1, 'k2': 2, 'k3': 3, 'k4': 4}
+        self.assertDictEqual(state.get_context([0, 1, 2, 3, 4]), expected_ctx)
+
+        cached_keys = [(0, 1, 2), (0, 1, 2, 3), (0, 1, 2, 3, 4)]
+        self.assertListEqual(list(state._contexts_cache.keys()), cached_keys)
+
+    def test_compact_contexts(self):
+        state = conducting.WorkflowState()
+        state.contexts.append({'count': 0, 'x': {'y': 1}})
+        state.contexts.append({'count': 1})
+        state.contexts.append({'unused': True})
+        state.contexts.append({'count': 2, 'x': {'z': 2}})
+        state.contexts.append({'count': 3, 'x': 'foobar'})
+        state.contexts.append({})
+
+        task1 = self._add_task_state(state, 'task1', 0)
+        task1['ctxs'] = {'in': [0, 1], 'out': {'task2__t0': 3}}
+        task2 = self._add_task_state(state, 'task2', 0)
+        task2['ctxs'] = {'in': [0, 1, 3]}
+        task3 = self._add_task_state(state, 'task3', 0)
+        task3['ctxs'] = {'in': [0, 1, 3, 4, 5]}
+        staged_task = state.add_staged_task('task4', 0, ctxs=task3['ctxs']['in'])
+
+        expected_ctxs = [
+            state.get_context(task1['ctxs']['in']),
+            state.get_context(task2['ctxs']['in']),
+            state.get_context(task3['ctxs']['in'])
+        ]
+
+        state.checkpoint()
+        self.assertEqual(state.compact_contexts(), 2)
+
+        # Check the contexts that are replaced or not referenced are removed.
+        expected_contexts = [
+            {'count': 0, 'x': {'y': 1}},
+            {'count': 1},
+            {'count': 2, 'x': {'z': 2}},
+            {'count': 3, 'x': 'foobar'}
+        ]
+
+        self.assertListEqual(state.contexts, expected_contexts)
+
+        # Check the context indices are remapped and the merged contexts are the same.
+        self.assertDictEqual(task1['ctxs'], {'in': [0, 1], 'out': {'task2__t0': 2}})
+        self.assertDictEqual(task2['ctxs'], {'in': [0, 2]})
+        self.assertDictEqual(task3['ctxs'], {'in': [0, 3]})
+        self.assertIs(staged_task['ctxs']['in'], task3['ctxs']['in'])
+
+        actual_ctxs = [state.get_context(t['ctxs']['in']) for t in [task1, task2, task3]]
+        self.assertListEqual(actual_ctxs, expected_ctxs)
+
+        # Check the compacted contexts are included in the delta.
+        delta = state.serialize_delta()
+        self.assertDictEqual(
+            delta['contexts'],
+            {'start': 0, 'entries': expected_contexts, 'replaced': True}
+        )
+
+        self.assertListEqual([idx for idx, _ in delta['sequence']['changed']], [0, 1, 2])
+        self.assertListEqual([t['id'] for t in delta['staged']['entries']], ['task4'])
+
+    def test_compact_contexts_not_on_threshold_by_default(self):
+        state = conducting.WorkflowState()
+        state.contexts = [{}]
+        task1 = self._add_task_state(state, 'task1', 0)
+
+        for i in range(1, 1000):
+            state.contexts.append({'count': i})
+            task1['ctxs']['in'].append(i)
+
+        self.assertFalse(state.compact_contexts_on_threshold())
+        self.assertEqual(len(state.contexts), 1000)
+
+    def test_compact_contexts_on_threshold(self):
+        state = conducting.WorkflowState()
+        state.contexts_compaction_threshold = 3
+        state.contexts = [{}]
+        task1 = self._add_task_state(state, 'task1', 0)
+
+        for i in range(1, 3):
+            state.contexts.append({'count': i})
+            task1['ctxs']['in'].append(i)
+
+        self.assertFalse(state.compact_contexts_on_threshold())
+        self.assertEqual(len(state.contexts), 3)
+
+        state.contexts.append({'count': 3})
+        task1['ctxs']['in'].append(3)
+
+        self.assertTrue(state.compact_contexts_on_threshold())
+        self.assertListEqual(state.contexts, [{}, {'count': 3}])
+        self.assertListEqual(task1['ctxs']['in'], [0, 1])
+
+        # Check the contexts are not compacted until the threshold is crossed again.
+        state.contexts.append({'count': 4})
+        self.assertFalse(state.compact_contexts_on_threshold())
+
+        # Check the contexts are not compacted if there is no threshold.
+        state.contexts_compaction_threshold = None
+        state.contexts.extend([{}, {}, {}])
+        self.assertFalse(state.compact_contexts_on_threshold())
@@ -19,6 +19,7 @@ from orquesta import constants
 from orquesta import exceptions as exc
 from orquesta.expressions.functions import workflow as funcs
 from orquesta import statuses
+from orquesta.utils import views as view_util
 
 
 class WorkflowFunctionTest(unittest.TestCase):
@@ -409,3 +410,26 @@ class WorkflowFunctionTest(unittest.TestCase):
         self.assertEqual(funcs.task_status_(current_ctx, 't5'), statuses.FAILED)
         self.assertEqual(funcs.task_status_(current_ctx, 't6'), statuses.FAILED)
         self.assertEqual(funcs.task_status_(current_ctx, 't7'), statuses.DELAYED)
+
+    def test_task_status_from_state_view(self):
+        task_name = 't1'
+        task_flow_pointer_id = constants.TASK_STATE_ROUTE_FORMAT % (task_name, '0')
+
+        state = {
+            'routes': [[], ['t0__t0']],
+            'tasks': {task_flow_pointer_id: 0},
+            'sequence': [{'status': statuses.RUNNING}]
+        }
+
+        context = {
+            '__current_task': {'id': task_name, 'route': 1},
+            '__state': view_util.freeze(state)
+        }
+
+        self.assertEqual(funcs.task_status_(context, task_name), statuses.RUNNING)
+        self.assertFalse(funcs.succeeded_(context))
+
+        # Changes to the underlying state are visible thru the view.
+        state['sequence'][0]['status'] = statuses.SUCCEEDED
+        self.assertEqual(funcs.task_status_(context, task_name), statuses.SUCCEEDED)
+        self.assertTrue(funcs.succeeded_(context))
@@ -13,6 +13,10 @@
 # limitations under the License.
 
 import copy
+import json
+import mock
+
+from networkx.readwrite import json_graph
 
 from orquesta import exceptions as exc
 from orquesta import graphing
@@ -361,3 +365,120 @@ class WorkflowGraphTest(test_base.WorkflowGraphTest):
             len(wf_graph.get_prev_transitions('task9')) > 1 and
             not wf_graph.has_barrier('task9')
         )
+
+    def test_freeze(self):
+        wf_graph = self._prep_graph()
+        wf_graph.add_transition('task6', 'task5')
+        wf_graph.add_transition('task8', 'task8')
+
+        frozen_graph = wf_graph.freeze(is_split_task=lambda x: x == 'task9')
+
+        self.assertListEqual(frozen_graph.roots, wf_graph.roots)
+        self.assertListEqual(frozen_graph.leaves, wf_graph.leaves)
+
+        for i in range(1, 10):
+            task_id = 'task' + str(i)
+            self.assertTrue(frozen_graph.has_task(task_id))
+            self.assertEqual(frozen_graph.in_cycle(task_id), bool(wf_graph.in_cycle(task_id)))
+            self.assertEqual(frozen_graph.has_barrier(task_id), wf_graph.has_barrier(task_id))
+            self.assertEqual(frozen_graph.is_split_task(task_id), task_id == 'task9')
+
+            self.assertListEqual(
+                list(frozen_graph.get_next_transitions(task_id)),
+                wf_graph.get_next_transitions(task_id)
+            )
+
+            self.assertListEqual(
+                list(frozen_graph.get_prev_transitions(task_id)),
+                wf_graph.get_prev_transitions(task_id)
+            )
+
+        components = [frozen_graph.get_component('task' + str(i)) for i in range(4, 7)]
+        self.assertNotEqual(components[0], components[1])
+        self.assertEqual(components[1], components[2])
+        self.assertFalse(frozen_graph.has_task('task0'))
+        self.assertFalse(frozen_graph.in_cycle('task0'))
+        self.assertTupleEqual(frozen_graph.get_next_transitions('task0'), ())
+        self.assertRaises(exc.InvalidTask, frozen_graph.get_barrier, 'task0')
+        self.assertRaises(exc.InvalidTask, wf_graph.get_barrier, 'task0')
+
+        # The frozen graph is not changed when the graph is changed.
+        wf_graph.add_transition('task9', 'task1')
+        self.assertFalse(frozen_graph.in_cycle('task1'))
+        self.assertTupleEqual(frozen_graph.get_next_transitions('task9'), ())
+
+
+class NativeWorkflowGraphTest(WorkflowGraphTest):
+
+    def setUp(self):
+        super(NativeWorkflowGraphTest, self).setUp()
+        patcher = mock.patch.object(graphing.WorkflowGraph, 'backend', 'native')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _prep_graphs(self):
+        wf_graphs = {}
+
+        for backend in ['networkx', 'native']:
+            with mock.patch.object(graphing.WorkflowGraph, 'backend', backend):
+                wf_graphs[backend] = self._prep_graph()
+
+                # Add a cycle and a duplicate transition between the same tasks.
+                wf_graphs[backend].add_transition('task6', 'task3')
+                wf_graphs[backend].add_transition('task1', 'task2', attr1='fubar')
+
+        return wf_graphs
+
+    def test_graph_backend(self):
+        wf_graph = graphing.WorkflowGraph()
+        self.assertIsInstance(wf_graph._graph, graphing.NativeGraphBackend)
+        self.assertRaises(ValueError, graphing.get_graph_backend, 'foobar')
+
+    def test_graph_from_networkx_graph(self):
+        data = self._prep_graph().serialize()
+        nx_graph = json_graph.adjacency_graph(copy.deepcopy(data), directed=True, multigraph=True)
+
+        # The networkx graph is accepted as is for backward compatibility.
+        wf_graph = graphing.WorkflowGraph(graph=nx_graph)
+
+        self.assertIsInstance(wf_graph._graph, graphing.NetworkxGraphBackend)
+        self.assertIs(wf_graph._graph._graph, nx_graph)
+        self.assertTrue(wf_graph.has_task('task1'))
+        self.assertEqual(json.dumps(wf_graph.serialize()), json.dumps(data))
+
+    def test_serialization(self):
+        wf_graphs = self._prep_graphs()
+        data = wf_graphs['networkx'].serialize()
+
+        # The serialized graph is the same for the networkx and the native graph.
+        self.assertEqual(json.dumps(wf_graphs['native'].serialize()), json.dumps(data))
+
+        for backend in ['networkx', 'native']:
+            with mock.patch.object(graphing.WorkflowGraph, 'backend', backend):
+                wf_graph = graphing.WorkflowGraph.deserialize(data)
+
+            self.assertIsInstance(wf_graph._graph, graphing.get_graph_backend(backend))
+            self.assertEqual(json.dumps(wf_graph.serialize()), json.dumps(data))
+
+    def test_cycles(self):
+        wf_graphs = self._prep_graphs()
+
+        # The cycles may start at any task of the cycle so the tasks are sorted.
+        for i in range(1, 10):
+            task_id = 'task' + str(i)
+
+            self.assertListEqual(
+                [sorted(c) for c in wf_graphs['native'].in_cycle(task_id)],
+                [sorted(c) for c in wf_graphs['networkx'].in_cycle(task_id)]
+            )
+
+        cycles = wf_graphs['native'].get_cycles()
+        self.assertListEqual([c['tasks'] for c in cycles], [['task3', 'task5', 'task6']])
+        self.assertListEqual(sorted(cycles[0]['route']), [
+            ('task3', 'task5', 0),
+            ('task5', 'task6', 0),
+            ('task6', 'task3', 0)
+        ])
+
+        components = wf_graphs['native']._graph.strongly_connected_components()
+        self.assertIn({'task3', 'task5', 'task6'}, list(components))
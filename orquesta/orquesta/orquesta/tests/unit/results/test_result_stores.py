@@ -0,0 +1,142 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+from orquesta import exceptions as exc
+from orquesta.results import base as result_base
+from orquesta.results import filesystem as fs_results
+from orquesta.results import memory as mem_results
+from orquesta.results import sqlite as sqlite_results
+
+
+class ResultStoreTestMixin(object):
+
+    def test_store_small_value(self):
+        store = self.get_store(size_threshold=64)
+
+        for value in [None, 'foobar', 123, ['fee', 'fi'], {'foo': 'bar'}]:
+            self.assertEqual(store.store(value), value)
+            self.assertEqual(store.load(value), value)
+
+    def test_store_large_value(self):
+        store = self.get_store(size_threshold=64)
+        value = {'items': ['foobar'] * 100}
+
+        ref = store.store(value)
+
+        self.assertTrue(result_base.is_result_ref(ref))
+        self.assertDictEqual(store.load(ref), value)
+
+        # Each stored value is assigned a unique reference.
+        self.assertNotEqual(store.store(value), ref)
+
+    def test_store_value_with_reference_layout(self):
+        store = self.get_store(size_threshold=64)
+        value = {result_base.RESULT_REF_KEY: 'foobar'}
+
+        # A small value that looks like a reference is kept in the store.
+        ref = store.store(value)
+
+        self.assertNotEqual(ref, value)
+        self.assertTrue(result_base.is_result_ref(ref))
+        self.assertDictEqual(store.load(ref), value)
+
+    def test_bind_context(self):
+        store = self.get_store(size_threshold=64)
+        value = ['foobar'] * 100
+        ctx = {'x': store.store(value), 'y': 'foobar'}
+
+        bound_ctx = store.bind_context(ctx)
+        self.assertIsInstance(bound_ctx['x'], result_base.ResultRef)
+        self.assertEqual(bound_ctx['y'], 'foobar')
+        self.assertTrue(result_base.is_result_ref(ctx['x']))
+
+        # The value is loaded when the reference is resolved.
+        self.assertDictEqual(result_base.resolve_all(bound_ctx), {'x': value, 'y': 'foobar'})
+        self.assertListEqual(result_base.resolve(bound_ctx['x']), value)
+        self.assertIsInstance(bound_ctx['x'], result_base.ResultRef)
+
+    def test_merge_contexts(self):
+        store = self.get_store(size_threshold=0)
+        left = store.bind_context({'x': {'a': 1}, 'y': store.store({'b': 2}), 'z': 'foo'})
+        right = store.bind_context({'x': store.store({'c': 3}), 'y': {'d': 4}, 'z': 'bar'})
+
+        ctx = result_base.merge_contexts(left, right)
+
+        # The references and the dicts under the same key are merged when the value is read.
+        self.assertIsInstance(ctx['x'], result_base.MergedResultRef)
+        self.assertIsInstance(ctx['y'], result_base.MergedResultRef)
+        self.assertEqual(ctx['z'], 'bar')
+
+        expected_ctx = {'x': {'a': 1, 'c': 3}, 'y': {'b': 2, 'd': 4}, 'z': 'bar'}
+        self.assertDictEqual(result_base.resolve_all(ctx), expected_ctx)
+        self.assertDictEqual(left['x'], {'a': 1})
+
+        # The reference to a value that is not a dict replaces the value merged before it.
+        right = store.bind_context({'x': store.store('foobar')})
+        ctx = result_base.merge_contexts(ctx, right)
+        self.assertEqual(result_base.resolve(ctx['x']), 'foobar')
+
+    def test_remove_value(self):
+        store = self.get_store(size_threshold=64)
+        ref = store.store('foobar' * 100)
+
+        store.remove(ref)
+
+        self.assertRaises(exc.ResultNotFound, store.load, ref)
+
+        # Removing a value that is not a reference is a no op.
+        store.remove('foobar')
+
+    def test_get_missing_key(self):
+        store = self.get_store()
+        self.assertRaises(exc.ResultNotFound, store.get, 'foobar')
+
+
+class MemoryResultStoreTest(ResultStoreTestMixin, unittest.TestCase):
+
+    def get_store(self, size_threshold=None):
+        return mem_results.ResultStore(size_threshold=size_threshold)
+
+    def test_get_result_store(self):
+        store = result_base.get_result_store('memory', size_threshold=1)
+        self.assertIsInstance(store, mem_results.ResultStore)
+        self.assertEqual(store.size_threshold, 1)
+
+
+class FileSystemResultStoreTest(ResultStoreTestMixin, unittest.TestCase):
+
+    def setUp(self):
+        super(FileSystemResultStoreTest, self).setUp()
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+        super(FileSystemResultStoreTest, self).tearDown()
+
+    def get_store(self, size_threshold=None):
+        return fs_results.ResultStore(self.path, size_threshold=size_threshold)
+
+    def test_store_is_persisted(self):
+        ref = self.get_store(size_threshold=0).store({'foo': 'bar'})
+        self.assertDictEqual(self.get_store().load(ref), {'foo': 'bar'})
+
+
+class SQLiteResultStoreTest(ResultStoreTestMixin, unittest.TestCase):
+
+    def get_store(self, size_threshold=None):
+        return sqlite_results.ResultStore(size_threshold=size_threshold)
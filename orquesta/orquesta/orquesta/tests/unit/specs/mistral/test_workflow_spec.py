@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
+
 from orquesta.specs import mistral as mistral_specs
 from orquesta.tests.unit.specs.mistral import base as test_base
 
@@ -108,6 +110,25 @@ class WorkflowSpecTest(test_base.MistralWorkflowSpecTest):
             [('task5', None, 'on-success'), ('task6', None, 'on-success')]
         )
 
+    def test_get_prev_tasks_by_conditions(self):
+        wf_name = 'split'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertListEqual(
+            wf_spec.tasks.get_prev_tasks('task4', conditions=['on-success']),
+            [('task2', None, 'on-success'), ('task3', None, 'on-success')]
+        )
+
+        self.assertListEqual(
+            wf_spec.tasks.get_prev_tasks('task4', conditions=['on-error']),
+            []
+        )
+
+        self.assertListEqual(
+            wf_spec.tasks.get_next_tasks('task1', conditions=['on-error']),
+            []
+        )
+
     def test_get_start_tasks(self):
         wf_name = 'split'
         wf_spec = self.get_wf_spec(wf_name)
@@ -148,3 +169,100 @@ class WorkflowSpecTest(test_base.MistralWorkflowSpecTest):
         wf_spec = self.get_wf_spec(wf_name)
 
         self.assertTrue(wf_spec.tasks.in_cycle('task1'))
+
+    def test_in_cycle_with_branches(self):
+        wf_def = {
+            'version': '2.0',
+            'branches': {
+                'tasks': {
+                    'task1': {'action': 'std.noop', 'on-success': ['task2', 'task3']},
+                    'task2': {'action': 'std.noop', 'on-success': ['task4']},
+                    'task3': {'action': 'std.noop', 'on-success': ['task4']},
+                    'task4': {'action': 'std.noop', 'on-success': ['task1']}
+                }
+            }
+        }
+
+        wf_spec = mistral_specs.instantiate(wf_def)
+
+        # The traversal from task1 returns on task4 which is reached from both branches
+        # before it gets back to task1 so task1 is not identified as in the cycle.
+        self.assertFalse(wf_spec.tasks.in_cycle('task1'))
+        self.assertTrue(wf_spec.tasks.in_cycle('task2'))
+        self.assertTrue(wf_spec.tasks.in_cycle('task3'))
+        self.assertTrue(wf_spec.tasks.in_cycle('task4'))
+        self.assertTrue(wf_spec.tasks.has_cycles())
+
+        # The cycles reported include all the tasks in the cycle.
+        self.assertListEqual(
+            wf_spec.tasks.get_cycles(),
+            [['task1', 'task2', 'task3', 'task4']]
+        )
+
+    def test_in_cycle_by_traversal(self):
+        def in_cycle(tasks, task_name):
+            # Traverse the tasks the same way as the original implementation of in_cycle.
+            traversed = []
+            q = [t for t in tasks[task_name]]
+
+            while q:
+                next_task_name = q.pop(0)
+
+                if next_task_name == task_name:
+                    return True
+
+                if next_task_name in traversed:
+                    return False
+
+                q.extend(tasks[next_task_name])
+                traversed.append(next_task_name)
+
+            return False
+
+        rand = random.Random(0)
+
+        for i in range(0, 100):
+            task_names = ['task' + str(j) for j in range(0, 8)]
+
+            tasks = dict(
+                (task_name, sorted(rand.sample(task_names, rand.randint(0, 2))))
+                for task_name in task_names
+            )
+
+            wf_def = {
+                'version': '2.0',
+                'random': {
+                    'tasks': dict(
+                        (task_name, {'action': 'std.noop', 'on-success': next_task_names})
+                        for task_name, next_task_names in tasks.items()
+                    )
+                }
+            }
+
+            wf_spec = mistral_specs.instantiate(wf_def)
+
+            for task_name in task_names:
+                self.assertEqual(
+                    wf_spec.tasks.in_cycle(task_name),
+                    in_cycle(tasks, task_name)
+                )
+
+            self.assertEqual(
+                wf_spec.tasks.has_cycles(),
+                any(in_cycle(tasks, task_name) for task_name in task_names)
+            )
+
+    def test_get_cycles(self):
+        wf_name = 'cycles'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertListEqual(
+            wf_spec.tasks.get_cycles(),
+            [['task1', 'task2', 'task3', 'task4', 'task5']]
+        )
+
+        wf_name = 'split'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertFalse(wf_spec.tasks.has_cycles())
+        self.assertListEqual(wf_spec.tasks.get_cycles(), [])
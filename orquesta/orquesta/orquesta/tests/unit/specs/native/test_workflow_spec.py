@@ -146,6 +146,46 @@ class WorkflowSpecTest(test_base.OrchestraWorkflowSpecTest):
 
         self.assertDictEqual(wf_spec_2.serialize(), wf_spec_1.serialize())
 
+    def test_get_next_tasks(self):
+        wf_name = 'split'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertListEqual(
+            wf_spec.tasks.get_next_tasks('task1'),
+            [('task2', '<% succeeded() %>', 0), ('task3', '<% succeeded() %>', 0)]
+        )
+
+        self.assertListEqual(
+            wf_spec.tasks.get_next_tasks('task4'),
+            [('task5', '<% succeeded() %>', 0), ('task6', '<% succeeded() %>', 0)]
+        )
+
+        self.assertListEqual(wf_spec.tasks.get_next_tasks('task7'), [])
+        self.assertListEqual(wf_spec.tasks.get_next_tasks('fail'), [])
+        self.assertRaises(KeyError, wf_spec.tasks.get_next_tasks, 'task8')
+
+        # The task transitions are indexed so changes to the result are not kept.
+        wf_spec.tasks.get_next_tasks('task7').append(('task1', None, 0))
+        self.assertListEqual(wf_spec.tasks.get_next_tasks('task7'), [])
+
+    def test_get_prev_tasks(self):
+        wf_name = 'split'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertListEqual(wf_spec.tasks.get_prev_tasks('task1'), [])
+
+        self.assertListEqual(
+            wf_spec.tasks.get_prev_tasks('task4'),
+            [('task2', '<% succeeded() %>', 0), ('task3', '<% succeeded() %>', 0)]
+        )
+
+        self.assertListEqual(
+            wf_spec.tasks.get_prev_tasks('task7'),
+            [('task5', '<% succeeded() %>', 0), ('task6', '<% succeeded() %>', 0)]
+        )
+
+        self.assertListEqual(wf_spec.tasks.get_prev_tasks('task8'), [])
+
     def test_get_start_tasks(self):
         wf_name = 'split'
         wf_spec = self.get_wf_spec(wf_name)
@@ -200,3 +240,39 @@ class WorkflowSpecTest(test_base.OrchestraWorkflowSpecTest):
         self.assertTrue(wf_spec.tasks.in_cycle('task3'))
         self.assertTrue(wf_spec.tasks.in_cycle('task4'))
         self.assertTrue(wf_spec.tasks.in_cycle('task5'))
+
+    def test_get_cycles(self):
+        wf_name = 'cycle-fork'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertListEqual(
+            wf_spec.tasks.get_cycles(),
+            [['decide_work', 'query', 'toil']]
+        )
+
+        wf_name = 'split'
+        wf_spec = self.get_wf_spec(wf_name)
+
+        self.assertFalse(wf_spec.tasks.has_cycles())
+        self.assertListEqual(wf_spec.tasks.get_cycles(), [])
+
+    def test_in_cycle_of_self(self):
+        wf_def = """
+            version: 1.0
+            tasks:
+              task1:
+                action: core.noop
+                next:
+                  - do: task2
+              task2:
+                action: core.noop
+                next:
+                  - when: <% failed() %>
+                    do: task2
+        """
+
+        wf_spec = native_specs.WorkflowSpec(wf_def)
+
+        self.assertFalse(wf_spec.tasks.in_cycle('task1'))
+        self.assertTrue(wf_spec.tasks.in_cycle('task2'))
+        self.assertListEqual(wf_spec.tasks.get_cycles(), [['task2']])
@@ -147,3 +147,52 @@ class StateTransitionTest(unittest.TestCase):
         for x, y in cases:
             expected = (x == y or y in machines.TASK_STATE_MACHINE_DATA[x].values())
             self.assertEqual(machines.TaskStateMachine.is_transition_valid(x, y), expected)
+
+    def test_compiled_transitions(self):
+        transitions = dict(
+            ((x, e), y)
+            for x in machines.TASK_STATE_MACHINE_DATA.keys()
+            for e, y in machines.TASK_STATE_MACHINE_DATA[x].items()
+        )
+
+        self.assertDictEqual(machines.TASK_STATE_MACHINE_TRANSITIONS, transitions)
+
+        valid_transitions = set((x, y) for (x, _), y in transitions.items())
+        valid_transitions.update((x, x) for x in machines.TASK_STATE_MACHINE_DATA.keys())
+
+        self.assertSetEqual(set(machines.TASK_STATE_MACHINE_VALID_TRANSITIONS), valid_transitions)
+
+    def test_compiled_event_names(self):
+        event_names = machines.ACTION_EVENT_NAMES
+
+        flags = machines.TASK_ACTIVE | machines.ITEMS_INCOMPLETE
+
+        self.assertEqual(
+            event_names[(events.ACTION_SUCCEEDED, flags)],
+            events.ACTION_SUCCEEDED_TASK_ACTIVE_ITEMS_INCOMPLETE
+        )
+
+        self.assertEqual(
+            event_names[(events.ACTION_SUCCEEDED, 0)],
+            events.ACTION_SUCCEEDED_TASK_DORMANT_ITEMS_COMPLETED
+        )
+
+        # Paused items have precedence over canceled and failed items when task is dormant.
+        flags = machines.ITEMS_INCOMPLETE | machines.ITEMS_PAUSED | machines.ITEMS_CANCELED
+
+        self.assertEqual(
+            event_names[(events.ACTION_FAILED, flags)],
+            events.ACTION_FAILED_TASK_DORMANT_ITEMS_PAUSED
+        )
+
+        self.assertEqual(
+            event_names[(events.ACTION_FAILED, flags | machines.TASK_ACTIVE)],
+            events.ACTION_FAILED_TASK_ACTIVE_ITEMS_INCOMPLETE
+        )
+
+        event_names = machines.TASK_WORKFLOW_EVENT_NAMES
+
+        self.assertEqual(
+            event_names[(events.WORKFLOW_PAUSING, machines.ITEMS_INCOMPLETE)],
+            events.WORKFLOW_PAUSING_TASK_DORMANT_ITEMS_INCOMPLETE
+        )
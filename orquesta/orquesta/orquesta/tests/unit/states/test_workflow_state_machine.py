@@ -169,3 +169,56 @@ class StateTransitionTest(unittest.TestCase):
         for x, y in cases:
             expected = (x == y or y in machines.WORKFLOW_STATE_MACHINE_DATA[x].values())
             self.assertEqual(machines.WorkflowStateMachine.is_transition_valid(x, y), expected)
+
+    def test_compiled_transitions(self):
+        transitions = dict(
+            ((x, e), y)
+            for x in machines.WORKFLOW_STATE_MACHINE_DATA.keys()
+            for e, y in machines.WORKFLOW_STATE_MACHINE_DATA[x].items()
+        )
+
+        self.assertDictEqual(machines.WORKFLOW_STATE_MACHINE_TRANSITIONS, transitions)
+
+        valid_transitions = set((x, y) for (x, _), y in transitions.items())
+        valid_transitions.update((x, x) for x in machines.WORKFLOW_STATE_MACHINE_DATA.keys())
+
+        self.assertSetEqual(
+            set(machines.WORKFLOW_STATE_MACHINE_VALID_TRANSITIONS),
+            valid_transitions
+        )
+
+    def test_compiled_event_names(self):
+        event_names = machines.TASK_EVENT_NAMES
+
+        self.assertEqual(
+            event_names[(events.TASK_FAILED, machines.WORKFLOW_ACTIVE)],
+            events.TASK_FAILED_WORKFLOW_ACTIVE
+        )
+
+        self.assertEqual(
+            event_names[(events.TASK_SUCCEEDED, 0)],
+            events.TASK_SUCCEEDED_WORKFLOW_DORMANT_COMPLETED
+        )
+
+        # Cancelation has precedence over pause and incomplete.
+        flags = (
+            machines.WORKFLOW_INCOMPLETE |
+            machines.WORKFLOW_PAUSED |
+            machines.WORKFLOW_CANCELED
+        )
+
+        self.assertEqual(
+            event_names[(events.TASK_REMEDIATED, flags | machines.WORKFLOW_ACTIVE)],
+            events.TASK_REMEDIATED_WORKFLOW_ACTIVE_CANCELED
+        )
+
+        self.assertEqual(
+            event_names[(events.TASK_SUCCEEDED, machines.WORKFLOW_INCOMPLETE)],
+            events.TASK_SUCCEEDED_WORKFLOW_DORMANT_INCOMPLETE
+        )
+
+        # Only the task succeeded and remediated events are checked for completion.
+        self.assertEqual(
+            event_names[(events.TASK_PAUSED, flags)],
+            events.TASK_PAUSED_WORKFLOW_DORMANT
+        )
@@ -38,6 +38,25 @@ class ContextUtilTest(unittest.TestCase):
 
         self.assertDictEqual(context, expected_context)
 
+    def test_set_current_task_does_not_copy_values(self):
+        context = {'var1': {'foo': 'bar'}}
+        task = {'id': 't1', 'route': 0}
+
+        new_context = ctx_util.set_current_task(context, task)
+
+        self.assertNotIn('__current_task', context)
+        self.assertIs(new_context['var1'], context['var1'])
+
+    def test_set_current_item(self):
+        context = {'var1': {'foo': 'bar'}}
+
+        new_context = ctx_util.set_current_item(context, 'fee')
+        expected_context = {'var1': {'foo': 'bar'}, '__current_item': 'fee'}
+
+        self.assertDictEqual(new_context, expected_context)
+        self.assertNotIn('__current_item', context)
+        self.assertIs(new_context['var1'], context['var1'])
+
     def test_set_current_task_nonetype_context(self):
         task = {'id': 't1', 'route': 0}
 
@@ -83,6 +83,46 @@ class DictUtilsTest(unittest.TestCase):
 
         self.assertDictEqual(left, expected)
 
+    def test_dict_merge_copy_on_write(self):
+        left = copy.deepcopy(LEFT)
+        right = copy.deepcopy(RIGHT)
+
+        merged = dict_util.merge_dicts(left, right, copy_on_write=True)
+
+        expected = {
+            'k1': '123',
+            'k2': 'def',
+            'k3': {
+                'k31': True,
+                'k32': 2.0,
+                'k33': {
+                    'k331': 'foo'
+                }
+            },
+            'k4': 'bar'
+        }
+
+        self.assertDictEqual(merged, expected)
+
+        # Check the original dicts are not modified.
+        self.assertDictEqual(left, LEFT)
+        self.assertDictEqual(right, RIGHT)
+
+        # Check the values that are not merged are shared and not copied.
+        self.assertIsNot(merged['k3'], left['k3'])
+        self.assertIs(merged['k3']['k33'], right['k3']['k33'])
+
+    def test_dict_merge_copy_on_write_nonetype(self):
+        left = copy.deepcopy(LEFT)
+
+        merged = dict_util.merge_dicts(None, left, copy_on_write=True)
+        self.assertDictEqual(merged, LEFT)
+        self.assertIsNot(merged, left)
+
+        merged = dict_util.merge_dicts(left, None, copy_on_write=True)
+        self.assertDictEqual(merged, LEFT)
+        self.assertIsNot(merged, left)
+
     def test_dict_dot_notation_access(self):
         data = {
             'a': 'foo',
@@ -0,0 +1,87 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import unittest
+
+from orquesta.utils import snapshot as snapshot_util
+
+
+class SnapshotTest(unittest.TestCase):
+
+    def test_encode_decode(self):
+        value = {
+            'none': None,
+            'bool': [True, False],
+            'int': [0, 1, -1, 127, 128, 1 << 62, -(1 << 63)],
+            'long': [1 << 64, -(1 << 70)],
+            'float': [0.0, 1.5, -2.25],
+            'str': ['', 'foobar', u'\u00e9t\u00e9'],
+            'list': [[], [1, [2, [3]]]],
+            'dict': {'a': {'b': {'c': 'd'}}, 'e': {}},
+            1: 'non string key'
+        }
+
+        for compress in [False, True]:
+            self.assertEqual(snapshot_util.decode(snapshot_util.encode(value, compress)), value)
+
+    def test_encode_tuple_as_list(self):
+        data = snapshot_util.encode({'a': (1, 2)})
+        self.assertDictEqual(snapshot_util.decode(data), {'a': [1, 2]})
+
+    def test_interned_strings(self):
+        value = [{'id': 'task%s' % (i % 3), 'status': 'succeeded'} for i in range(0, 100)]
+        data = snapshot_util.encode(value)
+
+        self.assertEqual(data.count(b'succeeded'), 1)
+        self.assertEqual(data.count(b'task0'), 1)
+        self.assertListEqual(snapshot_util.decode(data), value)
+
+    def test_compression(self):
+        value = {'data': 'foobar' * 1000}
+        self.assertLess(
+            len(snapshot_util.encode(value, compress=True)),
+            len(snapshot_util.encode(value))
+        )
+
+    def test_header(self):
+        data = snapshot_util.encode('foobar', compress=True)
+        magic, version, flags, size = snapshot_util.SNAPSHOT_HEADER.unpack_from(data)
+
+        self.assertEqual(magic, snapshot_util.SNAPSHOT_MAGIC)
+        self.assertEqual(version, snapshot_util.SNAPSHOT_VERSION)
+        self.assertEqual(flags, snapshot_util.FLAG_COMPRESSED)
+        self.assertEqual(size, len(data) - snapshot_util.SNAPSHOT_HEADER.size)
+
+    def test_unsupported_type(self):
+        self.assertRaises(TypeError, snapshot_util.encode, {'a': object()})
+
+    def test_decode_invalid_data(self):
+        data = snapshot_util.encode({'a': 'foobar'})
+
+        self.assertRaises(ValueError, snapshot_util.decode, b'')
+        self.assertRaises(ValueError, snapshot_util.decode, b'JSON' + data[4:])
+        self.assertRaises(ValueError, snapshot_util.decode, data[:-1])
+        self.assertRaises(ValueError, snapshot_util.decode, data + b'N')
+
+        header = struct.pack('>4sBBI', b'ORQS', 99, 0, 1)
+        self.assertRaises(ValueError, snapshot_util.decode, header + b'N')
+
+        # The length of the payload is valid but the payload is truncated.
+        header = struct.pack('>4sBBI', b'ORQS', 1, 0, 2)
+        self.assertRaises(ValueError, snapshot_util.decode, header + b'\x00i')
+
+        # The payload has a type tag that is not known.
+        header = struct.pack('>4sBBI', b'ORQS', 1, 0, 2)
+        self.assertRaises(ValueError, snapshot_util.decode, header + b'\x00X')
@@ -0,0 +1,103 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import unittest
+
+from orquesta.utils import views as view_util
+
+
+DATA = {
+    'k1': '123',
+    'k2': ['abc', {'k21': True}],
+    'k3': {
+        'k31': True,
+        'k32': 1.0
+    }
+}
+
+
+class ViewUtilsTest(unittest.TestCase):
+
+    def test_freeze(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+
+        self.assertIsInstance(view, view_util.DictView)
+        self.assertIsInstance(view['k2'], view_util.ListView)
+        self.assertIsInstance(view['k2'][1], view_util.DictView)
+        self.assertIsInstance(view['k3'], view_util.DictView)
+        self.assertIs(view_util.freeze(view), view)
+        self.assertEqual(view_util.freeze('abc'), 'abc')
+
+    def test_view_equality(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+
+        self.assertEqual(view, DATA)
+        self.assertEqual(DATA, view)
+        self.assertDictEqual({'v': view}, {'v': DATA})
+        self.assertEqual(view['k2'], DATA['k2'])
+        self.assertNotEqual(view, {})
+        self.assertEqual(len(view), 3)
+        self.assertIn('k1', view)
+        self.assertListEqual(sorted(view.keys()), ['k1', 'k2', 'k3'])
+
+    def test_view_is_live(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+
+        data['k3']['k33'] = 'foo'
+        data['k2'].append('def')
+
+        self.assertEqual(view['k3']['k33'], 'foo')
+        self.assertEqual(view['k2'][-1], 'def')
+        self.assertEqual(len(view['k2']), 3)
+
+    def test_view_is_read_only(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+
+        def assign():
+            view['k1'] = 'abc'
+
+        def delete():
+            del view['k3']['k31']
+
+        def assign_item():
+            view['k2'][0] = 'def'
+
+        self.assertRaises(TypeError, assign)
+        self.assertRaises(TypeError, delete)
+        self.assertRaises(TypeError, assign_item)
+        self.assertDictEqual(data, DATA)
+
+    def test_view_copy(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+
+        self.assertIs(copy.copy(view), view)
+        self.assertIs(copy.deepcopy(view), view)
+        self.assertIs(copy.deepcopy({'v': view})['v'], view)
+
+    def test_thaw(self):
+        data = copy.deepcopy(DATA)
+        view = view_util.freeze(data)
+        thawed = view_util.thaw(view)
+
+        self.assertIsInstance(thawed, dict)
+        self.assertDictEqual(thawed, DATA)
+
+        thawed['k3']['k31'] = False
+        self.assertTrue(data['k3']['k31'])
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import copy
 import logging
 
 
@@ -29,7 +28,9 @@ def set_current_task(context, task):
     if not isinstance(task, dict):
         raise TypeError('The task is not type of dict.')
 
-    ctx = copy.deepcopy(context) if context else dict()
+    # The context is copied shallowly. The values in the context
+    # are shared with the original context and are read only.
+    ctx = dict(context) if context else dict()
 
     ctx['__current_task'] = {
         'id': task.get('id'),
@@ -46,7 +47,7 @@ def set_current_item(context, item):
     if context and not isinstance(context, dict):
         raise TypeError('The context is not type of dict.')
 
-    ctx = copy.deepcopy(context) if context else dict()
+    ctx = dict(context) if context else dict()
     ctx['__current_item'] = item
 
     return ctx
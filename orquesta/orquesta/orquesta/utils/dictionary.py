@@ -15,12 +15,18 @@
 import six
 
 
-def merge_dicts(left, right, overwrite=True):
+def merge_dicts(left, right, overwrite=True, copy_on_write=False):
     if left is None:
-        return right
+        return dict(right) if copy_on_write and right is not None else right
 
     if right is None:
-        return left
+        return dict(left) if copy_on_write else left
+
+    # If copy on write, the left dict is not modified. Instead, a shallow copy of the left dict
+    # is returned and only the nested dicts that are merged are copied. All other values are
+    # shared with the left and right dicts and are expected to be treated as read only.
+    if copy_on_write:
+        left = dict(left)
 
     for k, v in six.iteritems(right):
         if k not in left:
@@ -29,7 +35,7 @@ def merge_dicts(left, right, overwrite=True):
             left_v = left[k]
 
             if isinstance(left_v, dict) and isinstance(v, dict):
-                merge_dicts(left_v, v, overwrite=overwrite)
+                left[k] = merge_dicts(left_v, v, overwrite=overwrite, copy_on_write=copy_on_write)
             elif overwrite:
                 left[k] = v
 
@@ -0,0 +1,318 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import struct
+import zlib
+
+import six
+
+
+LOG = logging.getLogger(__name__)
+
+
+# The snapshot starts with a fixed size header that identifies the format, the version
+# of the format, the flags, and the length of the payload that follows the header.
+SNAPSHOT_MAGIC = b'ORQS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('>4sBBI')
+
+FLAG_COMPRESSED = 1 << 0
+
+# Type tags for the values in the payload.
+TAG_NONE = b'N'
+TAG_TRUE = b'T'
+TAG_FALSE = b'F'
+TAG_INT = b'i'
+TAG_LONG = b'L'
+TAG_FLOAT = b'd'
+TAG_STR = b's'
+TAG_LIST = b'l'
+TAG_DICT = b'm'
+
+_TAG_NONE = ord(TAG_NONE)
+_TAG_TRUE = ord(TAG_TRUE)
+_TAG_FALSE = ord(TAG_FALSE)
+_TAG_INT = ord(TAG_INT)
+_TAG_LONG = ord(TAG_LONG)
+_TAG_FLOAT = ord(TAG_FLOAT)
+_TAG_STR = ord(TAG_STR)
+_TAG_LIST = ord(TAG_LIST)
+_TAG_DICT = ord(TAG_DICT)
+
+INT64 = struct.Struct('>q')
+FLOAT64 = struct.Struct('>d')
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def _encode_varint(value):
+    if value < 0x80:
+        return VARINTS[value]
+
+    data = bytearray()
+
+    while value > 0x7f:
+        data.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    data.append(value)
+
+    return bytes(data)
+
+
+# The varints for the small values such as string indices and lengths are precomputed.
+VARINTS = [struct.pack('>B', i) for i in range(0, 0x80)]
+
+
+def _decode_varint(data, pos):
+    value = 0
+    shift = 0
+
+    while True:
+        if pos >= len(data):
+            raise ValueError('The snapshot is truncated.')
+
+        byte = six.indexbytes(data, pos)
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            return value, pos
+
+
+class _Encoder(object):
+
+    def __init__(self):
+        self.chunks = []
+        self.strings = {}
+        self.encoders = {
+            type(None): self._encode_none,
+            bool: self._encode_bool,
+            float: self._encode_float,
+            dict: self._encode_dict,
+            list: self._encode_list,
+            tuple: self._encode_list
+        }
+
+        for str_type in six.string_types + (six.text_type, six.binary_type):
+            self.encoders[str_type] = self._encode_str
+
+        for int_type in six.integer_types:
+            self.encoders[int_type] = self._encode_int
+
+    def encode(self, value):
+        encoder = self.encoders.get(type(value))
+
+        # Look up the encoder from the base type if the value is a subclass of a known type.
+        if encoder is None:
+            for value_type, encoder in list(self.encoders.items()):
+                if isinstance(value, value_type) and value_type is not bool:
+                    break
+            else:
+                raise TypeError('The value of type "%s" is not supported.' % type(value).__name__)
+
+        encoder(value)
+
+    def _encode_none(self, value):
+        self.chunks.append(TAG_NONE)
+
+    def _encode_bool(self, value):
+        self.chunks.append(TAG_TRUE if value else TAG_FALSE)
+
+    def _encode_str(self, value):
+        if isinstance(value, six.binary_type):
+            value = value.decode('utf-8')
+
+        # The strings such as task ids, statuses, and keys are repeated throughout the
+        # snapshot so each distinct string is written once to the table of strings.
+        idx = self.strings.get(value)
+
+        if idx is None:
+            idx = len(self.strings)
+            self.strings[value] = idx
+
+        self.chunks.append(TAG_STR)
+        self.chunks.append(_encode_varint(idx))
+
+    def _encode_int(self, value):
+        if INT64_MIN <= value <= INT64_MAX:
+            self.chunks.append(TAG_INT)
+            self.chunks.append(INT64.pack(value))
+        else:
+            self.chunks.append(TAG_LONG)
+            self._encode_str(str(value))
+            self.chunks.pop(-2)
+
+    def _encode_float(self, value):
+        self.chunks.append(TAG_FLOAT)
+        self.chunks.append(FLOAT64.pack(value))
+
+    def _encode_dict(self, value):
+        self.chunks.append(TAG_DICT)
+        self.chunks.append(_encode_varint(len(value)))
+
+        for k, v in six.iteritems(value):
+            self.encode(k)
+            self.encode(v)
+
+    def _encode_list(self, value):
+        self.chunks.append(TAG_LIST)
+        self.chunks.append(_encode_varint(len(value)))
+
+        for v in value:
+            self.encode(v)
+
+    def get_payload(self):
+        strings = sorted(self.strings, key=self.strings.get)
+        chunks = [_encode_varint(len(strings))]
+
+        for value in strings:
+            data = value.encode('utf-8')
+            chunks.append(_encode_varint(len(data)))
+            chunks.append(data)
+
+        return b''.join(chunks + self.chunks)
+
+
+class _Decoder(object):
+
+    # The payload is decoded from a bytearray so indexing returns the byte as an integer in
+    # both python 2 and 3. The type tags are compared as integers for the same reason.
+
+    def __init__(self, data):
+        self.data = bytearray(data)
+        self.size = len(self.data)
+        self.pos = 0
+        self.strings = []
+
+    def _read(self, size):
+        if self.pos + size > self.size:
+            raise ValueError('The snapshot is truncated.')
+
+        data = self.data[self.pos:self.pos + size]
+        self.pos += size
+
+        return data
+
+    def _read_varint(self):
+        if self.pos >= self.size:
+            raise ValueError('The snapshot is truncated.')
+
+        # Most of the varints such as string indices and lengths are a single byte.
+        byte = self.data[self.pos]
+
+        if byte < 0x80:
+            self.pos += 1
+            return byte
+
+        value, self.pos = _decode_varint(self.data, self.pos)
+
+        return value
+
+    def decode_strings(self):
+        for _ in range(self._read_varint()):
+            size = self._read_varint()
+            self.strings.append(self._read(size).decode('utf-8'))
+
+    def decode(self):
+        if self.pos >= self.size:
+            raise ValueError('The snapshot is truncated.')
+
+        tag = self.data[self.pos]
+        self.pos += 1
+
+        if tag == _TAG_STR:
+            return self.strings[self._read_varint()]
+
+        if tag == _TAG_DICT:
+            value = {}
+
+            for _ in range(self._read_varint()):
+                k = self.decode()
+                value[k] = self.decode()
+
+            return value
+
+        if tag == _TAG_LIST:
+            return [self.decode() for _ in range(self._read_varint())]
+
+        if tag == _TAG_INT:
+            return INT64.unpack(self._read(INT64.size))[0]
+
+        if tag == _TAG_NONE:
+            return None
+
+        if tag == _TAG_TRUE:
+            return True
+
+        if tag == _TAG_FALSE:
+            return False
+
+        if tag == _TAG_FLOAT:
+            return FLOAT64.unpack(self._read(FLOAT64.size))[0]
+
+        if tag == _TAG_LONG:
+            return int(self.strings[self._read_varint()])
+
+        raise ValueError('The snapshot has an unknown type tag "%s".' % chr(tag))
+
+
+def encode(value, compress=False):
+    encoder = _Encoder()
+    encoder.encode(value)
+    payload = encoder.get_payload()
+    flags = 0
+
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= FLAG_COMPRESSED
+
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, flags, len(payload))
+
+    return header + payload
+
+
+def decode(data):
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise ValueError('The snapshot is truncated.')
+
+    magic, version, flags, size = SNAPSHOT_HEADER.unpack_from(data)
+
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError('The data is not a workflow snapshot.')
+
+    if version != SNAPSHOT_VERSION:
+        raise ValueError('The snapshot version %s is not supported.' % version)
+
+    payload = data[SNAPSHOT_HEADER.size:]
+
+    if len(payload) < size:
+        raise ValueError('The snapshot is truncated.')
+
+    if len(payload) > size:
+        raise ValueError('The snapshot has unexpected data after the payload.')
+
+    if flags & FLAG_COMPRESSED:
+        payload = zlib.decompress(payload)
+
+    decoder = _Decoder(payload)
+    decoder.decode_strings()
+    value = decoder.decode()
+
+    if decoder.pos != len(payload):
+        raise ValueError('The snapshot has unexpected data after the value.')
+
+    return value
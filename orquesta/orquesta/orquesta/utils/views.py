@@ -0,0 +1,125 @@
+# Copyright 2019 Extreme Networks, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+
+try:
+    from collections import abc as collections_abc
+except ImportError:
+    import collections as collections_abc
+
+
+LOG = logging.getLogger(__name__)
+
+
+def freeze(value):
+    if isinstance(value, (DictView, ListView)):
+        return value
+
+    if isinstance(value, dict):
+        return DictView(value)
+
+    if isinstance(value, list):
+        return ListView(value)
+
+    return value
+
+
+def thaw(value):
+    if isinstance(value, (DictView, ListView)):
+        return copy.deepcopy(value._data)
+
+    return copy.deepcopy(value)
+
+
+def _unwrap(value):
+    return value._data if isinstance(value, (DictView, ListView)) else value
+
+
+class DictView(collections_abc.Mapping):
+    # The view is a read only proxy to the underlying dict. The values are not copied and
+    # changes made to the underlying dict are visible thru the view. Since the view cannot
+    # be modified, copy and deepcopy return the same view instead of copying the data.
+
+    def __init__(self, data):
+        if not isinstance(data, dict):
+            raise TypeError('The data is not type of dict.')
+
+        self._data = data
+
+    def __getitem__(self, key):
+        return freeze(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __eq__(self, other):
+        return self._data == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class ListView(collections_abc.Sequence):
+
+    def __init__(self, data):
+        if not isinstance(data, list):
+            raise TypeError('The data is not type of list.')
+
+        self._data = data
+
+    def __getitem__(self, index):
+        return freeze(self._data[index])
+
+    def __iter__(self):
+        for value in self._data:
+            yield freeze(value)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return self._data == _unwrap(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
@@ -70,6 +70,11 @@ setup(
             'mistral = orquesta.composers.mistral:WorkflowComposer',
             'mock = orquesta.composers.mock:WorkflowComposer'
         ],
+        'orquesta.results': [
+            'memory = orquesta.results.memory:ResultStore',
+            'filesystem = orquesta.results.filesystem:ResultStore',
+            'sqlite = orquesta.results.sqlite:ResultStore'
+        ],
         'orquesta.expressions.evaluators': [
             'yaql = orquesta.expressions.yql:YAQLEvaluator',
             'jinja = orquesta.expressions.jinja:JinjaEvaluator'